@@ -0,0 +1,175 @@
+"""
+Event Dedupe - Findet Near-Duplicates im Event-Archiv
+
+Dasselbe Konzert kommt oft mehrfach an (Telegram, OCR, Instagram, Facebook,
+Venue-Scraper). Statt alle Paare zu vergleichen (O(n²)) werden Kandidaten
+über Blocking-Keys gebildet:
+
+1. Datum + normalisierte Venue
+2. Datum + MinHash-LSH-Band der Titel-Trigramme (fängt abweichende
+   Venue-Schreibweisen ab)
+
+Nur Paare innerhalb eines Blocks werden per Trigramm-Jaccard verglichen.
+"""
+
+import random
+import re
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+from cli.event_index import normalize_date
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_HASH_MASK = (1 << 61) - 1
+
+
+def normalize_text(value: Any) -> str:
+    """Lowercase, strip accents and punctuation for fuzzy comparison."""
+    if not isinstance(value, str):
+        return ""
+    value = value.lower().replace("ß", "ss")
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value)
+        value = "".join(c for c in value if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", value).strip()
+
+
+def event_venue(event: Dict[str, Any]) -> str:
+    """Normalized venue name from 'venue' or the frontmatter location."""
+    venue = event.get("venue")
+    if not venue:
+        location = event.get("location")
+        venue = location.get("name") if isinstance(location, dict) else location
+    return normalize_text(venue)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a normalized string."""
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class DuplicateFinder:
+    """Find near-duplicate events with blocking and MinHash LSH."""
+
+    def __init__(
+        self, threshold: float = 0.6, bands: int = 8, rows: int = 2, seed: int = 1
+    ):
+        """
+        Args:
+            threshold: Minimum title trigram Jaccard similarity
+            bands: Number of LSH bands per date
+            rows: MinHash values per band
+            seed: Seed for the MinHash permutation
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        self._perm = (rng.randrange(1, _HASH_MASK) | 1, rng.randrange(0, _HASH_MASK))
+        # Distinct trigrams are few, so their hashes are computed once
+        self._shingle_hashes: Dict[str, int] = {}
+
+    def _signature(self, shingles: FrozenSet[str]) -> Tuple[int, ...]:
+        """
+        One-permutation MinHash signature of a shingle set.
+
+        Each shingle is hashed once and assigned to one of bands * rows bins;
+        the signature is the minimum per bin. This costs O(shingles) instead
+        of O(shingles * permutations) for classic MinHash.
+        """
+        a, b = self._perm
+        bins = self.bands * self.rows
+        cache = self._shingle_hashes
+        signature = [_HASH_MASK] * bins
+        for shingle in shingles:
+            value = cache.get(shingle)
+            if value is None:
+                value = (a * zlib.crc32(shingle.encode("utf-8")) + b) & _HASH_MASK
+                cache[shingle] = value
+            slot = value % bins
+            if value < signature[slot]:
+                signature[slot] = value
+        return tuple(signature)
+
+    def find(
+        self, events: Iterable[Tuple[Path, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find duplicate candidates.
+
+        Events without a parseable date cannot be blocked and are skipped.
+
+        Returns:
+            List of {"base", "updates", "similarity"} dicts. base is the
+            more complete event, so each entry can be fed to merge_events.
+        """
+        records = []
+        blocks: Dict[Tuple, List[int]] = {}
+
+        for filepath, event in events:
+            day = normalize_date(event.get("date"))
+            if not day:
+                continue
+
+            shingles = trigrams(normalize_text(event.get("title")))
+            if not shingles:
+                continue
+            completeness = sum(1 for value in event.values() if value)
+            record_id = len(records)
+            records.append((filepath, shingles, completeness))
+
+            venue = event_venue(event)
+            if venue:
+                blocks.setdefault((day, "venue", venue), []).append(record_id)
+
+            signature = self._signature(shingles)
+            for band in range(self.bands):
+                rows = signature[band * self.rows : (band + 1) * self.rows]
+                # Empty bins carry no information and would block everything
+                if _HASH_MASK not in rows:
+                    blocks.setdefault((day, band, rows), []).append(record_id)
+
+        seen = set()
+        candidates = []
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            for i, left in enumerate(members):
+                for right in members[i + 1 :]:
+                    if (left, right) in seen:
+                        continue
+                    seen.add((left, right))
+
+                    similarity = jaccard(records[left][1], records[right][1])
+                    if similarity >= self.threshold:
+                        candidates.append(
+                            self._candidate(records, left, right, similarity)
+                        )
+
+        candidates.sort(key=lambda c: (-c["similarity"], str(c["base"])))
+        return candidates
+
+    @staticmethod
+    def _candidate(
+        records: List[Tuple], left: int, right: int, similarity: float
+    ) -> Dict[str, Any]:
+        """Order a pair so that the more complete event is the merge base."""
+        base, updates = records[left], records[right]
+        if updates[2] > base[2]:
+            base, updates = updates, base
+        return {
+            "base": base[0],
+            "updates": updates[0],
+            "similarity": round(similarity, 3),
+        }
@@ -0,0 +1,304 @@
+"""
+Event Export - Events als iCalendar, CSV, NDJSON oder GeoJSON ausgeben
+
+Die Writer bekommen Events einzeln und schreiben sie sofort in den
+Ausgabe-Stream; der Speicherbedarf hängt also nicht von der Archivgröße ab.
+Partner können den Kalender damit direkt aus `_events` beziehen, ohne den
+Jekyll-Build abzuwarten.
+"""
+
+import csv
+import re
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from cli.event_model import json_dumps
+from cli.event_query import get_field
+from cli.event_timings import phase
+
+# Standardspalten für CSV und GeoJSON-Properties
+DEFAULT_FIELDS = [
+    "title",
+    "date",
+    "end_date",
+    "venue",
+    "location.name",
+    "location.city",
+    "price",
+    "genre",
+    "url",
+    "status",
+]
+
+_DATE_TIME = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})(?:[ T](\d{2}):(\d{2})(?::(\d{2}))?)?"
+)
+_ICS_SPECIAL = re.compile(r"([\\;,])")
+
+
+def _ics_escape(value: Any) -> str:
+    """Escape a TEXT value (RFC 5545, 3.3.11)."""
+    text = _ICS_SPECIAL.sub(r"\\\1", str(value))
+    return text.replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """Fold a content line into chunks of at most 75 octets."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # Do not split inside a UTF-8 sequence
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def ics_datetime(value: Any) -> Optional[Tuple[str, bool]]:
+    """
+    Convert an event date to an iCalendar value.
+
+    Returns:
+        (value, all_day), e.g. ("20251201T200000", False) or
+        ("20251201", True); None if the date is not readable
+    """
+    if isinstance(value, datetime):
+        return value.strftime("%Y%m%dT%H%M%S"), False
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d"), True
+    if not isinstance(value, str):
+        return None
+
+    match = _DATE_TIME.match(value.strip())
+    if not match:
+        return None
+    year, month, day, hour, minute, second = match.groups()
+    if hour is None:
+        return f"{year}{month}{day}", True
+    return f"{year}{month}{day}T{hour}{minute}{second or '00'}", False
+
+
+def location_text(location: Any) -> str:
+    """One-line location ("Name, Straße, PLZ Stadt") from a dict or string."""
+    if not isinstance(location, dict):
+        return str(location or "")
+    city = " ".join(
+        str(location[key]) for key in ("postal_code", "city") if location.get(key)
+    )
+    parts = [location.get("name"), location.get("address"), city]
+    return ", ".join(str(part) for part in parts if part)
+
+
+def coordinates(event: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """(lat, lng) of an event, or None if missing or not numeric."""
+    coords = event.get("coordinates")
+    if not isinstance(coords, dict):
+        return None
+    try:
+        return float(coords["lat"]), float(coords["lng"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _text(value: Any) -> Any:
+    """Flatten values that have no native CSV representation."""
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json_dumps(value, indent=False)
+    return value
+
+
+class ExportWriter(ABC):
+    """
+    Base class for streaming writers.
+
+    write() returns False for events the format cannot represent (e.g. no
+    date for iCalendar); they are counted as skipped.
+    """
+
+    def __init__(self, out: TextIO, fields: Optional[List[str]] = None):
+        self.out = out
+        self.fields = fields
+
+    def start(self):
+        """Write the document header."""
+
+    @abstractmethod
+    def write(self, path: Path, event: Dict[str, Any]) -> bool:
+        """Write one event; False if the format cannot represent it."""
+
+    def finish(self):
+        """Write the document footer."""
+
+
+class IcsWriter(ExportWriter):
+    """iCalendar (RFC 5545) with one VEVENT per event."""
+
+    def __init__(self, out, fields=None, name: str = "krawl.foundation"):
+        super().__init__(out, fields)
+        self.name = name
+        self.stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    def _line(self, name: str, value: str):
+        self.out.write(_ics_fold(f"{name}:{value}"))
+
+    def start(self):
+        self._line("BEGIN", "VCALENDAR")
+        self._line("VERSION", "2.0")
+        self._line("PRODID", "-//krawl.foundation//Event Export//DE")
+        self._line("CALSCALE", "GREGORIAN")
+        self._line("X-WR-CALNAME", _ics_escape(self.name))
+        self._line("X-WR-TIMEZONE", "Europe/Berlin")
+
+    def write(self, path, event):
+        start = ics_datetime(event.get("date"))
+        if start is None or not event.get("title"):
+            return False
+
+        uid = event.get("id") or path.stem
+        self._line("BEGIN", "VEVENT")
+        self._line("UID", _ics_escape(f"{uid}@krawl.foundation"))
+        self._line("DTSTAMP", self.stamp)
+        value, all_day = start
+        self._line("DTSTART;VALUE=DATE" if all_day else "DTSTART", value)
+        end = ics_datetime(event.get("end_date"))
+        # Same-format values compare like dates; an end before the start is dropped
+        if end is not None and end[1] == all_day and end[0] >= value:
+            if all_day:
+                # end_date is inclusive, an all-day DTEND is exclusive
+                try:
+                    last = datetime.strptime(end[0], "%Y%m%d")
+                except ValueError:
+                    pass
+                else:
+                    after = last + timedelta(days=1)
+                    self._line("DTEND;VALUE=DATE", after.strftime("%Y%m%d"))
+            else:
+                self._line("DTEND", end[0])
+        self._line("SUMMARY", _ics_escape(event["title"]))
+
+        location = location_text(event.get("location")) or event.get("venue")
+        if location:
+            self._line("LOCATION", _ics_escape(location))
+        coords = coordinates(event)
+        if coords is not None:
+            self._line("GEO", f"{coords[0]};{coords[1]}")
+        description = event.get("description") or event.get("content")
+        if description:
+            self._line("DESCRIPTION", _ics_escape(str(description).strip()))
+        if event.get("url"):
+            self._line("URL", str(event["url"]))
+        categories = event.get("categories") or event.get("genre")
+        if categories:
+            if not isinstance(categories, list):
+                categories = [categories]
+            self._line("CATEGORIES", ",".join(_ics_escape(c) for c in categories))
+        if event.get("cancelled"):
+            self._line("STATUS", "CANCELLED")
+        self._line("END", "VEVENT")
+        return True
+
+    def finish(self):
+        self._line("END", "VCALENDAR")
+
+
+class CsvWriter(ExportWriter):
+    """CSV with a header row; nested fields are addressed as location.city."""
+
+    def start(self):
+        self.fields = self.fields or DEFAULT_FIELDS
+        self._writer = csv.writer(self.out)
+        self._writer.writerow(self.fields)
+
+    def write(self, path, event):
+        self._writer.writerow(
+            [_text(get_field(event, field, "")) for field in self.fields]
+        )
+        return True
+
+
+class NdjsonWriter(ExportWriter):
+    """One JSON object per line, the whole event or the selected fields."""
+
+    def write(self, path, event):
+        if self.fields:
+            event = {field: get_field(event, field) for field in self.fields}
+        self.out.write(json_dumps(event, indent=False) + "\n")
+        return True
+
+
+class GeoJsonWriter(ExportWriter):
+    """GeoJSON FeatureCollection of all events with coordinates."""
+
+    def start(self):
+        self.fields = self.fields or DEFAULT_FIELDS
+        self.out.write('{"type":"FeatureCollection","features":[')
+        self._count = 0
+
+    def write(self, path, event):
+        coords = coordinates(event)
+        if coords is None:
+            return False
+        lat, lng = coords
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lng, lat]},
+            "properties": {field: get_field(event, field) for field in self.fields},
+        }
+        self.out.write(("," if self._count else "") + "\n")
+        self.out.write(json_dumps(feature, indent=False))
+        self._count += 1
+        return True
+
+    def finish(self):
+        self.out.write("\n]}\n")
+
+
+WRITERS = {
+    "ics": IcsWriter,
+    "csv": CsvWriter,
+    "ndjson": NdjsonWriter,
+    "geojson": GeoJsonWriter,
+}
+
+
+def export_events(
+    events: Iterable[Tuple[Path, Dict[str, Any]]],
+    out: TextIO,
+    format: str,
+    fields: Optional[List[str]] = None,
+    **options: Any,
+) -> Tuple[int, int]:
+    """
+    Stream events into one of the export formats.
+
+    Args:
+        events: (path, event) pairs, e.g. from EventManager.iter_events
+        out: Text stream to write to
+        format: ics, csv, ndjson or geojson
+        fields: Columns/properties (CSV, NDJSON, GeoJSON)
+        **options: Format specific writer options (ics: name)
+
+    Returns:
+        (exported, skipped) event counts
+    """
+    writer = WRITERS[format](out, fields, **options)
+    exported = skipped = 0
+    writer.start()
+    for path, event in events:
+        with phase("write"):
+            written = writer.write(path, event)
+        if written:
+            exported += 1
+        else:
+            skipped += 1
+    writer.finish()
+    return exported, skipped
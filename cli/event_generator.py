@@ -0,0 +1,204 @@
+"""
+Event Generator - Synthetische Test-Events und Lasttest-Korpora
+
+Erzeugt realistische Events (verschachtelte location/coordinates, deutsche
+Orte) als JSON oder Markdown-Frontmatter. Faker-Instanzen werden
+wiederverwendet statt pro Event neu gebaut; große Korpora werden in festen
+Blöcken über Worker-Prozesse verteilt.
+
+Mit Seed ist die Ausgabe reproduzierbar: Jeder Block bekommt einen aus Seed
+und Blocknummer abgeleiteten eigenen Seed, das Ergebnis hängt also nicht von
+der Anzahl der Worker ab.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Fester Bezugstag für Datumsangaben, wenn mit Seed generiert wird
+DEFAULT_BASE_DATE = date(2026, 1, 1)
+
+GENRES = ["Rock", "Pop", "Jazz", "Electronic", "Hip-Hop", "Punk", "Klassik"]
+FORMATS = {"json": ".json", "markdown": ".md"}
+
+
+class EventGenerator:
+    """Generate test events from a single, optionally seeded Faker instance."""
+
+    def __init__(self, seed: Optional[int] = None, base_date: Optional[date] = None):
+        """
+        Args:
+            seed: Seed for reproducible output (None = random)
+            base_date: Day event dates are relative to. Defaults to
+                DEFAULT_BASE_DATE with a seed and to today without.
+        """
+        from faker import Faker
+
+        self.fake = Faker("de_DE")
+        self.seeded = seed is not None
+        if self.seeded:
+            self.fake.seed_instance(seed)
+        if base_date is None:
+            base_date = DEFAULT_BASE_DATE if self.seeded else date.today()
+        self.base_date = base_date
+
+    def _start(self, max_days: int) -> datetime:
+        """Random evening start within max_days after the base date."""
+        fake = self.fake
+        day = self.base_date + timedelta(days=fake.random_int(min=1, max=max_days))
+        return datetime.combine(day, time(fake.random_int(min=18, max=22)))
+
+    def _place(self) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Venue location and matching coordinates of a real German town."""
+        fake = self.fake
+        lat, lng, city, _, _ = fake.local_latlng(country_code="DE")
+        location = {
+            "name": fake.company(),
+            "address": fake.street_address(),
+            "city": city,
+            "postal_code": fake.postcode(),
+        }
+        coordinates = {
+            "lat": round(float(lat) + fake.random.uniform(-0.02, 0.02), 4),
+            "lng": round(float(lng) + fake.random.uniform(-0.02, 0.02), 4),
+        }
+        return location, coordinates
+
+    def _created(self) -> str:
+        """Creation timestamp, fixed for seeded runs."""
+        if self.seeded:
+            return datetime.combine(self.base_date, time()).isoformat()
+        return datetime.now().isoformat()
+
+    def event(self, event_type: str = "concert") -> Dict[str, Any]:
+        """Generate event data in the JSON draft layout."""
+        return self._event(event_type)[0]
+
+    def _event(self, event_type: str) -> Tuple[Dict[str, Any], datetime]:
+        """Generate event data and its start time."""
+        fake = self.fake
+        location, coordinates = self._place()
+        start = self._start(90)
+
+        event = {
+            "title": fake.catch_phrase(),
+            "date": start.date().isoformat(),
+            "venue": location["name"],
+            "location": location,
+            "coordinates": coordinates,
+            "description": fake.text(max_nb_chars=200),
+        }
+        if event_type == "exhibition":
+            end = start + timedelta(days=fake.random_int(min=7, max=30))
+            event["end_date"] = end.date().isoformat()
+            event["artists"] = [
+                fake.name() for _ in range(fake.random_int(min=1, max=3))
+            ]
+            event["free_entry"] = fake.boolean()
+        else:
+            event["title"] = f"{fake.name()} - {event['title']}"
+            event["price"] = f"{fake.random_int(min=5, max=50)}€"
+            event["genre"] = fake.random_element(GENRES)
+
+        event["url"] = fake.url()
+        event["status"] = "draft"
+        event["id"] = fake.uuid4()
+        event["created"] = self._created()
+        return event, start
+
+    def frontmatter_event(self, event_type: str = "concert") -> Dict[str, Any]:
+        """Generate event data in the Jekyll frontmatter layout of _events/."""
+        event, start = self._event(event_type)
+
+        frontmatter = {
+            "layout": "event",
+            "title": event["title"],
+            "date": start.strftime("%Y-%m-%d %H:%M"),
+            "published": False,
+            "categories": [event_type, event.get("genre", "kunst").lower()],
+            "location": event["location"],
+            "coordinates": event["coordinates"],
+            "organizer": self.fake.company(),
+            "url": event["url"],
+            "source": "generated",
+            "id": event["id"],
+        }
+        if "end_date" in event:
+            frontmatter["end_date"] = f"{event['end_date']} 18:00"
+        if "price" in event:
+            frontmatter["price"] = event["price"]
+        frontmatter["content"] = event["description"] + "\n"
+        return frontmatter
+
+    def generate(self, event_type: str = "concert", format: str = "json"):
+        """Generate one event in the given output format."""
+        if format == "markdown":
+            return self.frontmatter_event(event_type)
+        return self.event(event_type)
+
+
+def generate_corpus(
+    output_dir: Path,
+    count: int,
+    event_type: str = "concert",
+    format: str = "json",
+    seed: Optional[int] = None,
+    base_date: Optional[date] = None,
+    workers: int = 1,
+    sharded: bool = False,
+    chunksize: int = 1000,
+) -> Iterator[List[Tuple[Path, str]]]:
+    """
+    Write count generated events to output_dir.
+
+    Events are generated in blocks of chunksize; each block seeds its own
+    Faker instance from (seed, block number) and writes its files directly,
+    so only file names travel back from the worker processes.
+
+    Yields:
+        Per block, the list of (path, title) written, in order
+    """
+    chunks = [
+        (start, min(start + chunksize, count)) for start in range(0, count, chunksize)
+    ]
+    args = [
+        (output_dir, sharded, event_type, format, seed, base_date, number, start, stop)
+        for number, (start, stop) in enumerate(chunks)
+    ]
+
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk_args in args:
+            yield _generate_chunk(*chunk_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_generate_chunk, *zip(*args))
+
+
+def _generate_chunk(
+    output_dir: Path,
+    sharded: bool,
+    event_type: str,
+    format: str,
+    seed: Optional[int],
+    base_date: Optional[date],
+    number: int,
+    start: int,
+    stop: int,
+) -> List[Tuple[Path, str]]:
+    """Process pool worker for generate_corpus."""
+    from cli.event_scraper import EventManager
+
+    manager = EventManager(output_dir, sharded=sharded)
+    chunk_seed = None if seed is None else seed * 1_000_003 + number
+    generator = EventGenerator(seed=chunk_seed, base_date=base_date)
+    suffix = FORMATS[format]
+
+    written = []
+    for i in range(start, stop):
+        event = generator.generate(event_type, format)
+        filepath = manager.event_path(event, f"test-{event_type}-{i+1:03d}{suffix}")
+        manager.save_event(event, filepath, format=format)
+        written.append((filepath, event["title"]))
+    return written
@@ -0,0 +1,311 @@
+"""
+Event Import - Venue-Exporte (CSV, iCalendar, JSON/NDJSON) einlesen
+
+Alle Formate werden zeilen- bzw. objektweise gelesen, nie die ganze Datei
+auf einmal: auch Exporte mit vielen tausend Events brauchen konstant wenig
+Speicher. Jeder Datensatz läuft durch BaseScraper.normalize_event, importierte
+Events sehen also genauso aus wie gescrapte.
+"""
+
+import csv
+import json
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from cli.event_model import json_loads
+from cli.scrapers.base import BaseScraper
+
+FORMATS = {
+    ".csv": "csv",
+    ".ics": "ics",
+    ".ical": "ics",
+    ".json": "json",
+    ".ndjson": "json",
+    ".jsonl": "json",
+}
+
+# Spaltennamen aus Venue-/Facebook-Exporten -> Event-Felder
+CSV_COLUMNS = {
+    "title": "title",
+    "titel": "title",
+    "name": "title",
+    "event": "title",
+    "veranstaltung": "title",
+    "summary": "title",
+    "date": "date",
+    "datum": "date",
+    "start": "date",
+    "start_date": "date",
+    "start_time": "date",
+    "beginn": "date",
+    "end_date": "end_date",
+    "end": "end_date",
+    "ende": "end_date",
+    "end_time": "end_date",
+    "venue": "venue",
+    "spielort": "venue",
+    "location": "location",
+    "ort": "location",
+    "adresse": "location",
+    "address": "location",
+    "description": "description",
+    "beschreibung": "description",
+    "details": "description",
+    "text": "description",
+    "price": "price",
+    "preis": "price",
+    "eintritt": "price",
+    "url": "url",
+    "link": "url",
+    "website": "url",
+    "genre": "genre",
+    "kategorie": "genre",
+    "category": "genre",
+    "image": "image_url",
+    "image_url": "image_url",
+    "bild": "image_url",
+}
+
+ICS_PROPERTIES = {
+    "SUMMARY": "title",
+    "DTSTART": "date",
+    "DTEND": "end_date",
+    "LOCATION": "location",
+    "DESCRIPTION": "description",
+    "URL": "url",
+    "CATEGORIES": "genre",
+}
+
+_ICS_DATE = re.compile(r"^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})?)?Z?$")
+_ICS_ESCAPES = re.compile(r"\\([\\;,nN])")
+
+
+class ImportFileError(ValueError):
+    """Raised for unreadable or unsupported import files."""
+
+
+def detect_format(path: Path) -> str:
+    """Import format from the file suffix."""
+    fmt = FORMATS.get(path.suffix.lower())
+    if fmt is None:
+        raise ImportFileError(
+            f"Unbekanntes Format: {path.name} (csv, ics, json, ndjson)"
+        )
+    return fmt
+
+
+def iter_csv(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield raw events from a CSV export (delimiter is sniffed, ',' or ';')."""
+    sample = f.read(4096)
+    f.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+
+    reader = csv.reader(f, dialect)
+    header = next(reader, None)
+    if header is None:
+        return
+    fields = [CSV_COLUMNS.get(name.strip().lower()) for name in header]
+
+    for row in reader:
+        raw = {}
+        for field, value in zip(fields, row):
+            if field and value and field not in raw:
+                raw[field] = value
+        if raw:
+            yield raw
+
+
+def _ics_value(name: str, value: str) -> str:
+    """Decode an iCalendar property value."""
+    if name in ("DTSTART", "DTEND"):
+        match = _ICS_DATE.match(value.strip())
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            if hour is None:
+                if name == "DTEND":
+                    # An all-day DTEND is exclusive, end_date is inclusive
+                    try:
+                        last = date(int(year), int(month), int(day)) - timedelta(1)
+                    except ValueError:
+                        pass  # left to the date validation
+                    else:
+                        return last.isoformat()
+                return f"{year}-{month}-{day}"
+            return f"{year}-{month}-{day} {hour}:{minute}:{second or '00'}"
+        return value
+    return _ICS_ESCAPES.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def iter_ics(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """Yield raw events from the VEVENT blocks of an iCalendar file."""
+
+    def unfolded():
+        # RFC 5545: lines starting with a space or tab continue the previous one
+        pending = None
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line[:1] in (" ", "\t") and pending is not None:
+                pending += line[1:]
+                continue
+            if pending is not None:
+                yield pending
+            pending = line
+        if pending is not None:
+            yield pending
+
+    event = None
+    for line in unfolded():
+        if line == "BEGIN:VEVENT":
+            event = {}
+        elif line == "END:VEVENT":
+            if event:
+                yield event
+            event = None
+        elif event is not None and ":" in line:
+            key, value = line.split(":", 1)
+            name = key.split(";", 1)[0].upper()
+            field = ICS_PROPERTIES.get(name)
+            if field and field not in event:
+                event[field] = _ics_value(name, value)
+
+
+def iter_json(f: TextIO, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """
+    Yield objects from a JSON array or NDJSON file.
+
+    Arrays are decoded element by element from a sliding buffer, so a
+    large array never has to fit into memory as a whole.
+    """
+    buffer = f.read(chunk_size)
+    start = len(buffer) - len(buffer.lstrip())
+
+    if buffer[start : start + 1] != "[":
+        # NDJSON: one object per line
+        f.seek(0)
+        for number, line in enumerate(f, start=1):
+            if line.strip():
+                try:
+                    yield json_loads(line)
+                except ValueError as e:
+                    raise ImportFileError(f"Zeile {number}: {e}") from e
+        return
+
+    decoder = json.JSONDecoder()
+    pos = start + 1
+    eof = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise ImportFileError("JSON-Array nicht abgeschlossen")
+            buffer, pos = f.read(chunk_size), 0
+            eof = not buffer
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ImportFileError(f"Ungültiges JSON: {e}") from e
+            more = f.read(chunk_size)
+            eof = not more
+            buffer, pos = buffer[pos:] + more, 0
+            continue
+        yield value
+        pos = end
+
+
+class FileImporter(BaseScraper):
+    """Import events from an exported file through the scraper normalization."""
+
+    def __init__(self, path: Path, venue_name: str = "", format: str = None):
+        """
+        Args:
+            path: CSV, iCalendar or JSON/NDJSON file
+            venue_name: Venue for rows without their own venue column
+            format: csv, ics or json (default: from the file suffix)
+        """
+        super().__init__(venue_name=venue_name)
+        self.path = path
+        self.format = format or detect_format(path)
+        self.skipped = 0
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Raw records from the file, streamed."""
+        readers = {"csv": iter_csv, "ics": iter_ics, "json": iter_json}
+        encoding = "utf-8-sig"  # Excel writes a BOM
+        newline = "" if self.format == "csv" else None
+        with open(self.path, "r", encoding=encoding, newline=newline) as f:
+            for record in readers[self.format](f):
+                if isinstance(record, dict):
+                    yield record
+                else:
+                    self.skipped += 1
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Normalized, valid events; invalid records are counted in skipped."""
+        today = date.today().isoformat()
+        for record in self.records():
+            event = self.normalize_event(record)
+            if not self.validate_event(event):
+                self.skipped += 1
+                continue
+            event["source"] = "ical" if self.format == "ics" else "import"
+            # Only real links from the feed; local paths stay out of the data
+            url = event.get("url") or ""
+            if url.startswith(("http://", "https://")):
+                event["source_url"] = url
+            event["source_file"] = self.path.name
+            event["import_date"] = today
+            yield event
+
+    def scrape(self):
+        """Import the whole file (prefer iter_events for large files)."""
+        return list(self.iter_events())
+
+
+def event_filename(event: Dict[str, Any], suffix: str = ".json") -> str:
+    """File name like YYYY-MM-DD-titel-slug.json."""
+    slug = re.sub(r"[^a-z0-9]+", "-", str(event.get("title", "event")).lower())
+    slug = slug.strip("-")[:50].rstrip("-") or "event"
+    return f"{event.get('date') or 'undatiert'}-{slug}{suffix}"
+
+
+def markdown_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Jekyll frontmatter event (unpublished draft) with the description as body."""
+    data = {
+        "layout": "event",
+        "title": event["title"],
+        "date": event["date"],
+        "published": False,
+    }
+    for key, value in event.items():
+        if key not in data and key != "description" and value not in ("", None):
+            data[key] = value
+    data["content"] = (event.get("description") or "") + "\n"
+    return data
+
+
+def unique_path(path: Path, taken: set, overwrite: bool = False) -> Optional[Path]:
+    """
+    Reserve a path not used in this run.
+
+    Two events with the same date and title in one file get -2, -3, ...
+    Files from earlier imports are kept: None is returned for them unless
+    overwrite is set, so re-importing an export is idempotent.
+    """
+    candidate, n = path, 1
+    while candidate in taken:
+        n += 1
+        candidate = path.with_name(f"{path.stem}-{n}{path.suffix}")
+    taken.add(candidate)
+    if candidate.exists() and not overwrite:
+        return None
+    return candidate
@@ -0,0 +1,227 @@
+"""
+Event Index - Persistenter SQLite-Index für _events
+
+Speichert pro Event-Datei das geparste Event plus mtime/size/hash und wird
+inkrementell aktualisiert: nur geänderte Dateien werden neu geparst.
+"""
+
+import hashlib
+import pickle
+import re
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_INDEX_PATH = Path(".cache/events.sqlite")
+
+SCHEMA_VERSION = "1"
+
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})")
+_GERMAN_DATE = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """Normalize an event date (date, datetime or string) to YYYY-MM-DD."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if not isinstance(value, str):
+        return None
+
+    value = value.strip()
+    match = _ISO_DATE.match(value)
+    if match:
+        year, month, day = match.groups()
+    else:
+        match = _GERMAN_DATE.match(value)
+        if not match:
+            return None
+        day, month, year = match.groups()
+
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+
+class EventIndex:
+    """Persistent SQLite index of parsed events with incremental refresh."""
+
+    def __init__(self, db_path: Path, events_dir: Path):
+        self.db_path = Path(db_path)
+        self.events_dir = Path(events_dir)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self._init_schema()
+
+    def _init_schema(self):
+        """Create tables, dropping stale data from other versions or trees."""
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                date TEXT,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_date ON events (date);
+            """)
+
+        expected = {
+            "schema_version": SCHEMA_VERSION,
+            "events_dir": str(self.events_dir.resolve()),
+        }
+        stored = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if stored != expected:
+            with self.conn:
+                self.conn.execute("DELETE FROM events")
+                self.conn.execute("DELETE FROM meta")
+                self.conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)", expected.items()
+                )
+
+    def _key(self, filepath: Path) -> str:
+        """Index key: path relative to the events directory."""
+        return filepath.relative_to(self.events_dir).as_posix()
+
+    def _path(self, key: str) -> Path:
+        return self.events_dir / key
+
+    def refresh(self, manager, workers: int = 1) -> Dict[str, int]:
+        """
+        Sync the index with the files on disk.
+
+        Files whose mtime and size are unchanged are skipped without being
+        read. Changed files are hashed first, so a touched but identical
+        file (e.g. after a git checkout) only gets its stat info updated.
+
+        Args:
+            manager: EventManager used to list and parse event files
+            workers: Number of processes for parsing changed files
+
+        Returns:
+            Counts of added, updated, touched, removed and unchanged files;
+            indexed files that no longer parse count as removed
+        """
+        stats = {"added": 0, "updated": 0, "touched": 0, "removed": 0, "unchanged": 0}
+        known = {
+            key: (mtime_ns, size, digest)
+            for key, mtime_ns, size, digest in self.conn.execute(
+                "SELECT path, mtime_ns, size, hash FROM events"
+            )
+        }
+
+        changed = {}
+        touches = []
+        for filepath in manager.list_events():
+            key = self._key(filepath)
+            st = filepath.stat()
+            row = known.pop(key, None)
+
+            if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+
+            digest = hashlib.sha1(filepath.read_bytes()).hexdigest()
+            if row and row[2] == digest:
+                touches.append((st.st_mtime_ns, st.st_size, key))
+                stats["touched"] += 1
+                continue
+
+            changed[filepath] = (key, st, digest, row is not None)
+
+        upserts = []
+        for filepath, event in manager.load_all(workers=workers, paths=changed):
+            key, st, digest, existed = changed.pop(filepath)
+            upserts.append(
+                (
+                    key,
+                    st.st_mtime_ns,
+                    st.st_size,
+                    digest,
+                    normalize_date(event.get("date")),
+                    pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL),
+                )
+            )
+            stats["updated" if existed else "added"] += 1
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO events (path, mtime_ns, size, hash, date, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                upserts,
+            )
+            self.conn.executemany(
+                "UPDATE events SET mtime_ns = ?, size = ? WHERE path = ?", touches
+            )
+            # Files left in changed no longer parse: drop their stale rows
+            removed = list(known) + [
+                key for key, _, _, existed in changed.values() if existed
+            ]
+            self.conn.executemany(
+                "DELETE FROM events WHERE path = ?", [(key,) for key in removed]
+            )
+        stats["removed"] = len(removed)
+
+        return stats
+
+    def get(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """Return the indexed event if the file is unchanged since indexing."""
+        try:
+            key = self._key(filepath)
+            st = filepath.stat()
+        except (ValueError, OSError):
+            return None
+
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, data FROM events WHERE path = ?", (key,)
+        ).fetchone()
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            return pickle.loads(row[2])
+        return None
+
+    def entries(self) -> List[Tuple[Path, int]]:
+        """List (path, size) of all indexed files, sorted by path."""
+        return [
+            (self._path(key), size)
+            for key, size in self.conn.execute(
+                "SELECT path, size FROM events ORDER BY path"
+            )
+        ]
+
+    def events(
+        self, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """
+        Yield (path, event) for indexed events, sorted by path.
+
+        Args:
+            date_from: Only events on or after this YYYY-MM-DD date
+            date_to: Only events on or before this YYYY-MM-DD date
+        """
+        sql = "SELECT path, data FROM events"
+        conditions, params = [], []
+        if date_from:
+            conditions.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("date <= ?")
+            params.append(date_to)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        for key, data in self.conn.execute(sql + " ORDER BY path", params):
+            yield self._path(key), pickle.loads(data)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,319 @@
+"""
+Event Model - Kompakte Event-Objekte und schnelle JSON-Serialisierung
+
+Event speichert bekannte Felder in __slots__ statt in einem eigenen dict pro
+Event; unbekannte Felder landen in `extra`. Die Reihenfolge der Felder wird
+als geteiltes Tupel ("Shape") gehalten, damit JSON- und Frontmatter-Dateien
+beim Zurückschreiben nicht umsortiert werden. Events mit gleichem Aufbau
+teilen sich dieses Tupel.
+
+JSON wird mit orjson gelesen und geschrieben, falls installiert, sonst mit
+der Standardbibliothek; Event-Dateien sind in beiden Fällen identisch. Nur
+Floats tiefer in der Struktur formatiert orjson anders (1e-5 statt 1e-05,
+null statt NaN).
+"""
+
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+FIELDS = (
+    "title",
+    "date",
+    "end_date",
+    "venue",
+    "location",
+    "coordinates",
+    "description",
+    "price",
+    "genre",
+    "categories",
+    "url",
+    "status",
+    "id",
+    "source",
+    "layout",
+    "published",
+    "created",
+    "content",
+)
+
+# Kurze, oft wiederholte Werte werden interniert (draft, Venue-Namen, ...)
+_INTERN_FIELDS = {"status", "venue", "genre", "source", "layout"}
+_INTERN_MAX = 64
+
+_KNOWN = frozenset(FIELDS)
+_SHAPES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _shape(keys) -> Tuple[str, ...]:
+    """Return the shared tuple for a key order."""
+    keys = tuple(keys)
+    return _SHAPES.setdefault(keys, keys)
+
+
+_orjson: Any = False  # not probed yet
+
+
+def _get_orjson():
+    """orjson if installed, imported on first use to keep CLI startup fast."""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson
+        except ImportError:  # optional dependency
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def _float_identical(value: Any) -> bool:
+    """Whether orjson formats value like json.dumps (False for NaN/infinity)."""
+    return type(value) is not float or value == 0 or 1e-4 <= abs(value) < 1e16
+
+
+def _orjson_identical(data: Any) -> bool:
+    """
+    Whether orjson writes data exactly like json.dumps.
+
+    The two only disagree on floats: orjson writes NaN and infinity as null
+    and formats exponents differently (1e16 vs 1e+16, 0.00001 vs 1e-05).
+    Event floats sit in coordinates or at the top level of an event, so
+    only those are checked, for a single event or a list of events.
+    """
+    for event in data if isinstance(data, list) else (data,):
+        if not isinstance(event, dict):
+            if not _float_identical(event):
+                return False
+            continue
+        # Exact type check: most values are strings and skip the call
+        for value in event.values():
+            if type(value) is float and not _float_identical(value):
+                return False
+        coordinates = event.get("coordinates")
+        if isinstance(coordinates, dict):
+            coordinates = coordinates.values()
+        elif not isinstance(coordinates, (list, tuple)):
+            continue
+        if not all(map(_float_identical, coordinates)):
+            return False
+    return True
+
+
+def json_dumps(data: Any, indent: bool = True) -> str:
+    """
+    Serialize to JSON like json.dumps(ensure_ascii=False, default=str).
+
+    Events with coordinates or top-level floats orjson would format
+    differently go through json, so event files do not depend on whether
+    orjson is installed. Floats nested deeper are left to orjson: NaN and
+    infinity become null and tiny or huge values use orjson's exponent
+    format (1e-5, 1e16 instead of 1e-05, 1e+16).
+
+    Args:
+        data: Data to serialize
+        indent: Pretty-print with two spaces (file format) or compact
+    """
+    orjson = _get_orjson()
+    if orjson is not None and _orjson_identical(data):
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-string keys or huge ints: let json handle them
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def json_loads(text) -> Any:
+    """Parse JSON from str or bytes."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # json accepts a few inputs orjson rejects (NaN, big ints)
+    return json.loads(text)
+
+
+def split_frontmatter(lines: Iterable[str]) -> Optional[str]:
+    """
+    Consume a '---' frontmatter block and return its YAML text.
+
+    Returns None if the lines do not start with a closed block. An iterator
+    (e.g. an open file) is left at the first body line.
+    """
+    lines = iter(lines)
+    if next(lines, "").rstrip() != "---":
+        return None
+    header = []
+    for line in lines:
+        if line.rstrip() == "---":
+            return "".join(header)
+        header.append(line)
+    return None
+
+
+def load_frontmatter(header: str) -> Dict[str, Any]:
+    """Parse frontmatter YAML, with libyaml's CSafeLoader if available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(header, Loader=loader) or {}
+
+
+class Event:
+    """
+    Compact event with known fields in slots and the rest in extra.
+
+    Supports the read-only mapping protocol plus item assignment, so it can
+    be handed to code that reads event dicts.
+    """
+
+    __slots__ = FIELDS + ("extra", "_shape")
+
+    def __init__(self, **fields: Any):
+        self._assign(fields)
+
+    def _assign(self, data: Dict[str, Any]):
+        extra = None
+        for key in FIELDS:
+            setattr(self, key, None)
+        for key, value in data.items():
+            if key in _KNOWN:
+                if (
+                    key in _INTERN_FIELDS
+                    and type(value) is str
+                    and len(value) <= _INTERN_MAX
+                ):
+                    value = sys.intern(value)
+                setattr(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self.extra = extra
+        self._shape = _shape(data)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        """Build an event from a plain dict (keys need not be identifiers)."""
+        event = cls.__new__(cls)
+        event._assign(data)
+        return event
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the original key order."""
+        return {key: self[key] for key in self._shape}
+
+    # Mapping protocol -----------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._shape:
+            raise KeyError(key)
+        if key in _KNOWN:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _KNOWN:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        if key not in self._shape:
+            self._shape = _shape(self._shape + (key,))
+
+    def __delitem__(self, key: str):
+        if key not in self._shape:
+            raise KeyError(key)
+        if key in _KNOWN:
+            setattr(self, key, None)
+        else:
+            del self.extra[key]
+        self._shape = _shape(k for k in self._shape if k != key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shape
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape)
+
+    def __len__(self) -> int:
+        return len(self._shape)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Event):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Event({self.to_dict()!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a field, or default if it is not set."""
+        if key not in self._shape:
+            return default
+        return self[key]
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._shape
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((key, self[key]) for key in self._shape)
+
+    def values(self) -> Iterator[Any]:
+        return (self[key] for key in self._shape)
+
+    # File formats ---------------------------------------------------------
+
+    @classmethod
+    def from_json(cls, text) -> "Event":
+        """Parse an event from JSON text or bytes."""
+        return cls.from_dict(json_loads(text))
+
+    def to_json(self, indent: bool = True) -> str:
+        """Serialize in the format EventManager writes JSON events."""
+        return json_dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "Event":
+        """
+        Parse markdown with YAML frontmatter; the body becomes 'content'.
+
+        Raises:
+            ValueError: If the text does not start with a frontmatter block
+        """
+        lines = iter(text.splitlines(keepends=True))
+        header = split_frontmatter(lines)
+        if header is None:
+            raise ValueError("Kein abgeschlossenes Frontmatter")
+
+        data = load_frontmatter(header)
+        body = "".join(lines)
+        if body.startswith("\n"):
+            body = body[1:]
+        data["content"] = body
+        return cls.from_dict(data)
+
+    def to_markdown(self) -> str:
+        """Render as markdown with frontmatter, like EventManager.save_event."""
+        import yaml
+
+        metadata = {key: value for key, value in self.items() if key != "content"}
+        header = yaml.dump(metadata, allow_unicode=True, sort_keys=False)
+        body = self.content if "content" in self._shape else ""
+        return f"---\n{header}---\n\n{body}"
+
+
+def as_dict(event: Any) -> Optional[Dict[str, Any]]:
+    """Plain dict for an Event or dict (None stays None)."""
+    if isinstance(event, Event):
+        return event.to_dict()
+    return event
@@ -0,0 +1,268 @@
+"""
+Event Query - Kompilierte Filter für Events
+
+JSON-Abfragen im Stil von MongoDB werden einmal zu Python-Closures
+kompiliert und dann gegen jedes Event ausgewertet:
+
+    {"status": "draft"}
+    {"location.city": "Hof", "genre": {"$in": ["Rock", "Punk"]}}
+    {"date": {"$gte": "2026-03-01", "$lt": "2026-04-01"}}
+    {"$or": [{"venue": "Punk im Hof"}, {"$not": {"status": "published"}}]}
+"""
+
+import json
+import re
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cli.event_index import normalize_date
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Felder, deren Werte vor Vergleichen auf YYYY-MM-DD normalisiert werden
+DATE_FIELDS = {"date", "end_date", "import_date"}
+
+_MISSING = object()
+
+_RELATIVE_DAYS = re.compile(r"^([+-]\d+)d$")
+
+
+class QueryError(ValueError):
+    """Raised for malformed filter queries."""
+
+
+def get_field(event: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """Look up a (possibly dotted) field such as 'location.city'."""
+    value = event
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+def _getter(key: str) -> Callable[[Dict[str, Any]], Any]:
+    """Build an accessor for a (possibly dotted) field name."""
+    parts = key.split(".")
+    normalize = key in DATE_FIELDS
+
+    def get(event):
+        value = event
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                return _MISSING
+            value = value[part]
+        if normalize and value is not _MISSING:
+            return normalize_date(value) or value
+        return value
+
+    return get
+
+
+def _equals(actual: Any, expected: Any) -> bool:
+    """Equality with list membership, e.g. {"categories": "konzert"}."""
+    if isinstance(actual, list) and not isinstance(expected, list):
+        return expected in actual
+    return actual == expected
+
+
+def _compare(op: str, operand: Any) -> Callable[[Any], bool]:
+    """Build a range comparison that treats incomparable values as no match."""
+    compare = {
+        "$gt": lambda a, b: a > b,
+        "$gte": lambda a, b: a >= b,
+        "$lt": lambda a, b: a < b,
+        "$lte": lambda a, b: a <= b,
+    }[op]
+
+    def check(actual):
+        if actual is _MISSING or actual is None:
+            return False
+        try:
+            return compare(actual, operand)
+        except TypeError:
+            return False
+
+    return check
+
+
+def _normalize_operand(key: str, operand: Any) -> Any:
+    """Normalize query operands for date fields the same way as field values."""
+    if key in DATE_FIELDS:
+        if isinstance(operand, list):
+            return [normalize_date(item) or item for item in operand]
+        return normalize_date(operand) or operand
+    return operand
+
+
+def _compile_operators(key: str, spec: Dict[str, Any]) -> Predicate:
+    """Compile {"$op": operand, ...} for a single field."""
+    get = _getter(key)
+    checks = []
+
+    for op, operand in spec.items():
+        operand = _normalize_operand(key, operand)
+
+        if op == "$eq":
+            checks.append(lambda v, o=operand: _equals(v, o))
+        elif op == "$ne":
+            checks.append(lambda v, o=operand: not _equals(v, o))
+        elif op in ("$gt", "$gte", "$lt", "$lte"):
+            checks.append(_compare(op, operand))
+        elif op in ("$in", "$nin"):
+            if not isinstance(operand, list):
+                raise QueryError(f"{op} erwartet eine Liste: {key}")
+            members = operand
+            found = lambda v, m=members: (  # noqa: E731
+                any(item in m for item in v) if isinstance(v, list) else v in m
+            )
+            if op == "$in":
+                checks.append(found)
+            else:
+                checks.append(lambda v, f=found: not f(v))
+        elif op == "$exists":
+            checks.append(lambda v, o=bool(operand): (v is not _MISSING) == o)
+        else:
+            raise QueryError(f"Unbekannter Operator: {op}")
+
+    def predicate(event):
+        value = get(event)
+        return all(check(value) for check in checks)
+
+    return predicate
+
+
+def _compile(query: Any) -> Predicate:
+    """Compile a query document into a predicate."""
+    if not isinstance(query, dict):
+        raise QueryError(f"Query muss ein JSON-Objekt sein: {query!r}")
+
+    predicates = []
+    for key, spec in query.items():
+        if key in ("$and", "$or"):
+            if not isinstance(spec, list) or not spec:
+                raise QueryError(f"{key} erwartet eine nicht-leere Liste")
+            children = [_compile(child) for child in spec]
+            combine = all if key == "$and" else any
+            predicates.append(
+                lambda e, c=children, f=combine: f(child(e) for child in c)
+            )
+        elif key == "$not":
+            child = _compile(spec)
+            predicates.append(lambda e, c=child: not c(e))
+        elif key.startswith("$"):
+            raise QueryError(f"Unbekannter Operator: {key}")
+        elif isinstance(spec, dict) and spec and all(k.startswith("$") for k in spec):
+            predicates.append(_compile_operators(key, spec))
+        else:
+            get = _getter(key)
+            expected = _normalize_operand(key, spec)
+            predicates.append(lambda e, g=get, s=expected: _equals(g(e), s))
+
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda event: all(predicate(event) for predicate in predicates)
+
+
+def _date_bounds(query: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Derive an inclusive (from, to) date range usable for index pre-filtering."""
+    lower, upper = None, None
+
+    def narrow(lo, hi):
+        nonlocal lower, upper
+        if lo and (lower is None or lo > lower):
+            lower = lo
+        if hi and (upper is None or hi < upper):
+            upper = hi
+
+    for key, spec in query.items():
+        if key == "date":
+            if isinstance(spec, dict) and all(k.startswith("$") for k in spec):
+                for op, operand in spec.items():
+                    value = normalize_date(operand)
+                    if op in ("$gt", "$gte"):
+                        narrow(value, None)
+                    elif op in ("$lt", "$lte"):
+                        narrow(None, value)
+                    elif op == "$eq":
+                        narrow(value, value)
+            else:
+                value = normalize_date(spec)
+                narrow(value, value)
+        elif key == "$and":
+            for child in spec:
+                narrow(*_date_bounds(child))
+
+    return lower, upper
+
+
+class EventQuery:
+    """A compiled event filter."""
+
+    def __init__(self, query: Dict[str, Any]):
+        self.query = query
+        self._predicate = _compile(query)
+        self.date_bounds = _date_bounds(query)
+
+    @classmethod
+    def parse(cls, text: str) -> "EventQuery":
+        """Compile a query from its JSON representation."""
+        try:
+            query = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise QueryError(f"Ungültiges JSON: {e}") from e
+        return cls(query)
+
+    def __call__(self, event: Dict[str, Any]) -> bool:
+        return self._predicate(event)
+
+
+def parse_date_arg(value: str) -> str:
+    """
+    Parse a CLI date argument to YYYY-MM-DD.
+
+    Accepts YYYY-MM-DD, DD.MM.YYYY, 'today'/'heute' and day offsets
+    relative to today such as '+14d' or '-7d'.
+    """
+    value = value.strip().lower()
+    if value in ("today", "heute"):
+        return date.today().isoformat()
+
+    match = _RELATIVE_DAYS.match(value)
+    if match:
+        return (date.today() + timedelta(days=int(match.group(1)))).isoformat()
+
+    normalized = normalize_date(value)
+    if not normalized:
+        raise QueryError(f"Ungültiges Datum: {value}")
+    return normalized
+
+
+def build_query(
+    filter_text: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> Optional[EventQuery]:
+    """
+    Combine a JSON --filter and an inclusive --from/--to date range.
+
+    Returns:
+        Compiled EventQuery, or None if no condition was given
+    """
+    conditions = []
+    if filter_text:
+        conditions.append(EventQuery.parse(filter_text).query)
+
+    date_range = {}
+    if date_from:
+        date_range["$gte"] = parse_date_arg(date_from)
+    if date_to:
+        date_range["$lte"] = parse_date_arg(date_to)
+    if date_range:
+        conditions.append({"date": date_range})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return EventQuery(conditions[0])
+    return EventQuery({"$and": conditions})
@@ -0,0 +1,303 @@
+"""
+Event Schema - Validierung des Event-Archivs vor dem Jekyll-Build
+
+Das Schema ist eine Teilmenge von JSON Schema (type, enum, minLength,
+minimum, maximum, format, properties, required, items). Es wird einmal zu
+Python-Closures kompiliert und dann gegen jedes Event ausgewertet.
+
+Markdown-Events (Jekyll-Frontmatter) müssen zusätzlich die Pflichtfelder aus
+MARKDOWN_REQUIRED enthalten; JSON-Dateien sind Entwürfe und brauchen nur
+einen Titel.
+"""
+
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Prüft einen Wert und liefert Fehlermeldungen, Pfad für die Meldung
+Check = Callable[[Any, str], Iterator[str]]
+
+URL = {"type": "string", "format": "uri"}
+FLAG = {"type": "boolean"}
+TEXT = {"type": "string"}
+
+EVENT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["title"],
+    "properties": {
+        "layout": {"type": "string", "minLength": 1},
+        "title": {"type": "string", "minLength": 1},
+        "date": {"format": "date-time"},
+        "end_date": {"format": "date-time"},
+        "import_date": {"format": "date"},
+        "published": FLAG,
+        "categories": {"type": "array", "items": TEXT},
+        "location": {
+            "type": ["object", "string"],
+            "properties": {
+                "name": TEXT,
+                "address": TEXT,
+                "city": TEXT,
+                "postal_code": {"type": ["string", "integer"]},
+            },
+        },
+        "coordinates": {
+            "type": "object",
+            "required": ["lat", "lng"],
+            "properties": {
+                "lat": {"type": "number", "minimum": -90, "maximum": 90},
+                "lng": {"type": "number", "minimum": -180, "maximum": 180},
+            },
+        },
+        "url": URL,
+        "ticket_url": URL,
+        "source_url": URL,
+        "facebook_event": URL,
+        "price": {"type": ["string", "number"]},
+        "featured": FLAG,
+        "sold_out": FLAG,
+        "cancelled": FLAG,
+        "status": TEXT,
+    },
+}
+
+# Frontmatter-Pflichtfelder laut _events/README.md
+MARKDOWN_REQUIRED = ["layout", "title", "date", "published"]
+
+_TYPES = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "null": lambda v: v is None,
+}
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_TIME = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:[ T]\d{2}:\d{2}(?::\d{2})?)?")
+_URI = re.compile(r"^https?://\S+$")
+
+
+class SchemaError(ValueError):
+    """Raised for schemas using unsupported keywords or types."""
+
+
+def _format_check(name: str) -> Callable[[Any], bool]:
+    """Build a check for a string format; YAML date objects are accepted."""
+
+    def valid_day(text: str) -> bool:
+        try:
+            date.fromisoformat(text)
+        except ValueError:
+            return False
+        return True
+
+    if name == "date":
+        return lambda v: isinstance(v, date) or (
+            isinstance(v, str) and bool(_DATE.match(v)) and valid_day(v)
+        )
+    if name == "date-time":
+
+        def check(value):
+            if isinstance(value, (date, datetime)):
+                return True
+            match = _DATE_TIME.match(value) if isinstance(value, str) else None
+            return bool(match) and match.end() == len(value) and valid_day(match[1])
+
+        return check
+    if name == "uri":
+        # Empty strings are placeholders in the event template
+        return lambda v: not isinstance(v, str) or v == "" or bool(_URI.match(v))
+    raise SchemaError(f"Unbekanntes Format: {name}")
+
+
+def compile_schema(schema: Dict[str, Any]) -> Check:
+    """Compile a schema into a function yielding error messages."""
+    if not isinstance(schema, dict):
+        raise SchemaError(f"Schema muss ein Objekt sein: {schema!r}")
+
+    checks: List[Check] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        unknown = [name for name in names if name not in _TYPES]
+        if unknown:
+            raise SchemaError(f"Unbekannter Typ: {', '.join(unknown)}")
+        tests = [_TYPES[name] for name in names]
+        expected = " oder ".join(names)
+
+        def check_type(value, path):
+            if not any(test(value) for test in tests):
+                yield f"{path}: erwartet {expected}, ist {type(value).__name__}"
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        options = schema["enum"]
+
+        def check_enum(value, path):
+            if value not in options:
+                yield f"{path}: {value!r} nicht in {options}"
+
+        checks.append(check_enum)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_length(value, path):
+            if isinstance(value, str) and len(value.strip()) < min_length:
+                yield f"{path}: darf nicht leer sein"
+
+        checks.append(check_length)
+
+    if "minimum" in schema or "maximum" in schema:
+        low = schema.get("minimum", float("-inf"))
+        high = schema.get("maximum", float("inf"))
+
+        def check_range(value, path):
+            if _TYPES["number"](value) and not low <= value <= high:
+                yield f"{path}: {value} außerhalb von [{low}, {high}]"
+
+        checks.append(check_range)
+
+    if "format" in schema:
+        name = schema["format"]
+        test = _format_check(name)
+
+        def check_format(value, path):
+            if not test(value):
+                yield f"{path}: {value!r} ist kein gültiges {name}"
+
+        checks.append(check_format)
+
+    required = schema.get("required", [])
+    properties = {
+        key: compile_schema(child)
+        for key, child in schema.get("properties", {}).items()
+    }
+    if required or properties:
+
+        def check_object(value, path):
+            if not isinstance(value, dict):
+                return
+            prefix = f"{path}." if path else ""
+            for key in required:
+                if key not in value or value[key] is None:
+                    yield f"{prefix}{key}: Pflichtfeld fehlt"
+            for key, check in properties.items():
+                if key in value and value[key] is not None:
+                    yield from check(value[key], prefix + key)
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+
+        def check_items(value, path):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    yield from item_check(item, f"{path}[{i}]")
+
+        checks.append(check_items)
+
+    unknown = set(schema) - {
+        "type",
+        "enum",
+        "minLength",
+        "minimum",
+        "maximum",
+        "format",
+        "required",
+        "properties",
+        "items",
+        "description",
+    }
+    if unknown:
+        raise SchemaError(f"Nicht unterstützt: {', '.join(sorted(unknown))}")
+
+    def validate(value, path=""):
+        for check in checks:
+            yield from check(value, path)
+
+    return validate
+
+
+class EventValidator:
+    """Validate events against a precompiled schema."""
+
+    def __init__(self, schema: Optional[Dict[str, Any]] = None):
+        schema = schema or EVENT_SCHEMA
+        self.schema = schema
+        self._check = compile_schema(schema)
+        self._markdown_check = compile_schema(
+            dict(
+                schema,
+                required=list(
+                    dict.fromkeys(schema.get("required", []) + MARKDOWN_REQUIRED)
+                ),
+            )
+        )
+
+    def validate(self, event: Dict[str, Any], markdown: bool = False) -> List[str]:
+        """Return all error messages for an event (empty if valid)."""
+        check = self._markdown_check if markdown else self._check
+        return list(check(event, ""))
+
+    def validate_file(self, manager, filepath: Path) -> List[str]:
+        """Parse and validate one event file."""
+        try:
+            event = manager.read_event(filepath)
+        except Exception as e:  # JSON/YAML syntax errors
+            return [f"Nicht lesbar: {e}"]
+
+        if not event:
+            return ["Leer oder kein Frontmatter"]
+        if not isinstance(event, dict):
+            return [f"Event muss ein Objekt sein, ist {type(event).__name__}"]
+        return self.validate(event, markdown=filepath.suffix == ".md")
+
+
+def validate_files(
+    events_dir: Path,
+    paths: List[Path],
+    schema: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    chunksize: int = 256,
+) -> Iterator[Tuple[Path, List[str]]]:
+    """
+    Validate event files, optionally across worker processes.
+
+    Compiled validators cannot be pickled, so every worker compiles the
+    schema once per chunk.
+
+    Yields:
+        (path, errors) for every file, in input order
+    """
+    if workers <= 1 or len(paths) <= chunksize:
+        yield from _validate_chunk(events_dir, schema, paths)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(
+            _validate_chunk,
+            [events_dir] * len(chunks),
+            [schema] * len(chunks),
+            chunks,
+        ):
+            yield from results
+
+
+def _validate_chunk(
+    events_dir: Path, schema: Optional[Dict[str, Any]], paths: List[Path]
+) -> List[Tuple[Path, List[str]]]:
+    """Process pool worker for validate_files."""
+    from cli.event_scraper import EventManager
+
+    manager = EventManager(events_dir)
+    validator = EventValidator(schema)
+    return [(path, validator.validate_file(manager, path)) for path in paths]
@@ -5,80 +5,457 @@ Scraping, comparing, merging, and managing event data.
 """
 
 import argparse
-import difflib
+import hashlib
 import json
+import os
+import pickle
 import sys
-from datetime import datetime
+import threading
+from collections import deque
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Add repository root to path for standalone execution
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cli.event_model import Event, as_dict, json_dumps, json_loads
+from cli.event_timings import phase, timed_phase
 
 
 class EventManager:
     """Core class for event data management."""
 
-    def __init__(self, events_dir: Path = None):
+    def __init__(
+        self, events_dir: Path = None, index_path: Path = None, sharded: bool = None
+    ):
         self.events_dir = events_dir or Path("_events")
         self.events_dir.mkdir(exist_ok=True)
+        self.index = None
+        self._frontmatter_cache = {}
+        self._sharded = sharded
+        self._generator = None
+        if index_path:
+            self.use_index(index_path)
+
+    @property
+    def sharded(self) -> bool:
+        """Whether new events go to YYYY/MM shards (auto-detected by default)."""
+        if self._sharded is None:
+            return any(True for _ in self._shard_dirs(self.events_dir, 4))
+        return self._sharded
+
+    def use_index(self, index_path: Path):
+        """Enable the persistent on-disk event index."""
+        from cli.event_index import EventIndex
+
+        self.index = EventIndex(index_path, self.events_dir)
 
     def load_event(self, filepath: Path) -> Optional[Dict[str, Any]]:
         """Load event from JSON or markdown frontmatter."""
+        if self.index is not None:
+            cached = self.index.get(filepath)
+            if cached is not None:
+                return cached
+        return self.read_event(filepath)
+
+    def load_document(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """Load an event including the markdown body as 'content'."""
+        event = self.load_event(filepath)
+        if event is not None and filepath.suffix == ".md":
+            event = self._with_content(event, filepath)
+        return event
+
+    def _with_content(self, event: Dict[str, Any], filepath: Path) -> Dict[str, Any]:
+        """Add a non-empty markdown body to the frontmatter as 'content'."""
+        content = self.read_content(filepath)
+        return dict(event, content=content) if content.strip() else event
+
+    def load_model(self, filepath: Path) -> Optional[Event]:
+        """Load an event as a compact Event object (e.g. to hold many in memory)."""
+        event = self.load_event(filepath)
+        return Event.from_dict(event) if event else None
+
+    def read_event(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """Parse an event file, bypassing the index."""
         if not filepath.exists():
             return None
 
         if filepath.suffix == ".json":
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with phase("load"):
+                data = filepath.read_bytes()
+            with phase("parse"):
+                return json_loads(data)
         elif filepath.suffix == ".md":
             # Parse frontmatter from markdown
             return self._parse_frontmatter(filepath)
         return None
 
     def _parse_frontmatter(self, filepath: Path) -> Dict[str, Any]:
-        """Extract YAML frontmatter from markdown file."""
-        import yaml
-
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                return yaml.safe_load(parts[1])
-        return {}
+        """
+        Extract YAML frontmatter from markdown file.
+
+        Only the header up to the closing '---' line is read, so the event
+        body never costs anything. Results are cached per (path, mtime).
+        """
+        from cli.event_model import load_frontmatter, split_frontmatter
+
+        st = filepath.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._frontmatter_cache.get(filepath)
+        if cached and cached[0] == stamp:
+            with phase("parse"):
+                return pickle.loads(cached[1])
+
+        with phase("load"), open(filepath, "r", encoding="utf-8") as f:
+            header = split_frontmatter(f)
+        if header is None:
+            return {}
+
+        with phase("parse"):
+            frontmatter = load_frontmatter(header)
+        self._frontmatter_cache[filepath] = (
+            stamp,
+            pickle.dumps(frontmatter, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        return frontmatter
 
+    @timed_phase("write")
     def save_event(
-        self, event_data: Dict[str, Any], filepath: Path, format: str = "json"
+        self, event_data: Dict[str, Any], filepath: Path, format: str = None
     ):
-        """Save event data to file."""
+        """
+        Save event data to file.
+
+        The file is written to a temporary sibling and moved into place with
+        os.replace, so readers never see a half-written event. Without an
+        explicit format it is derived from the file suffix. event_data may
+        be a dict or an Event.
+        """
+        event_data = as_dict(event_data)
         filepath.parent.mkdir(parents=True, exist_ok=True)
+        format = format or ("markdown" if filepath.suffix == ".md" else "json")
 
         if format == "json":
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(event_data, f, indent=2, ensure_ascii=False)
+            text = json_dumps(event_data)
         elif format == "markdown":
-            self._save_as_markdown(event_data, filepath)
-
-    def _save_as_markdown(self, event_data: Dict[str, Any], filepath: Path):
-        """Save event as markdown with frontmatter."""
+            text = self._render_markdown(event_data, filepath)
+        else:
+            return
+
+        self._write_atomic(filepath, text)
+
+    def save_events(
+        self, items: Iterable[Tuple[Path, Dict[str, Any]]], workers: int = 4
+    ) -> Iterator[Path]:
+        """
+        Save many events on a bounded thread pool.
+
+        At most a few writes per worker are in flight at any time, so memory
+        stays flat for large bulk edits. Paths are yielded in input order
+        once their file has been written.
+        """
+        if workers <= 1:
+            for filepath, event in items:
+                self.save_event(event, filepath)
+                yield filepath
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for filepath, event in items:
+                pending.append(
+                    (filepath, pool.submit(self.save_event, event, filepath))
+                )
+                if len(pending) >= workers * 4:
+                    done, future = pending.popleft()
+                    future.result()
+                    yield done
+            while pending:
+                done, future = pending.popleft()
+                future.result()
+                yield done
+
+    def _write_atomic(self, filepath: Path, text: str):
+        """
+        Write text to a temp file next to filepath and rename it into place.
+
+        The temp file takes over the mode of an existing file, so a save
+        does not reset its permissions to the umask default.
+        """
+        tmp_path = filepath.with_name(
+            f".{filepath.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            try:
+                os.chmod(tmp_path, os.stat(filepath).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass  # new event: umask default
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _render_markdown(self, event_data: Dict[str, Any], filepath: Path) -> str:
+        """
+        Render event as markdown with frontmatter.
+
+        Without a 'content' field the body of an existing file is kept, so
+        metadata-only edits do not wipe event descriptions.
+        """
         import yaml
 
         # Separate content from metadata
-        content = event_data.pop("content", "")
+        metadata = {k: v for k, v in event_data.items() if k != "content"}
+        if "content" in event_data:
+            body = "\n" + event_data["content"]
+        else:
+            body = self._read_body(filepath)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("---\n")
-            yaml.dump(event_data, f, allow_unicode=True, sort_keys=False)
-            f.write("---\n\n")
-            f.write(content)
+        header = yaml.dump(metadata, allow_unicode=True, sort_keys=False)
+        return f"---\n{header}---\n{body}"
 
-    def list_events(self) -> List[Path]:
-        """List all event files in the events directory."""
-        json_files = list(self.events_dir.glob("*.json"))
-        md_files = list(self.events_dir.glob("*.md"))
-        return sorted(json_files + md_files)
+    def _read_body(self, filepath: Path) -> str:
+        """Return everything after the frontmatter of an existing markdown file."""
+        if not filepath.exists():
+            return "\n"
+
+        from cli.event_model import split_frontmatter
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            if split_frontmatter(f) is None:
+                return "\n"
+            return f.read()
+
+    def read_content(self, filepath: Path) -> str:
+        """Markdown body as stored in 'content' (after the blank line)."""
+        body = self._read_body(filepath)
+        return body[1:] if body.startswith("\n") else body
+
+    @timed_phase("load")
+    def list_events(self, date_from: str = None, date_to: str = None) -> List[Path]:
+        """
+        List all event files in the events directory.
+
+        Besides flat files, date shards (YYYY/MM/) are scanned. With a date
+        range (YYYY-MM-DD), shards outside of it are skipped without being
+        listed; unsharded files are always included.
+        """
+        files = self._scan_event_files(self.events_dir)
+
+        for year_dir in self._shard_dirs(self.events_dir, 4):
+            year = year_dir.name
+            if (date_from and year < date_from[:4]) or (date_to and year > date_to[:4]):
+                continue
+            for month_dir in self._shard_dirs(year_dir, 2):
+                month = f"{year}-{month_dir.name}"
+                if (date_from and month < date_from[:7]) or (
+                    date_to and month > date_to[:7]
+                ):
+                    continue
+                files.extend(self._scan_event_files(month_dir))
+
+        return sorted(files)
+
+    @staticmethod
+    def _scan_event_files(directory: Path) -> List[Path]:
+        """JSON and markdown files directly inside directory."""
+        with os.scandir(directory) as entries:
+            return [
+                directory / entry.name
+                for entry in entries
+                if entry.name.endswith((".json", ".md")) and entry.is_file()
+            ]
+
+    @staticmethod
+    def _shard_dirs(directory: Path, digits: int) -> Iterator[Path]:
+        """Shard subdirectories named with the given number of digits."""
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if len(entry.name) == digits and entry.name.isdigit() and entry.is_dir()
+            )
+        for name in names:
+            yield directory / name
+
+    def shard_dir(self, event: Dict[str, Any], filename: str = "") -> Path:
+        """YYYY/MM shard for an event, from its date or a dated filename."""
+        from cli.event_index import normalize_date
+
+        day = normalize_date(event.get("date")) or normalize_date(filename[:10])
+        if not day:
+            return self.events_dir
+        return self.events_dir / day[:4] / day[5:7]
+
+    def event_path(self, event: Dict[str, Any], filename: str) -> Path:
+        """Path for a new event file, inside its shard if sharding is in use."""
+        if self.sharded:
+            return self.shard_dir(event, filename) / filename
+        return self.events_dir / filename
+
+    def shard_events(self, dry_run: bool = False) -> Iterator[Tuple[Path, Path]]:
+        """
+        Move flat event files into YYYY/MM shards.
+
+        Files without a recognizable date stay where they are.
+
+        Yields:
+            (old path, new path) for every file moved
+        """
+        for filepath in self._scan_event_files(self.events_dir):
+            event = self.load_event(filepath) or {}
+            target_dir = self.shard_dir(event, filepath.name)
+            if target_dir == self.events_dir:
+                continue
+
+            target = target_dir / filepath.name
+            if target.exists():
+                print(f"⚠️  Übersprungen, existiert bereits: {target}", file=sys.stderr)
+                continue
+            if not dry_run:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                os.replace(filepath, target)
+            yield filepath, target
+
+    def iter_events(
+        self, workers: int = 1, query=None
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """
+        Yield (path, event) for all events, served from the index if enabled.
+
+        Args:
+            workers: Number of parser processes
+            query: Optional compiled EventQuery; only matching events are yielded
+        """
+        if self.index is not None:
+            self.index.refresh(self, workers=workers)
+            bounds = query.date_bounds if query is not None else (None, None)
+            events = self.index.events(*bounds)
+        elif query is not None:
+            events = self.load_all(
+                workers=workers, paths=self.list_events(*query.date_bounds)
+            )
+        else:
+            events = self.load_all(workers=workers)
+
+        if query is None:
+            yield from events
+            return
+
+        for filepath, event in events:
+            with phase("transform"):
+                matches = query(event)
+            if matches:
+                yield filepath, event
+
+    def load_all(
+        self, workers: int = 1, paths=None, chunksize: int = 64
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """
+        Parse event files, optionally across worker processes.
+
+        Paths are sent to the workers in chunks to amortize IPC overhead.
+        Results are yielded in input order as (path, event) pairs; files
+        that cannot be parsed are skipped.
+        """
+        paths = list(paths) if paths is not None else self.list_events()
+
+        if workers <= 1 or len(paths) <= chunksize:
+            for filepath in paths:
+                event = self.read_event(filepath)
+                if event:
+                    yield filepath, event
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
 
+        chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                _read_event_chunk, [self.events_dir] * len(chunks), chunks
+            )
+            while True:
+                # Only the wait for the next chunk counts, not the consumer
+                with phase("load"):
+                    chunk = next(results, None)
+                if chunk is None:
+                    return
+                yield from chunk
+
+    @staticmethod
+    def content_hash(event: Dict[str, Any]) -> str:
+        """Hash event content independent of file format and key order."""
+        canonical = json.dumps(
+            event,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def event_identity(event: Dict[str, Any], filepath: Path, root: Path) -> str:
+        """Identify an event by its id, falling back to its path below root."""
+        if event.get("id"):
+            return str(event["id"])
+        return filepath.relative_to(root).with_suffix("").as_posix()
+
+    def build_manifest(
+        self, root: Path, events: Iterable[Tuple[Path, Dict[str, Any]]]
+    ) -> Dict[str, Tuple[Path, str]]:
+        """
+        Map event identity to (path, content hash) for an event tree.
+
+        The hash of a markdown event covers its body, so body-only edits
+        count as changes.
+        """
+        manifest = {}
+        for filepath, event in events:
+            key = self.event_identity(event, filepath, root)
+            if key in manifest:
+                # Duplicate id: keep both, the second one under its path
+                key = filepath.relative_to(root).as_posix()
+            if filepath.suffix == ".md":
+                event = self._with_content(event, filepath)
+            manifest[key] = (filepath, self.content_hash(event))
+        return manifest
+
+    def compare_manifests(
+        self, old: Dict[str, Tuple[Path, str]], new: Dict[str, Tuple[Path, str]]
+    ) -> Dict[str, Any]:
+        """Compare two manifests by identity and hash in O(n)."""
+        added = sorted(new.keys() - old.keys())
+        removed = sorted(old.keys() - new.keys())
+        changed, unchanged = [], 0
+        for key in sorted(old.keys() & new.keys()):
+            if old[key][1] == new[key][1]:
+                unchanged += 1
+            else:
+                changed.append(key)
+
+        return {
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+            "unchanged": unchanged,
+        }
+
+    @timed_phase("transform")
     def compare_events(self, event1: Dict, event2: Dict) -> Dict[str, Any]:
-        """Compare two events and return differences."""
+        """
+        Compare two events and return differences.
+
+        Nested dicts such as location or coordinates are diffed recursively
+        and reported with dotted paths (e.g. 'location.address'). Changed
+        lists additionally list the added and removed items.
+        """
         diff_result = {
             "identical": event1 == event2,
             "added_fields": [],
@@ -86,25 +463,65 @@ class EventManager:
             "modified_fields": {},
             "unchanged_fields": [],
         }
+        if diff_result["identical"]:
+            diff_result["unchanged_fields"] = list(event1.keys())
+            return diff_result
 
-        keys1 = set(event1.keys())
-        keys2 = set(event2.keys())
+        for key in event1.keys() & event2.keys():
+            if event1[key] == event2[key]:
+                diff_result["unchanged_fields"].append(key)
+        self._diff_dicts(event1, event2, "", diff_result)
 
-        diff_result["added_fields"] = list(keys2 - keys1)
-        diff_result["removed_fields"] = list(keys1 - keys2)
+        return diff_result
 
-        common_keys = keys1 & keys2
-        for key in common_keys:
-            if event1[key] != event2[key]:
-                diff_result["modified_fields"][key] = {
-                    "old": event1[key],
-                    "new": event2[key],
+    def _diff_dicts(self, old: Dict, new: Dict, prefix: str, result: Dict[str, Any]):
+        """Recursively record differences between two dicts under prefix."""
+        for key in new:
+            if key not in old:
+                result["added_fields"].append(prefix + str(key))
+        for key in old:
+            if key not in new:
+                result["removed_fields"].append(prefix + str(key))
+                continue
+
+            old_value, new_value = old[key], new[key]
+            # Equal subtrees are skipped by a single C-level comparison
+            # instead of being walked element by element.
+            if old_value == new_value:
+                continue
+
+            path = prefix + str(key)
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                self._diff_dicts(old_value, new_value, path + ".", result)
+            elif isinstance(old_value, list) and isinstance(new_value, list):
+                added, removed = self._diff_lists(old_value, new_value)
+                result["modified_fields"][path] = {
+                    "old": old_value,
+                    "new": new_value,
+                    "added": added,
+                    "removed": removed,
                 }
             else:
-                diff_result["unchanged_fields"].append(key)
+                result["modified_fields"][path] = {"old": old_value, "new": new_value}
+
+    def _diff_lists(self, old: List, new: List) -> Tuple[List, List]:
+        """Return (inserted, deleted) items between two lists as multisets."""
+        remaining = {}
+        for item in old:
+            remaining.setdefault(self.content_hash(item), []).append(item)
+
+        added = []
+        for item in new:
+            matches = remaining.get(self.content_hash(item))
+            if matches:
+                matches.pop()
+            else:
+                added.append(item)
 
-        return diff_result
+        removed = [item for items in remaining.values() for item in items]
+        return added, removed
 
+    @timed_phase("transform")
     def merge_events(self, base: Dict, updates: Dict, fields: List[str] = None) -> Dict:
         """Merge specific fields from updates into base event."""
         merged = base.copy()
@@ -121,45 +538,91 @@ class EventManager:
         merged["last_updated"] = datetime.now().isoformat()
         return merged
 
+    @timed_phase("transform")
+    def merge3_events(
+        self, base: Dict, ours: Dict, theirs: Dict, prefer: str = "ours"
+    ) -> Tuple[Dict, Dict[str, Dict[str, Any]]]:
+        """
+        Three-way merge of an event.
+
+        Fields changed on only one side since base are applied
+        automatically. Fields changed differently on both sides are
+        conflicts: they keep the value of the preferred side and are
+        returned keyed by dotted path. Nested dicts are merged recursively.
+
+        Args:
+            base: Common ancestor (e.g. previous scrape snapshot)
+            ours: Our edited version
+            theirs: Fresh version (e.g. new scrape)
+            prefer: Side that wins conflicts ("ours" or "theirs")
+
+        Returns:
+            Tuple of (merged event, conflicts)
+        """
+        conflicts = {}
+        merged = self._merge3_dicts(base or {}, ours, theirs, prefer, "", conflicts)
+        if merged != ours:
+            merged["last_updated"] = datetime.now().isoformat()
+        return merged, conflicts
+
+    def _merge3_dicts(
+        self, base: Dict, ours: Dict, theirs: Dict, prefer: str, prefix: str, conflicts
+    ) -> Dict:
+        """Merge one dict level; see merge3_events."""
+        missing = object()
+        merged = {}
+
+        for key in list(ours) + [k for k in theirs if k not in ours]:
+            b = base.get(key, missing)
+            o = ours.get(key, missing)
+            t = theirs.get(key, missing)
+
+            if o == t or t == b:
+                value = o
+            elif o == b:
+                value = t
+            elif isinstance(o, dict) and isinstance(t, dict):
+                value = self._merge3_dicts(
+                    b if isinstance(b, dict) else {},
+                    o,
+                    t,
+                    prefer,
+                    f"{prefix}{key}.",
+                    conflicts,
+                )
+            else:
+                conflicts[prefix + str(key)] = {
+                    "base": None if b is missing else b,
+                    "ours": None if o is missing else o,
+                    "theirs": None if t is missing else t,
+                }
+                value = t if prefer == "theirs" else o
+
+            if value is not missing:
+                merged[key] = value
+
+        return merged
+
     def generate_test_event(self, event_type: str = "concert") -> Dict[str, Any]:
         """Generate lorem ipsum test event data."""
-        from faker import Faker
-
-        fake = Faker("de_DE")
-
-        templates = {
-            "concert": {
-                "title": f"{fake.name()} - {fake.catch_phrase()}",
-                "date": fake.future_date(end_date="+90d").isoformat(),
-                "venue": fake.company(),
-                "location": fake.city(),
-                "description": fake.text(max_nb_chars=200),
-                "price": f"{fake.random_int(min=5, max=50)}€",
-                "genre": fake.random_element(
-                    ["Rock", "Pop", "Jazz", "Electronic", "Hip-Hop"]
-                ),
-                "url": fake.url(),
-                "status": "draft",
-            },
-            "exhibition": {
-                "title": fake.catch_phrase(),
-                "date": fake.future_date(end_date="+90d").isoformat(),
-                "end_date": fake.future_date(end_date="+120d").isoformat(),
-                "venue": fake.company(),
-                "location": fake.city(),
-                "description": fake.text(max_nb_chars=200),
-                "artists": [fake.name() for _ in range(fake.random_int(min=1, max=3))],
-                "free_entry": fake.boolean(),
-                "url": fake.url(),
-                "status": "draft",
-            },
-        }
+        if self._generator is None:
+            from cli.event_generator import EventGenerator
 
-        event = templates.get(event_type, templates["concert"]).copy()
-        event["id"] = fake.uuid4()
-        event["created"] = datetime.now().isoformat()
+            # Building a Faker instance is far more expensive than using one
+            self._generator = EventGenerator()
+        return self._generator.event(event_type)
 
-        return event
+
+def _read_event_chunk(
+    events_dir: Path, paths: List[Path]
+) -> List[Tuple[Path, Dict[str, Any]]]:
+    """Process pool worker for EventManager.load_all."""
+    manager = EventManager(events_dir)
+    return [
+        (filepath, event)
+        for filepath, event in zip(paths, map(manager.read_event, paths))
+        if event
+    ]
 
 
 class EventScraperCLI:
@@ -181,21 +644,103 @@ class EventScraperCLI:
             "  %(prog)s generate --count 5 --type concert\n",
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
+        parser.add_argument(
+            "--index",
+            nargs="?",
+            const=".cache/events.sqlite",
+            metavar="PFAD",
+            help="Persistenten Event-Index nutzen (default: .cache/events.sqlite)",
+        )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const=".cache/profile.pstats",
+            metavar="PFAD",
+            help="cProfile-Dump schreiben (default: .cache/profile.pstats)",
+        )
+        parser.add_argument(
+            "--timings",
+            nargs="?",
+            const="-",
+            metavar="PFAD",
+            help="Laufzeit pro Phase (load/parse/transform/write), CPU und "
+            "Peak-RSS als JSON schreiben (default: stderr)",
+        )
+        parser.add_argument(
+            "--import-profile",
+            action="store_true",
+            help="Kommando ausführen und Import-Zeit pro Modul anzeigen",
+        )
 
         subparsers = parser.add_subparsers(dest="command", help="Verfügbare Kommandos")
 
         # LIST command
         list_parser = subparsers.add_parser("list", help="Liste alle Events auf")
         list_parser.add_argument(
-            "--format", choices=["table", "json"], default="table", help="Ausgabeformat"
+            "--format",
+            choices=["table", "json", "ndjson"],
+            default="table",
+            help="Ausgabeformat (ndjson: ein Event pro Zeile, gestreamt)",
+        )
+        list_parser.add_argument(
+            "--fields",
+            help="Komma-separierte Felder, z.B. title,date,location.city "
+            "(ndjson default: title,date,venue,status)",
+        )
+        list_parser.add_argument("--filter", help="Filter Events (JSON query)")
+        self._add_date_range_arguments(list_parser)
+        list_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
         )
 
         # SCRAPE command
-        scrape_parser = subparsers.add_parser("scrape", help="Scrape Events von URL")
-        scrape_parser.add_argument("url", help="URL zum Scrapen")
-        scrape_parser.add_argument("--output", "-o", help="Output-Datei")
+        scrape_parser = subparsers.add_parser(
+            "scrape", help="Scrape Events von Venues (Scraper aus cli/scrapers)"
+        )
+        scrape_parser.add_argument(
+            "url", nargs="?", help="URL zum Scrapen (wählt den passenden Scraper)"
+        )
+        scrape_parser.add_argument(
+            "--venue",
+            action="append",
+            help="Scraper nach Name, mehrfach möglich (siehe --list)",
+        )
+        scrape_parser.add_argument(
+            "--all", action="store_true", help="Alle aktiven Scraper ausführen"
+        )
+        scrape_parser.add_argument(
+            "--list", action="store_true", help="Registrierte Scraper anzeigen"
+        )
+        scrape_parser.add_argument(
+            "--jobs", "-j", type=int, default=4, help="Parallel laufende Scraper"
+        )
+        scrape_parser.add_argument(
+            "--timeout",
+            type=float,
+            default=300,
+            help="Sekunden pro Scraper, danach wird er abgebrochen",
+        )
         scrape_parser.add_argument(
-            "--compare", "-c", help="Vergleiche mit existierendem Event"
+            "--cache",
+            nargs="?",
+            const=".cache/http.sqlite",
+            metavar="PFAD",
+            help="HTTP-Cache nutzen (default: .cache/http.sqlite)",
+        )
+        scrape_parser.add_argument(
+            "--save",
+            action="store_true",
+            help="Events als Entwürfe in _events speichern",
+        )
+        scrape_parser.add_argument(
+            "--verbose", "-v", action="store_true", help="Ausgaben der Scraper zeigen"
+        )
+        scrape_parser.add_argument("--output", "-o", help="Output-Datei (JSON)")
+        scrape_parser.add_argument(
+            "--compare",
+            "-c",
+            metavar="DATEI",
+            help="Passendes gescraptes Event mit existierendem Event vergleichen",
         )
 
         # DIFF command
@@ -203,6 +748,14 @@ class EventScraperCLI:
         diff_parser.add_argument("file1", help="Erste Event-Datei")
         diff_parser.add_argument("file2", help="Zweite Event-Datei")
         diff_parser.add_argument("--format", choices=["json", "text"], default="text")
+        diff_parser.add_argument(
+            "--dir",
+            action="store_true",
+            help="Zwei Event-Verzeichnisse vergleichen (Paarung über Event-ID)",
+        )
+        diff_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
+        )
 
         # MERGE command
         merge_parser = subparsers.add_parser("merge", help="Merge Event-Daten")
@@ -213,6 +766,40 @@ class EventScraperCLI:
         )
         merge_parser.add_argument("--output", "-o", required=True, help="Output-Datei")
 
+        # MERGE3 command
+        merge3_parser = subparsers.add_parser(
+            "merge3", help="Three-Way-Merge (Basis, eigene Edits, neuer Scrape)"
+        )
+        merge3_parser.add_argument(
+            "base", help="Basis-Snapshot (Datei oder Verzeichnis)"
+        )
+        merge3_parser.add_argument(
+            "ours", help="Eigene Version (Datei oder Verzeichnis)"
+        )
+        merge3_parser.add_argument(
+            "theirs", help="Neue Version, z.B. frischer Scrape (Datei oder Verzeichnis)"
+        )
+        merge3_parser.add_argument(
+            "--dir",
+            action="store_true",
+            help="Batch-Modus: Verzeichnisse über Event-ID paaren, Ergebnis nach OURS",
+        )
+        merge3_parser.add_argument(
+            "--output", "-o", help="Output-Datei (default: OURS überschreiben)"
+        )
+        merge3_parser.add_argument(
+            "--prefer",
+            choices=["ours", "theirs"],
+            default="ours",
+            help="Welche Seite bei Konflikten gewinnt (default: ours)",
+        )
+        merge3_parser.add_argument(
+            "--dry-run", action="store_true", help="Nur anzeigen, nicht schreiben"
+        )
+        merge3_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
+        )
+
         # GENERATE command
         gen_parser = subparsers.add_parser("generate", help="Generiere Test-Events")
         gen_parser.add_argument(
@@ -222,6 +809,23 @@ class EventScraperCLI:
             "--type", "-t", default="concert", help="Event-Typ (concert, exhibition)"
         )
         gen_parser.add_argument("--output-dir", "-o", help="Output-Verzeichnis")
+        gen_parser.add_argument(
+            "--format",
+            "-f",
+            choices=["json", "markdown"],
+            default="json",
+            help="Dateiformat (markdown = Jekyll-Frontmatter)",
+        )
+        gen_parser.add_argument(
+            "--seed", type=int, help="Seed für reproduzierbare Test-Korpora"
+        )
+        gen_parser.add_argument(
+            "--base-date",
+            help="Bezugsdatum für Event-Termine (Standard: heute, mit --seed 2026-01-01)",
+        )
+        gen_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Generator-Prozesse"
+        )
 
         # BULK command
         bulk_parser = subparsers.add_parser("bulk", help="Bulk-Operationen auf Events")
@@ -231,10 +835,124 @@ class EventScraperCLI:
             metavar=("FIELD", "VALUE"),
             help="Setze Feld in allen Events",
         )
-        bulk_parser.add_argument("--filter", help="Filter Events (JSON query)")
+        bulk_parser.add_argument(
+            "--filter",
+            help='Filter Events (JSON query, z.B. \'{"location.city": "Hof"}\')',
+        )
+        self._add_date_range_arguments(bulk_parser)
         bulk_parser.add_argument(
             "--dry-run", action="store_true", help="Nur anzeigen, nicht ändern"
         )
+        bulk_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
+        )
+        bulk_parser.add_argument(
+            "--write-jobs", type=int, default=4, help="Parallele Schreib-Threads"
+        )
+
+        # SHARD command
+        shard_parser = subparsers.add_parser(
+            "shard", help="Migriere Events in Datums-Unterordner (YYYY/MM/)"
+        )
+        shard_parser.add_argument(
+            "--dry-run", action="store_true", help="Nur anzeigen, nicht verschieben"
+        )
+
+        # DEDUPE command
+        dedupe_parser = subparsers.add_parser(
+            "dedupe", help="Finde doppelte Events (Merge-Kandidaten)"
+        )
+        dedupe_parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.6,
+            help="Minimale Titel-Ähnlichkeit 0..1 (default: 0.6)",
+        )
+        dedupe_parser.add_argument(
+            "--format", choices=["text", "json"], default="text", help="Ausgabeformat"
+        )
+        dedupe_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
+        )
+
+        # IMPORT command
+        import_parser = subparsers.add_parser(
+            "import", help="Importiere Events aus CSV, iCalendar oder JSON/NDJSON"
+        )
+        import_parser.add_argument(
+            "file", help="Export-Datei (.csv, .ics, .json, .ndjson)"
+        )
+        import_parser.add_argument(
+            "--format",
+            choices=["csv", "ics", "json"],
+            help="Format erzwingen (default: aus Dateiendung)",
+        )
+        import_parser.add_argument(
+            "--venue", default="", help="Venue für Zeilen ohne eigene Venue-Spalte"
+        )
+        import_parser.add_argument(
+            "--output-format",
+            choices=["json", "markdown"],
+            default="json",
+            help="Dateiformat der importierten Events",
+        )
+        import_parser.add_argument("--output-dir", "-o", help="Output-Verzeichnis")
+        import_parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Bereits importierte Events überschreiben",
+        )
+        import_parser.add_argument(
+            "--dry-run", action="store_true", help="Zeige nur was importiert würde"
+        )
+        import_parser.add_argument(
+            "--write-jobs", type=int, default=4, help="Parallele Schreib-Threads"
+        )
+
+        # EXPORT command
+        export_parser = subparsers.add_parser(
+            "export", help="Exportiere Events als iCalendar, CSV, NDJSON oder GeoJSON"
+        )
+        export_parser.add_argument(
+            "--format",
+            "-f",
+            choices=["ics", "csv", "ndjson", "geojson"],
+            default="ics",
+            help="Exportformat",
+        )
+        export_parser.add_argument(
+            "--output", "-o", help="Ausgabedatei (default: stdout)"
+        )
+        export_parser.add_argument(
+            "--fields",
+            help="Komma-separierte Felder für csv/ndjson/geojson, z.B. "
+            "title,date,location.city",
+        )
+        export_parser.add_argument("--filter", help="Filter Events (JSON query)")
+        self._add_date_range_arguments(export_parser)
+        export_parser.add_argument(
+            "--name", default="krawl.foundation", help="Kalendername (ics)"
+        )
+        export_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Parser-Prozesse"
+        )
+
+        # VALIDATE command
+        validate_parser = subparsers.add_parser(
+            "validate", help="Prüfe Events gegen das Event-Schema"
+        )
+        validate_parser.add_argument(
+            "files", nargs="*", help="Event-Dateien (default: alle Events)"
+        )
+        validate_parser.add_argument(
+            "--schema", help="Eigenes Schema (JSON, Teilmenge von JSON Schema)"
+        )
+        validate_parser.add_argument(
+            "--format", choices=["text", "json"], default="text", help="Ausgabeformat"
+        )
+        validate_parser.add_argument(
+            "--jobs", "-j", type=int, default=1, help="Parallele Prüf-Prozesse"
+        )
 
         # EXTRACT command (new!)
         extract_parser = subparsers.add_parser(
@@ -256,19 +974,74 @@ class EventScraperCLI:
         )
         extract_parser.add_argument("--fb-token", help="Facebook API Token")
 
+        self._commands = set(subparsers.choices)
         return parser
 
+    def _split_optional_values(self, args: List[str]) -> List[str]:
+        """
+        Keep flags with an optional value from swallowing the command name.
+
+        argparse would read `--index list` as index path 'list'; such flags
+        are rewritten to `--index=<default>` when a command name follows.
+        """
+        optional = {
+            action.option_strings[0]: action.const
+            for action in self.parser._actions
+            if action.nargs == "?" and action.option_strings
+        }
+        result = []
+        for i, arg in enumerate(args):
+            following = args[i + 1] if i + 1 < len(args) else None
+            if arg in optional and following in self._commands:
+                arg = f"{arg}={optional[arg]}"
+            result.append(arg)
+            if following is not None and arg in self._commands:
+                result.extend(args[i + 1 :])
+                break
+        return result
+
+    @staticmethod
+    def _add_date_range_arguments(parser: argparse.ArgumentParser):
+        """Add --from/--to date range options to a subcommand."""
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            metavar="DATUM",
+            help="Nur Events ab Datum (YYYY-MM-DD, DD.MM.YYYY, today, +7d)",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            metavar="DATUM",
+            help="Nur Events bis Datum (inklusive)",
+        )
+
+    def _build_query(self, args):
+        """Compile --filter and --from/--to into one EventQuery, or None."""
+        from cli.event_query import build_query
+
+        return build_query(args.filter, args.date_from, args.date_to)
+
     def run(self, args: List[str] = None):
         """Execute CLI command."""
-        parsed_args = self.parser.parse_args(args)
+        args = sys.argv[1:] if args is None else list(args)
+        parsed_args = self.parser.parse_args(self._split_optional_values(args))
 
         if not parsed_args.command:
             self.parser.print_help()
             return 0
 
+        if parsed_args.import_profile:
+            return self._import_profile([a for a in args if a != "--import-profile"])
+
+        if parsed_args.index:
+            self.manager.use_index(Path(parsed_args.index))
+
         # Route to appropriate handler
         handler = getattr(self, f"cmd_{parsed_args.command}", None)
         if handler:
+            if parsed_args.profile or parsed_args.timings:
+                return self._run_instrumented(handler, parsed_args, args)
             return handler(parsed_args)
         else:
             print(
@@ -276,34 +1049,349 @@ class EventScraperCLI:
             )
             return 1
 
+    def _run_instrumented(self, handler, parsed_args, argv: List[str]) -> int:
+        """Run a command handler under cProfile and/or the phase timer."""
+        from cli import event_timings
+
+        profiler = None
+        if parsed_args.profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+        if parsed_args.timings:
+            event_timings.start()
+
+        try:
+            if profiler is not None:
+                profiler.enable()
+            try:
+                return handler(parsed_args)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+        finally:
+            timer = event_timings.stop()
+            if profiler is not None:
+                self._write_profile(profiler, Path(parsed_args.profile))
+            if timer is not None:
+                report = timer.report(command=parsed_args.command, argv=argv)
+                self._write_timings(report, parsed_args.timings)
+
+    @staticmethod
+    def _write_profile(profiler, path: Path, top: int = 20):
+        """Dump profiler stats and print the most expensive calls to stderr."""
+        import pstats
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+
+        print(
+            f"\n📊 Profil: {path} (ansehen: python -m pstats {path})", file=sys.stderr
+        )
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(top)
+
+    @staticmethod
+    def _write_timings(report: Dict[str, Any], target: str):
+        """Write a timings report as JSON to a file or stderr ('-')."""
+        text = json.dumps(report, indent=2)
+        if target == "-":
+            print(text, file=sys.stderr)
+            return
+
+        path = Path(target)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text + "\n", encoding="utf-8")
+        print(f"⏱️  Timings: {path}", file=sys.stderr)
+
+    def _import_profile(self, argv: List[str], top: Optional[int] = 25) -> int:
+        """
+        Run a command in a fresh interpreter with -X importtime.
+
+        Imports only happen once per process, so the command is re-executed
+        in a child process; its own output is discarded and the top slowest
+        modules by cumulative import time are listed instead (all if None).
+        """
+        import subprocess
+        import time
+
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), *argv],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        wall = time.perf_counter() - start
+
+        modules = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            own, cumulative, name = line[len("import time:") :].split("|", 2)
+            if not own.strip().isdigit():
+                continue  # header line
+            modules.append((int(cumulative), int(own), name.rstrip()))
+
+        total_ms = sum(own for _, own, _ in modules) / 1000
+        print(f"⏱️  {' '.join(argv)}: {wall * 1000:.0f} ms gesamt")
+        print(f"   {len(modules)} Module, {total_ms:.0f} ms Import-Zeit\n")
+        print(f"{'kumuliert':>10} {'selbst':>8}  Modul")
+        for cumulative, own, name in sorted(modules, reverse=True)[:top]:
+            print(f"{cumulative / 1000:8.1f}ms {own / 1000:6.1f}ms  {name}")
+        return proc.returncode
+
     def cmd_list(self, args):
         """List all events."""
-        events = self.manager.list_events()
+        fields = args.fields.split(",") if args.fields else []
+        if args.format == "ndjson" and not fields:
+            fields = ["title", "date", "venue", "status"]
+
+        if args.date_from or args.date_to:
+            fields = fields or ["date", "title"]
+        if fields or args.filter:
+            return self._list_records(args, fields)
+
+        if self.manager.index is not None:
+            self.manager.index.refresh(self.manager, workers=args.jobs)
+            entries = self.manager.index.entries()
+        else:
+            entries = [(e, e.stat().st_size) for e in self.manager.list_events()]
+        events = [event_file for event_file, _ in entries]
 
         if args.format == "json":
             print(json.dumps([str(e) for e in events], indent=2))
         else:
             print(f"\n{'Dateiname':<40} {'Größe':<10}")
             print("-" * 50)
-            for event_file in events:
-                size = event_file.stat().st_size
+            for event_file, size in entries:
                 print(f"{event_file.name:<40} {size:>8} B")
             print(f"\nGesamt: {len(events)} Events")
 
         return 0
 
-    def cmd_scrape(self, args):
-        """Scrape events from URL (placeholder for implementation)."""
-        print(f"🔍 Scraping {args.url}...")
-        print("⚠️  Scraper-Implementation folgt - abhängig von der Ziel-Website")
-        print("\nTipps für Implementation:")
-        print("  - requests + BeautifulSoup4 für HTML-Parsing")
-        print("  - Selenium für JavaScript-heavy Sites")
-        print("  - JSON-API direkter Zugriff wenn verfügbar")
+    def _list_records(self, args, fields: List[str]):
+        """
+        List events with selected metadata fields.
+
+        Records are written as soon as each event is read, so NDJSON output
+        can be piped into jq or the map exporter without buffering the
+        whole archive.
+        """
+        from cli.event_query import QueryError, get_field
+
+        try:
+            query = self._build_query(args)
+        except QueryError as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+
+        events = self.manager.iter_events(workers=args.jobs, query=query)
+        out = sys.stdout
+
+        if args.format == "ndjson":
+            for event_file, event in events:
+                record = {"path": str(event_file)}
+                record.update((field, get_field(event, field)) for field in fields)
+                out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+        elif args.format == "json":
+            out.write("[")
+            for i, (event_file, event) in enumerate(events):
+                record = {"path": str(event_file)}
+                record.update((field, get_field(event, field)) for field in fields)
+                out.write(("," if i else "") + "\n  ")
+                out.write(json.dumps(record, ensure_ascii=False, default=str))
+            out.write("\n]\n")
+        else:
+            columns = [("Dateiname", 40)] + [(field, 20) for field in fields]
+            print("\n" + " ".join(f"{name:<{width}}" for name, width in columns))
+            print("-" * (40 + 21 * len(fields)))
+            count = 0
+            for event_file, event in events:
+                values = [event_file.name] + [
+                    str(get_field(event, field, "")) for field in fields
+                ]
+                print(
+                    " ".join(
+                        f"{value[:width]:<{width}}"
+                        for value, (_, width) in zip(values, columns)
+                    )
+                )
+                count += 1
+            print(f"\nGesamt: {count} Events")
+
         return 0
 
+    def cmd_scrape(self, args):
+        """Run registered venue scrapers, concurrently with --jobs."""
+        from cli.scrapers.registry import discover
+
+        scrapers = discover()
+
+        if args.list:
+            print(f"\n{'Name':<30} {'Venue':<25} {'URL'}")
+            print("-" * 80)
+            for name, cls in scrapers.items():
+                marker = "" if cls.enabled else " (inaktiv)"
+                print(f"{name:<30} {cls.venue_name + marker:<25} {cls.base_url}")
+            return 0
+
+        if args.all:
+            names = [name for name, cls in scrapers.items() if cls.enabled]
+        elif args.venue:
+            unknown = [name for name in args.venue if name not in scrapers]
+            if unknown:
+                print(
+                    f"Fehler: Unbekannter Scraper: {', '.join(unknown)} "
+                    f"(verfügbar: {', '.join(scrapers)})",
+                    file=sys.stderr,
+                )
+                return 1
+            names = args.venue
+        elif args.url:
+            names = self._scrapers_for_url(scrapers, args.url)
+            if not names:
+                print(f"⚠️  Kein Scraper für {args.url} registriert")
+                print("\nNeuen Scraper anlegen: siehe cli/scrapers/README.md")
+                return 1
+        else:
+            print("Fehler: URL, --venue oder --all angeben", file=sys.stderr)
+            return 1
+
+        if args.compare and not self.manager.load_event(Path(args.compare)):
+            print(
+                f"Fehler: Konnte Event-Datei nicht laden: {args.compare}",
+                file=sys.stderr,
+            )
+            return 1
+
+        return self._run_scrapers(names, args, scrapers)
+
+    @staticmethod
+    def _scrapers_for_url(scrapers, url: str) -> List[str]:
+        """Names of the scrapers whose base URL has the same host as url."""
+        from urllib.parse import urlsplit
+
+        host = urlsplit(url).netloc.lower().removeprefix("www.")
+        return [
+            name
+            for name, cls in scrapers.items()
+            if urlsplit(cls.base_url).netloc.lower().removeprefix("www.") == host
+        ]
+
+    def _run_scrapers(self, names: List[str], args, scrapers) -> int:
+        """Run scrapers, print a per-venue report and collect their events."""
+        import time
+
+        from cli.scrapers.registry import run_scrapers
+
+        print(
+            f"🔍 Scrape {len(names)} Venues "
+            f"({min(args.jobs, len(names))} parallel, Timeout {args.timeout:g}s)\n"
+        )
+        print(f"{'Scraper':<30} {'Events':>6} {'Dauer':>8}  Status")
+        print("-" * 60)
+
+        started = time.perf_counter()
+        events, failed = [], 0
+        for result in run_scrapers(
+            names, args.jobs, args.timeout, args.cache, registry=scrapers
+        ):
+            status = f"✗ {result.error}" if result.error else "✓"
+            print(
+                f"{result.name:<30} {len(result.events):>6} "
+                f"{result.duration:>7.1f}s  {status}"
+            )
+            if result.log and (args.verbose or result.error):
+                for line in result.log.rstrip().splitlines():
+                    print(f"    {line}")
+            failed += result.error is not None
+            events.extend(result.events)
+
+        print(
+            f"\nGesamt: {len(events)} Events von {len(names)} Venues "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+        if args.compare:
+            self._compare_scraped(events, Path(args.compare))
+        if args.output:
+            Path(args.output).write_text(json_dumps(events), encoding="utf-8")
+            print(f"✓ Gespeichert: {args.output}")
+        if args.save:
+            self._save_drafts(events)
+        return 1 if failed else 0
+
+    def _compare_scraped(
+        self, events: List[Dict[str, Any]], filepath: Path, threshold: float = 0.6
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Diff an existing event against its counterpart in a scrape.
+
+        The counterpart has the same URL, or else the same day and the most
+        similar title (trigram Jaccard of at least threshold, as in dedupe).
+
+        Returns:
+            The matching scraped event, or None
+        """
+        from cli.event_dedupe import jaccard, normalize_text, trigrams
+        from cli.event_index import normalize_date
+
+        existing = self.manager.load_event(filepath)
+        day = normalize_date(existing.get("date"))
+        title = trigrams(normalize_text(existing.get("title")))
+
+        match, best = None, threshold
+        for event in events:
+            if existing.get("url") and event.get("url") == existing["url"]:
+                match = event
+                break
+            if day is None or normalize_date(event.get("date")) != day:
+                continue
+            similarity = jaccard(title, trigrams(normalize_text(event.get("title"))))
+            if similarity >= best:
+                match, best = event, similarity
+
+        print(f"\nVergleich mit {filepath.name}:")
+        if match is None:
+            print("○ Kein passendes Event im Scrape")
+            return None
+        diff = self.manager.compare_events(existing, match)
+        if diff["identical"]:
+            print("✓ Events sind identisch")
+        else:
+            print("✗ Events unterscheiden sich:\n")
+            self._print_diff(diff)
+        return match
+
+    def _save_drafts(self, events: List[Dict[str, Any]]):
+        """Store scraped events as JSON drafts; existing files are kept."""
+        from cli.event_import import event_filename, unique_path
+
+        taken, existing = set(), 0
+
+        def targets():
+            nonlocal existing
+            for event in events:
+                filename = event_filename(event)
+                path = self.manager.event_path(event, filename)
+                path = unique_path(path, taken)
+                if path is None:
+                    existing += 1
+                    continue
+                yield path, event
+
+        saved = sum(1 for _ in self.manager.save_events(targets()))
+        print(f"✓ {saved} neue Entwürfe in {self.manager.events_dir}")
+        if existing:
+            print(f"○ {existing} bereits vorhanden")
+
     def cmd_diff(self, args):
         """Compare two event files."""
+        if args.dir:
+            return self._diff_dirs(args)
+
         event1 = self.manager.load_event(Path(args.file1))
         event2 = self.manager.load_event(Path(args.file2))
 
@@ -314,26 +1402,82 @@ class EventScraperCLI:
         diff = self.manager.compare_events(event1, event2)
 
         if args.format == "json":
-            print(json.dumps(diff, indent=2, ensure_ascii=False))
+            print(json.dumps(diff, indent=2, ensure_ascii=False, default=str))
         else:
             if diff["identical"]:
                 print("✓ Events sind identisch")
             else:
                 print("✗ Events unterscheiden sich:\n")
+                self._print_diff(diff)
+
+        return 0
 
-                if diff["added_fields"]:
-                    print(f"Neue Felder: {', '.join(diff['added_fields'])}")
+    def _print_diff(self, diff: Dict[str, Any], indent: str = ""):
+        """Print a compare_events result as text."""
+        if diff["added_fields"]:
+            print(f"{indent}Neue Felder: {', '.join(diff['added_fields'])}")
+
+        if diff["removed_fields"]:
+            print(f"{indent}Entfernte Felder: {', '.join(diff['removed_fields'])}")
+
+        if diff["modified_fields"]:
+            print(f"\n{indent}Geänderte Felder:")
+            for field, changes in diff["modified_fields"].items():
+                print(f"\n{indent}  {field}:")
+                if "added" in changes:
+                    for item in changes["added"]:
+                        print(f"{indent}    + {item}")
+                    for item in changes["removed"]:
+                        print(f"{indent}    - {item}")
+                    continue
+                print(f"{indent}    Alt: {changes['old']}")
+                print(f"{indent}    Neu: {changes['new']}")
+
+    def _build_manifest(self, root: Path, workers: int) -> Dict[str, Tuple[Path, str]]:
+        """Build the manifest of an event tree, using the index for _events."""
+        manager = (
+            self.manager if root == self.manager.events_dir else EventManager(root)
+        )
+        return manager.build_manifest(root, manager.iter_events(workers=workers))
+
+    def _diff_dirs(self, args):
+        """Compare two event trees via content-hash manifests."""
+        roots = [Path(args.file1), Path(args.file2)]
+        for root in roots:
+            if not root.is_dir():
+                print(f"Fehler: {root} ist kein Verzeichnis", file=sys.stderr)
+                return 1
 
-                if diff["removed_fields"]:
-                    print(f"Entfernte Felder: {', '.join(diff['removed_fields'])}")
+        old, new = (self._build_manifest(root, args.jobs) for root in roots)
+        result = self.manager.compare_manifests(old, new)
+
+        # Expensive field diff only for the changed subset
+        diffs = {
+            key: self.manager.compare_events(
+                self.manager.load_document(old[key][0]),
+                self.manager.load_document(new[key][0]),
+            )
+            for key in result["changed"]
+        }
 
-                if diff["modified_fields"]:
-                    print("\nGeänderte Felder:")
-                    for field, changes in diff["modified_fields"].items():
-                        print(f"\n  {field}:")
-                        print(f"    Alt: {changes['old']}")
-                        print(f"    Neu: {changes['new']}")
+        if args.format == "json":
+            result = dict(result, changed=diffs)
+            print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+            return 0
 
+        print(f"Vergleiche {roots[0]} → {roots[1]}\n")
+        for key in result["added"]:
+            print(f"  + {key}")
+        for key in result["removed"]:
+            print(f"  - {key}")
+        for key, diff in diffs.items():
+            print(f"\n  ~ {key} ({old[key][0].name} → {new[key][0].name})")
+            self._print_diff(diff, indent="    ")
+
+        print(
+            f"\nNeu: {len(result['added'])}, Entfernt: {len(result['removed'])}, "
+            f"Geändert: {len(result['changed'])}, Unverändert: {result['unchanged']}"
+        )
         return 0
 
     def cmd_merge(self, args):
@@ -357,52 +1501,413 @@ class EventScraperCLI:
 
         return 0
 
+    def cmd_merge3(self, args):
+        """Three-way merge of event files or whole event trees."""
+        if args.dir:
+            return self._merge3_dirs(args)
+
+        base, ours, theirs = (
+            self.manager.load_event(Path(p))
+            for p in (args.base, args.ours, args.theirs)
+        )
+        if not ours or not theirs:
+            print("Fehler: Konnte Event-Dateien nicht laden", file=sys.stderr)
+            return 1
+
+        merged, conflicts = self.manager.merge3_events(base, ours, theirs, args.prefer)
+        self._print_conflicts(Path(args.ours).name, conflicts)
+
+        output_path = Path(args.output or args.ours)
+        if not args.dry_run and merged != ours:
+            self.manager.save_event(merged, output_path)
+        print(f"✓ Events gemerged → {output_path}")
+
+        return 0
+
+    def _print_conflicts(self, name: str, conflicts: Dict[str, Dict[str, Any]]):
+        """Print merge conflicts of one event."""
+        if not conflicts:
+            return
+        print(f"⚠️  Konflikte in {name}:")
+        for field, values in conflicts.items():
+            print(f"    {field}: ours={values['ours']!r} theirs={values['theirs']!r}")
+
+    def _merge3_dirs(self, args):
+        """Three-way merge whole event trees, pairing events by id."""
+        roots = [Path(args.base), Path(args.ours), Path(args.theirs)]
+        for root in roots:
+            if not root.is_dir():
+                print(f"Fehler: {root} ist kein Verzeichnis", file=sys.stderr)
+                return 1
+
+        base, ours, theirs = (self._build_manifest(root, args.jobs) for root in roots)
+
+        stats = {
+            "merged": 0,
+            "added": 0,
+            "unchanged": 0,
+            "deleted": 0,
+            "conflicts": 0,
+        }
+        conflicted = []
+        delete_conflicts = []
+
+        def changes():
+            for key, (theirs_path, theirs_hash) in theirs.items():
+                if key not in ours:
+                    target = roots[1] / theirs_path.relative_to(roots[2])
+                    if key not in base:
+                        # New upstream event: take it as-is, body included
+                        stats["added"] += 1
+                        yield target, self.manager.load_document(theirs_path)
+                    elif theirs_hash == base[key][1]:
+                        # Deleted by us, untouched upstream: stays deleted
+                        stats["deleted"] += 1
+                    else:
+                        # Deleted by us, changed upstream: delete/modify conflict
+                        stats["conflicts"] += 1
+                        delete_conflicts.append(theirs_path.name)
+                        if args.prefer == "theirs":
+                            stats["added"] += 1
+                            yield target, self.manager.load_document(theirs_path)
+                        else:
+                            stats["deleted"] += 1
+                    continue
+
+                ours_path, ours_hash = ours[key]
+                base_hash = base[key][1] if key in base else None
+                if theirs_hash in (ours_hash, base_hash):
+                    stats["unchanged"] += 1
+                    continue
+
+                merged, conflicts = self.manager.merge3_events(
+                    self.manager.load_document(base[key][0]) if key in base else {},
+                    self.manager.load_document(ours_path),
+                    self.manager.load_document(theirs_path),
+                    args.prefer,
+                )
+                if conflicts:
+                    stats["conflicts"] += 1
+                    conflicted.append((ours_path.name, conflicts))
+                stats["merged"] += 1
+                yield ours_path, merged
+
+        if args.dry_run:
+            for _ in changes():
+                pass
+        else:
+            for _ in self.manager.save_events(changes()):
+                pass
+
+        for name, conflicts in conflicted:
+            self._print_conflicts(name, conflicts)
+        for name in delete_conflicts:
+            kept = "wiederhergestellt" if args.prefer == "theirs" else "bleibt gelöscht"
+            print(f"⚠️  Konflikt in {name}: lokal gelöscht, upstream geändert ({kept})")
+        print(
+            f"\n{'[DRY RUN] ' if args.dry_run else ''}"
+            f"Gemerged: {stats['merged']}, Neu: {stats['added']}, "
+            f"Unverändert: {stats['unchanged']}, Gelöscht: {stats['deleted']}, "
+            f"Mit Konflikten: {stats['conflicts']}"
+        )
+        return 0
+
     def cmd_generate(self, args):
         """Generate test events."""
+        from cli.event_generator import generate_corpus
+        from cli.event_query import QueryError, parse_date_arg
+
         output_dir = (
             Path(args.output_dir) if args.output_dir else self.manager.events_dir
         )
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"🎲 Generiere {args.count} Test-Events ({args.type})...\n")
+        base_date = None
+        if args.base_date:
+            try:
+                base_date = date.fromisoformat(parse_date_arg(args.base_date))
+            except QueryError as e:
+                print(f"Fehler: {e}", file=sys.stderr)
+                return 1
 
-        for i in range(args.count):
-            event = self.manager.generate_test_event(args.type)
-            filename = f"test-{args.type}-{i+1:03d}.json"
-            filepath = output_dir / filename
+        print(f"🎲 Generiere {args.count} Test-Events ({args.type})...\n")
 
-            self.manager.save_event(event, filepath)
-            print(f"  ✓ {filename} - {event['title']}")
+        # Per-file output only for small runs, progress per block otherwise
+        verbose = args.count <= 100
+        done = 0
+        for written in generate_corpus(
+            output_dir,
+            args.count,
+            event_type=args.type,
+            format=args.format,
+            seed=args.seed,
+            base_date=base_date,
+            workers=args.jobs,
+            sharded=(
+                self.manager.sharded if output_dir == self.manager.events_dir else False
+            ),
+        ):
+            done += len(written)
+            if verbose:
+                for filepath, title in written:
+                    print(f"  ✓ {filepath.name} - {title}")
+            else:
+                print(f"  ✓ {done}/{args.count}")
 
         print(f"\n✓ {args.count} Events erstellt in {output_dir}")
         return 0
 
     def cmd_bulk(self, args):
         """Bulk operations on events."""
-        events = self.manager.list_events()
         modified_count = 0
 
+        from cli.event_query import QueryError
+
+        try:
+            query = self._build_query(args)
+        except QueryError as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+
         if args.set_field:
             field, value = args.set_field
+            scope = "passende Events" if query else "alle Events"
             print(
-                f"{'[DRY RUN] ' if args.dry_run else ''}Setze {field}={value} für alle Events...\n"
+                f"{'[DRY RUN] ' if args.dry_run else ''}Setze {field}={value} für {scope}...\n"
             )
 
-            for event_file in events:
-                event = self.manager.load_event(event_file)
-                if event:
+            unchanged_count = 0
+
+            def changes():
+                # Skip events that already carry the value: no write, no git churn
+                nonlocal unchanged_count
+                for event_file, event in self.manager.iter_events(
+                    workers=args.jobs, query=query
+                ):
+                    if event.get(field) == value:
+                        unchanged_count += 1
+                        continue
                     event[field] = value
+                    yield event_file, event
 
-                    if not args.dry_run:
-                        self.manager.save_event(event, event_file)
+            if args.dry_run:
+                written = (event_file for event_file, _ in changes())
+            else:
+                written = self.manager.save_events(changes(), workers=args.write_jobs)
 
-                    print(f"  {'✓' if not args.dry_run else '○'} {event_file.name}")
-                    modified_count += 1
+            for event_file in written:
+                print(f"  {'✓' if not args.dry_run else '○'} {event_file.name}")
+                modified_count += 1
 
             print(
                 f"\n{'Würde ändern' if args.dry_run else 'Geändert'}: {modified_count} Events"
             )
+            if unchanged_count:
+                print(f"Unverändert (Wert bereits gesetzt): {unchanged_count} Events")
+
+        return 0
+
+    def cmd_shard(self, args):
+        """Move flat event files into date shards."""
+        print(
+            f"{'[DRY RUN] ' if args.dry_run else ''}"
+            f"Verschiebe Events nach {self.manager.events_dir}/YYYY/MM/ ...\n"
+        )
+
+        moved = 0
+        for old_path, new_path in self.manager.shard_events(dry_run=args.dry_run):
+            print(f"  {'○' if args.dry_run else '✓'} {old_path.name} → {new_path}")
+            moved += 1
+
+        print(
+            f"\n{'Würde verschieben' if args.dry_run else 'Verschoben'}: {moved} Events"
+        )
+        return 0
+
+    def cmd_import(self, args):
+        """Import events from CSV, iCalendar or JSON exports."""
+        from cli import event_import
+
+        source = Path(args.file)
+        try:
+            importer = event_import.FileImporter(
+                source, venue_name=args.venue, format=args.format
+            )
+        except event_import.ImportFileError as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+        if not source.is_file():
+            print(f"Fehler: Datei nicht gefunden: {source}", file=sys.stderr)
+            return 1
+
+        output_dir = Path(args.output_dir) if args.output_dir else None
+        suffix = ".md" if args.output_format == "markdown" else ".json"
+        print(
+            f"{'[DRY RUN] ' if args.dry_run else ''}"
+            f"Importiere {source} ({importer.format})...\n"
+        )
+
+        existing = 0
+        taken = set()
+
+        def targets():
+            nonlocal existing
+            for event in importer.iter_events():
+                filename = event_import.event_filename(event, suffix)
+                if output_dir is not None:
+                    path = output_dir / filename
+                else:
+                    path = self.manager.event_path(event, filename)
+                path = event_import.unique_path(path, taken, overwrite=args.overwrite)
+                if path is None:
+                    existing += 1
+                    continue
+                if args.output_format == "markdown":
+                    event = event_import.markdown_event(event)
+                yield path, event
+
+        try:
+            if args.dry_run:
+                written = (path for path, _ in targets())
+            else:
+                written = self.manager.save_events(targets(), workers=args.write_jobs)
+
+            count = 0
+            for path in written:
+                count += 1
+                if count <= 20:
+                    print(f"  {'○' if args.dry_run else '✓'} {path.name}")
+                elif count % 1000 == 0:
+                    print(f"  ... {count}")
+        except (event_import.ImportFileError, UnicodeDecodeError) as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+
+        print(
+            f"\n{'Würde importieren' if args.dry_run else 'Importiert'}: {count} Events"
+        )
+        if existing:
+            print(f"Übersprungen (existiert bereits): {existing} Events")
+        if importer.skipped:
+            print(
+                f"Übersprungen (ungültig, z.B. ohne Titel/Datum/Venue): {importer.skipped}"
+            )
+        return 0
+
+    def cmd_export(self, args):
+        """Export events as iCalendar, CSV, NDJSON or GeoJSON."""
+        from cli.event_export import export_events
+        from cli.event_query import QueryError
+
+        try:
+            query = self._build_query(args)
+        except QueryError as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+
+        fields = args.fields.split(",") if args.fields else None
+        options = {"name": args.name} if args.format == "ics" else {}
+        events = self.manager.iter_events(workers=args.jobs, query=query)
+
+        if not args.output:
+            exported, skipped = export_events(
+                events, sys.stdout, args.format, fields, **options
+            )
+            report = sys.stderr
+        else:
+            # Write next to the target and rename, so subscribers never
+            # fetch a half-written calendar
+            output = Path(args.output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                    exported, skipped = export_events(
+                        events, f, args.format, fields, **options
+                    )
+                os.replace(tmp_path, output)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            report = sys.stdout
+
+        target = args.output or "stdout"
+        print(f"✓ {exported} Events exportiert ({args.format}) → {target}", file=report)
+        if skipped:
+            reason = "ohne Titel/Datum" if args.format == "ics" else "ohne Koordinaten"
+            print(f"○ {skipped} Events übersprungen ({reason})", file=report)
+        return 0
+
+    def cmd_validate(self, args):
+        """Validate events against the event schema."""
+        from cli.event_schema import compile_schema, validate_files
+
+        schema = None
+        if args.schema:
+            try:
+                schema = json.loads(Path(args.schema).read_text(encoding="utf-8"))
+                compile_schema(schema)
+            except (OSError, ValueError) as e:
+                print(f"Fehler: Ungültiges Schema: {e}", file=sys.stderr)
+                return 1
+
+        if args.files:
+            paths = [Path(f) for f in args.files]
+        else:
+            # Documentation next to the events is not an event
+            paths = [p for p in self.manager.list_events() if p.name != "README.md"]
+
+        checked = 0
+        invalid = []
+        for filepath, errors in validate_files(
+            self.manager.events_dir, paths, schema=schema, workers=args.jobs
+        ):
+            checked += 1
+            if errors:
+                invalid.append({"file": str(filepath), "errors": errors})
+                if args.format == "text":
+                    print(f"  ✗ {filepath}")
+                    for error in errors:
+                        print(f"      - {error}")
+
+        if args.format == "json":
+            print(json.dumps(invalid, indent=2, ensure_ascii=False))
+        elif invalid:
+            print(f"\n⚠️  {len(invalid)} von {checked} Events fehlerhaft")
+        else:
+            print(f"✓ {checked} Events gültig")
+
+        return 1 if invalid else 0
+
+    def cmd_dedupe(self, args):
+        """Find near-duplicate events."""
+        from cli.event_dedupe import DuplicateFinder
+
+        finder = DuplicateFinder(threshold=args.threshold)
+        candidates = finder.find(self.manager.iter_events(workers=args.jobs))
+
+        if args.format == "json":
+            print(
+                json.dumps(
+                    [
+                        dict(c, base=str(c["base"]), updates=str(c["updates"]))
+                        for c in candidates
+                    ],
+                    indent=2,
+                    ensure_ascii=False,
+                )
+            )
+            return 0
+
+        if not candidates:
+            print("✓ Keine Duplikate gefunden")
+            return 0
 
+        print(f"🔍 {len(candidates)} Merge-Kandidaten:\n")
+        for candidate in candidates:
+            print(f"  {candidate['similarity']:.2f}  {candidate['base']}")
+            print(f"        ← {candidate['updates']}")
+        print("\nMergen mit: merge <base> <updates> -o <base>")
         return 0
 
     def cmd_extract(self, args):
@@ -481,7 +1986,12 @@ class EventScraperCLI:
 def main():
     """Main entry point."""
     cli = EventScraperCLI()
-    sys.exit(cli.run())
+    try:
+        sys.exit(cli.run())
+    except BrokenPipeError:
+        # Downstream consumer (e.g. `| head`) closed the stream early
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(0)
 
 
 if __name__ == "__main__":
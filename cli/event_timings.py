@@ -0,0 +1,180 @@
+"""
+Event Timings - Phasen-Messung für CLI-Läufe
+
+Hot Paths des EventManagers melden ihre Arbeit über phase("load"),
+phase("parse"), phase("transform") und phase("write"). Solange keine
+Messung aktiv ist, kostet das nur einen Funktionsaufruf.
+
+Phasen:
+    load       Dateien finden und lesen (inkl. Worker-Prozessen bei --jobs)
+    parse      JSON/YAML dekodieren
+    transform  Filtern, Vergleichen, Mergen
+    write      Events rendern und schreiben
+"""
+
+import functools
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+PHASES = ("load", "parse", "transform", "write")
+
+
+class _NullPhase:
+    """Shared no-op context manager used while no timer is active."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Context manager adding one measurement to a PhaseTimer."""
+
+    __slots__ = ("timer", "name", "wall", "cpu")
+
+    def __init__(self, timer: "PhaseTimer", name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(
+            self.name,
+            time.perf_counter() - self.wall,
+            time.thread_time() - self.cpu,
+        )
+        return False
+
+
+class PhaseTimer:
+    """
+    Accumulate wall and CPU time per phase.
+
+    CPU time is measured per thread, so phases running in the bulk writer
+    threads are attributed correctly. Phases are not nested; work in worker
+    processes shows up as wall time of the waiting phase and in the
+    children CPU time of the report.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Dict[str, float]] = {}
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def phase(self, name: str) -> _Phase:
+        """Context manager measuring one occurrence of a phase."""
+        return _Phase(self, name)
+
+    def add(self, name: str, wall: float, cpu: float):
+        """Record one occurrence of a phase."""
+        with self._lock:
+            entry = self._phases.get(name)
+            if entry is None:
+                entry = self._phases[name] = {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0}
+            entry["calls"] += 1
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+
+    def report(self, **extra: Any) -> Dict[str, Any]:
+        """
+        Summarize the run as a JSON-serializable dict.
+
+        Args:
+            **extra: Additional top-level fields (e.g. command, argv)
+        """
+        phases = {
+            name: {
+                "calls": entry["calls"],
+                "wall_s": round(entry["wall_s"], 6),
+                "cpu_s": round(entry["cpu_s"], 6),
+            }
+            for name, entry in sorted(
+                self._phases.items(),
+                key=lambda item: (
+                    PHASES.index(item[0]) if item[0] in PHASES else len(PHASES),
+                    item[0],
+                ),
+            )
+        }
+        report = dict(extra)
+        report["wall_s"] = round(time.perf_counter() - self._wall, 6)
+        report["cpu_s"] = round(time.process_time() - self._cpu, 6)
+        report.update(_resource_usage())
+        report["phases"] = phases
+        return report
+
+
+def _resource_usage() -> Dict[str, Optional[float]]:
+    """Peak RSS of this process and its children, plus children CPU time."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return {
+            "peak_rss_mb": None,
+            "children_peak_rss_mb": None,
+            "children_cpu_s": None,
+        }
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {
+        "peak_rss_mb": round(own.ru_maxrss / scale, 1),
+        "children_peak_rss_mb": round(children.ru_maxrss / scale, 1),
+        "children_cpu_s": round(children.ru_utime + children.ru_stime, 6),
+    }
+
+
+_active: Optional[PhaseTimer] = None
+
+
+def phase(name: str):
+    """Measure a phase if a timer is active, otherwise do nothing."""
+    if _active is None:
+        return _NULL_PHASE
+    return _active.phase(name)
+
+
+def timed_phase(name: str) -> Callable:
+    """Decorator measuring every call of a function as the given phase."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def start() -> PhaseTimer:
+    """Activate a new process-wide timer."""
+    global _active
+    _active = PhaseTimer()
+    return _active
+
+
+def stop() -> Optional[PhaseTimer]:
+    """Deactivate and return the process-wide timer."""
+    global _active
+    timer, _active = _active, None
+    return timer
@@ -1,13 +1,51 @@
 """
 Base Scraper Class - Template für alle Scraper-Implementierungen
+
+requests und BeautifulSoup werden erst bei Bedarf importiert, damit das
+Laden des Scraper-Pakets (z.B. für die Registry) billig bleibt.
+
+Für Crawls über viele Seiten gibt es afetch_page/afetch_many: die Requests
+laufen parallel über die Keep-Alive-Verbindungen der Session, pro Host aber
+höchstens max_per_host gleichzeitig.
 """
 
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from .throttle import HostRateLimiter, RetryPolicy
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import requests
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+    from .http_cache import HttpCache
+
+# Threads für blockierende Requests, geteilt von allen Scrapern im Prozess
+MAX_FETCH_THREADS = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
 
-import requests
-from bs4 import BeautifulSoup
+def _fetch_executor():
+    """Shared thread pool running blocking fetches for the async API."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_FETCH_THREADS, thread_name_prefix="fetch"
+            )
+        return _executor
 
 
 class BaseScraper(ABC):
@@ -18,50 +56,234 @@ class BaseScraper(ABC):
     die scrape() Methode implementieren.
     """
 
-    def __init__(self, base_url: str, venue_name: str):
+    # Venue-Daten; Unterklassen setzen sie als Klassenattribute, damit die
+    # Registry sie ohne Instanz anzeigen kann
+    base_url = ""
+    venue_name = ""
+
+    # Selektor der Event-Container, z.B. "div.event": parse_containers baut
+    # dann nur diese Teilbäume statt der ganzen Seite auf
+    container_selector: Optional[str] = None
+
+    # Inaktive Scraper (z.B. Vorlagen) laufen nicht bei scrape --all
+    enabled = True
+
+    # Gleichzeitige Requests pro Host (afetch_page/afetch_many)
+    max_per_host = 4
+
+    # Request-Timeout in Sekunden
+    timeout = 10
+
+    # Geteilt von allen Scrapern im Prozess (siehe throttle.py)
+    rate_limiter = HostRateLimiter()
+    retry = RetryPolicy()
+
+    # Persistenter Response-Cache, z.B. BaseScraper.cache = HttpCache()
+    cache: Optional["HttpCache"] = None
+
+    def __init__(
+        self, base_url: Optional[str] = None, venue_name: Optional[str] = None
+    ):
         """
         Initialize scraper.
 
         Args:
-            base_url: Base URL of the venue website
-            venue_name: Name of the venue
-        """
-        self.base_url = base_url
-        self.venue_name = venue_name
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "krawl.foundation/1.0 (Event Scraper Bot)"}
-        )
+            base_url: Base URL of the venue website (default: class attribute)
+            venue_name: Name of the venue (default: class attribute)
+        """
+        if base_url is not None:
+            self.base_url = base_url
+        if venue_name is not None:
+            self.venue_name = venue_name
+        self._session = None
+        self._host_limits: Dict[str, "asyncio.Semaphore"] = {}
+        self._limits_loop = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session, created on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            # One keep-alive pool per host, large enough for parallel fetches
+            adapter = HTTPAdapter(
+                pool_connections=16, pool_maxsize=max(self.max_per_host, 10)
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._session.headers.update(
+                {"User-Agent": "krawl.foundation/1.0 (Event Scraper Bot)"}
+            )
+        return self._session
+
+    @session.setter
+    def session(self, session: "requests.Session"):
+        self._session = session
 
     def fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch HTML content from URL.
 
+        Requests are paced by the shared per-host rate limiter; connection
+        errors, 429 and 5xx responses are retried with backoff. With a cache
+        configured, a cached page is revalidated with a conditional request
+        and reused if the server answers 304.
+
         Args:
             url: URL to fetch
 
         Returns:
             HTML content or None if error
         """
+        import requests
+
+        cache = self.cache
+        cached = cache.get(url) if cache is not None else None
+        headers = cache.conditional_headers(cached) if cached is not None else None
+
         try:
-            response = self.session.get(url, timeout=10)
+            response = self._get(url, headers)
+            if cached is not None and response.status_code == 304:
+                cache.revalidated(url, response)
+                return cached.text
             response.raise_for_status()
+            if cache is not None:
+                cache.store(url, response)
             return response.text
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
 
-    def parse_html(self, html: str) -> BeautifulSoup:
+    def _get(self, url: str, headers=None) -> "requests.Response":
+        """GET with rate limiting and retries; returns the last response."""
+        import requests
+
+        attempt = 0
+        while True:
+            self.rate_limiter.wait(url)
+            try:
+                response = self.session.get(url, timeout=self.timeout, headers=headers)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self.retry.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry.delay(attempt, response)
+                if delay is None:
+                    return response
+                if response.status_code == 429:
+                    # Throttled: hold back every request to this host
+                    self.rate_limiter.block(url, delay)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _host_limit(self, url: str) -> "asyncio.Semaphore":
+        """Semaphore limiting concurrent requests to the host of url."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is not loop:
+            # Semaphores are bound to the loop they were first used in
+            self._host_limits = {}
+            self._limits_loop = loop
+        host = urlsplit(url).netloc.lower()
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    async def afetch_page(self, url: str) -> Optional[str]:
+        """
+        Fetch HTML content without blocking the event loop.
+
+        Runs fetch_page on the shared fetch threads, so subclasses that
+        override fetch_page get the same behaviour in both APIs.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content or None if error
+        """
+        import asyncio
+
+        async with self._host_limit(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_fetch_executor(), self.fetch_page, url)
+
+    async def afetch_many(
+        self, urls: Iterable[str], concurrency: int = 16
+    ) -> List[Optional[str]]:
+        """
+        Fetch many pages concurrently.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum requests in flight across all hosts
+
+        Returns:
+            HTML content (or None) for every URL, in input order
+        """
+        import asyncio
+
+        overall = asyncio.Semaphore(concurrency)
+
+        async def fetch(url):
+            async with overall:
+                return await self.afetch_page(url)
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
+
+    def fetch_many(
+        self, urls: Iterable[str], concurrency: int = 16
+    ) -> List[Optional[str]]:
+        """Blocking wrapper around afetch_many for synchronous scrape()."""
+        import asyncio
+
+        return asyncio.run(self.afetch_many(urls, concurrency))
+
+    def parse_html(self, html: str, selector: Optional[str] = None) -> "BeautifulSoup":
         """
         Parse HTML content with BeautifulSoup.
 
         Args:
             html: HTML content string
+            selector: Only build the subtrees matching this selector
+                ("tag", "tag.class", ".class" or "tag#id")
 
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(html, "lxml")
+        from bs4 import BeautifulSoup
+
+        strainer = _strainer(selector) if selector else None
+        return BeautifulSoup(html, "lxml", parse_only=strainer)
+
+    def parse_containers(
+        self, html: str, selector: Optional[str] = None
+    ) -> List["Tag"]:
+        """
+        Parse only the event containers of a page.
+
+        Everything outside the containers is skipped while parsing, which
+        is much faster and leaner than building the full tree for large
+        pages.
+
+        Args:
+            html: HTML content string
+            selector: Container selector (default: container_selector)
+
+        Returns:
+            Container elements in document order
+        """
+        selector = selector or self.container_selector
+        if not selector:
+            raise ValueError(f"{type(self).__name__}: container_selector fehlt")
+        soup = self.parse_html(html, selector)
+        return soup.find_all(_strainer(selector), recursive=False)
 
     @abstractmethod
     def scrape(self) -> List[Dict[str, Any]]:
@@ -85,20 +307,23 @@ class BaseScraper(ABC):
         Returns:
             Normalized event dictionary
         """
-        return {
-            "title": raw_event.get("title", "").strip(),
+        normalized = {
+            "title": _clean(raw_event.get("title")),
             "date": self._parse_date(raw_event.get("date")),
-            "venue": self.venue_name,
-            "location": raw_event.get("location", "").strip(),
-            "description": raw_event.get("description", "").strip(),
-            "price": raw_event.get("price", "").strip(),
-            "url": raw_event.get("url", "").strip(),
-            "genre": raw_event.get("genre", "").strip(),
-            "image_url": raw_event.get("image_url", "").strip(),
+            "venue": _clean(raw_event.get("venue")) or self.venue_name,
+            "location": _clean(raw_event.get("location")),
+            "description": _clean(raw_event.get("description")),
+            "price": _clean(raw_event.get("price")),
+            "url": _clean(raw_event.get("url")),
+            "genre": _clean(raw_event.get("genre")),
+            "image_url": _clean(raw_event.get("image_url")),
             "status": "draft",
             "scraped_at": datetime.now().isoformat(),
             "source": self.base_url,
         }
+        if raw_event.get("end_date"):
+            normalized["end_date"] = self._parse_date(raw_event["end_date"])
+        return normalized
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[str]:
         """
@@ -119,6 +344,9 @@ class BaseScraper(ABC):
             "%d.%m.%Y",
             "%d/%m/%Y",
             "%Y-%m-%d %H:%M:%S",
+            "%Y-%m-%d %H:%M",
+            "%Y-%m-%dT%H:%M:%S",
+            "%Y-%m-%dT%H:%M",
             "%d.%m.%Y %H:%M",
         ]
 
@@ -148,3 +376,37 @@ class BaseScraper(ABC):
                 return False
 
         return True
+
+
+_SELECTOR = re.compile(r"^([a-zA-Z][\w-]*)?(?:([.#])([\w-]+))?$")
+
+
+@lru_cache(maxsize=None)
+def _strainer(selector: str) -> "SoupStrainer":
+    """Compile a simple selector ("div.event", ".event", "ul#program") once."""
+    from bs4 import SoupStrainer
+
+    match = _SELECTOR.match(selector.strip())
+    if not match or not (match[1] or match[3]):
+        raise ValueError(
+            f"Nicht unterstützter Selektor: {selector!r} "
+            "(erlaubt: tag, tag.klasse, .klasse, tag#id)"
+        )
+    name, kind, value = match.groups()
+    if kind == ".":
+        # While parsing, class is still the raw string ("event featured")
+        attrs = {"class": re.compile(rf"(?:^|\s){re.escape(value)}(?:\s|$)")}
+    elif kind == "#":
+        attrs = {"id": value}
+    else:
+        attrs = {}
+    return SoupStrainer(name, attrs)
+
+
+def _clean(value: Any) -> Any:
+    """Strip strings, map missing values to "" and keep structured values."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return value
@@ -22,8 +22,13 @@ class ExampleVenueScraper(BaseScraper):
     - Etc.
     """
 
+    base_url = "https://example.com"
+    venue_name = "Example Venue"
+    enabled = False  # Vorlage, keine echte Venue
+    container_selector = "div.event"
+
     def __init__(self):
-        super().__init__(base_url="https://example.com", venue_name="Example Venue")
+        super().__init__()
         self.events_page = f"{self.base_url}/events"
 
     def scrape(self) -> List[Dict[str, Any]]:
@@ -38,11 +43,8 @@ class ExampleVenueScraper(BaseScraper):
         if not html:
             return []
 
-        # 2. Parse HTML
-        soup = self.parse_html(html)
-
-        # 3. Find all event containers
-        event_containers = soup.find_all("div", class_="event")
+        # 2. + 3. Parse only the event containers (container_selector)
+        event_containers = self.parse_containers(html)
 
         events = []
         for container in event_containers:
@@ -15,6 +15,7 @@ Alternative Ansätze:
 4. Manuelle Dateneingabe mit generate-Command
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -37,24 +38,19 @@ class GaleriehausHofFacebookScraper(BaseScraper):
     Falls Selenium nicht verfügbar, gibt Anleitung für manuelle Erfassung.
     """
 
+    base_url = "https://www.facebook.com/GaleriehausHof"
+    venue_name = "Galeriehaus Hof"
+
     def __init__(self):
-        super().__init__(
-            base_url="https://www.facebook.com/GaleriehausHof",
-            venue_name="Galeriehaus Hof",
-        )
+        super().__init__()
         self.events_page = f"{self.base_url}/events"
         self.use_selenium = False
 
-        # Prüfe ob Selenium verfügbar
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-
+        # Prüfe ob Selenium verfügbar (ohne es schon zu importieren)
+        if importlib.util.find_spec("selenium") is not None:
             self.use_selenium = True
             print("✓ Selenium verfügbar - verwende Browser-Automation")
-        except ImportError:
+        else:
             print("⚠️  Selenium nicht installiert")
             print("   Installation: pip install selenium")
             print("   Plus: geckodriver (Firefox) oder chromedriver (Chrome)")
@@ -185,8 +181,8 @@ class GaleriehausHofFacebookScraper(BaseScraper):
         print("   Dann manuell editieren: _events/test-*.json")
         print()
         print("📋 Option 4: CSV/JSON Import")
-        print("   Exportiere Events aus Facebook manuell als CSV")
-        print("   Konvertiere mit separatem Script")
+        print("   Exportiere Events aus Facebook manuell als CSV/ICS")
+        print("   ./cli/event_scraper.py import export.csv --venue 'Galeriehaus Hof'")
         print("=" * 60 + "\n")
 
         return []
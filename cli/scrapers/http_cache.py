@@ -0,0 +1,169 @@
+"""
+HTTP Cache - Persistenter Response-Cache für Scraper
+
+Speichert Seiten zusammen mit ETag/Last-Modified in SQLite. Beim nächsten
+Abruf schickt fetch_page einen bedingten Request (If-None-Match /
+If-Modified-Since); antwortet der Server mit 304, wird die gespeicherte Seite
+verwendet, ohne sie erneut herunterzuladen. Wird der Cache größer als
+max_bytes, fliegen die am längsten nicht genutzten Einträge raus (LRU).
+
+Aktiviert wird der Cache für alle Scraper eines Prozesses über
+BaseScraper.cache = HttpCache().
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_CACHE_PATH = Path(".cache/http.sqlite")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CachedPage(NamedTuple):
+    """A cached response body with its validators."""
+
+    body: bytes
+    encoding: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+
+class HttpCache:
+    """Persistent response cache with conditional revalidation and LRU eviction."""
+
+    def __init__(
+        self, db_path: Path = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Args:
+            db_path: SQLite file, created if missing
+            max_bytes: Upper bound for the sum of cached bodies
+        """
+        import sqlite3
+
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Fetches run on the shared fetch threads, so the connection is
+        # shared between threads and guarded by a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                encoding TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_used ON pages (used);
+            """)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Cached page for url, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, encoding, etag, last_modified FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CachedPage(*row) if row else None
+
+    @staticmethod
+    def conditional_headers(page: CachedPage) -> Dict[str, str]:
+        """Request headers revalidating a cached page."""
+        headers = {}
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def store(self, url: str, response: "requests.Response") -> bool:
+        """
+        Cache a 200 response if it carries validators.
+
+        Responses without ETag or Last-Modified cannot be revalidated and
+        are not stored.
+
+        Returns:
+            True if the response was cached
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in response.headers.get(
+            "Cache-Control", ""
+        ):
+            return False
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return False
+        encoding = response.encoding or response.apparent_encoding or "utf-8"
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, body, encoding, etag, last_modified, size, used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, encoding, etag, last_modified, len(body), time.time()),
+            )
+            self._evict()
+        return True
+
+    def revalidated(self, url: str, response: "requests.Response"):
+        """Mark a page as used after a 304 and pick up refreshed validators."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE pages SET used = ?, "
+                "etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (
+                    time.time(),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    url,
+                ),
+            )
+
+    def _evict(self):
+        """Drop least recently used pages until the cache fits max_bytes."""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        excess = total[0] - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for url, size in self.conn.execute("SELECT url, size FROM pages ORDER BY used"):
+            victims.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM pages WHERE url = ?", victims)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of cached pages and their total size in bytes."""
+        with self._lock:
+            pages, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+        return {"pages": pages, "bytes": size}
+
+    def clear(self):
+        """Remove all cached pages."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM pages")
+
+    def close(self):
+        self.conn.close()
@@ -15,6 +15,7 @@ Empfohlene Alternativen:
 4. Manuelle Erfassung
 """
 
+import importlib.util
 import re
 import sys
 from pathlib import Path
@@ -40,19 +41,18 @@ class PunkImHofInstagramScraper(BaseScraper):
     3. Manuelle Erfassung
     """
 
+    base_url = "https://www.instagram.com/punkinhof"
+    venue_name = "Punk im Hof"
+
     def __init__(self):
-        super().__init__(
-            base_url="https://www.instagram.com/punkinhof", venue_name="Punk im Hof"
-        )
+        super().__init__()
         self.use_instaloader = False
 
-        # Prüfe ob instaloader verfügbar
-        try:
-            import instaloader
-
+        # Prüfe ob instaloader verfügbar (ohne es schon zu importieren)
+        if importlib.util.find_spec("instaloader") is not None:
             self.use_instaloader = True
             print("✓ Instaloader verfügbar")
-        except ImportError:
+        else:
             print("⚠️  Instaloader nicht installiert")
             print("   Installation: pip install instaloader")
 
@@ -0,0 +1,162 @@
+"""
+Scraper Registry - Scraper finden und parallel ausführen
+
+Jedes Modul in cli/scrapers mit einer (nicht abstrakten) BaseScraper-
+Unterklasse wird automatisch registriert, der Modulname ist der Name des
+Scrapers (z.B. "punk_im_hof_instagram"). Neue Venues brauchen also keinen
+Eintrag im CLI.
+
+run_scrapers startet jeden Scraper in einem eigenen Prozess: hängt ein
+Scraper (Selenium, langsame Seite), wird er nach dem Timeout beendet, ohne
+die anderen aufzuhalten.
+"""
+
+import importlib
+import inspect
+import io
+import pkgutil
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .base import BaseScraper
+
+DEFAULT_TIMEOUT = 300.0
+
+
+class ScrapeResult(NamedTuple):
+    """Outcome of one scraper run."""
+
+    name: str
+    venue: str
+    events: List[Dict[str, Any]]
+    duration: float
+    error: Optional[str] = None
+    log: str = ""
+
+
+def discover() -> Dict[str, type]:
+    """
+    Find all scrapers in the cli.scrapers package.
+
+    Returns:
+        Scraper classes by module name, sorted by name
+    """
+    package = sys.modules[__package__]
+    scrapers = {}
+    for module_info in pkgutil.iter_modules(package.__path__):
+        if module_info.name.startswith("_") or module_info.ispkg:
+            continue
+        try:
+            module = importlib.import_module(f"{__package__}.{module_info.name}")
+        except Exception as e:  # broken scraper must not hide the others
+            print(f"⚠️  Scraper {module_info.name} nicht ladbar: {e}", file=sys.stderr)
+            continue
+
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(cls, BaseScraper)
+                and cls.__module__ == module.__name__
+                and not inspect.isabstract(cls)
+            ):
+                scrapers[module_info.name] = cls
+                break
+    return dict(sorted(scrapers.items()))
+
+
+def _scrape_worker(name: str, cls: type, conn, cache_path: Optional[str]):
+    """Process entry point: run one scraper and send back a ScrapeResult."""
+    started = time.perf_counter()
+    log = io.StringIO()
+    venue, events, error = name, [], None
+    try:
+        with redirect_stdout(log):
+            if cache_path:
+                from .http_cache import HttpCache
+
+                BaseScraper.cache = HttpCache(cache_path)
+            scraper = cls()
+            venue = scraper.venue_name
+            events = scraper.scrape()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    conn.send(
+        ScrapeResult(
+            name, venue, events, time.perf_counter() - started, error, log.getvalue()
+        )
+    )
+    conn.close()
+
+
+def run_scrapers(
+    names: Iterable[str],
+    jobs: int = 4,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache_path: Optional[str] = None,
+    registry: Optional[Dict[str, type]] = None,
+) -> Iterator[ScrapeResult]:
+    """
+    Run scrapers concurrently, each in its own process.
+
+    Args:
+        names: Registered scraper names
+        jobs: Scrapers running at the same time
+        timeout: Seconds after which a scraper is terminated
+        cache_path: HTTP cache file shared by all scrapers (optional)
+        registry: Scraper classes by name (default: discover())
+
+    Yields:
+        ScrapeResult for every scraper, in order of completion
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    registry = discover() if registry is None else registry
+    pending = list(names)
+    running = {}  # connection -> (name, process, started)
+
+    while pending or running:
+        while pending and len(running) < max(jobs, 1):
+            name = pending.pop(0)
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_scrape_worker,
+                args=(name, registry[name], sender, cache_path),
+                name=f"scrape-{name}",
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (name, process, time.perf_counter())
+
+        now = time.perf_counter()
+        next_deadline = min(started + timeout for _, _, started in running.values())
+        for conn in wait(list(running), timeout=max(next_deadline - now, 0)):
+            name, process, started = running.pop(conn)
+            try:
+                result = conn.recv()
+            except EOFError:
+                # Died without reporting (e.g. killed or segfault)
+                process.join()
+                result = ScrapeResult(
+                    name,
+                    name,
+                    [],
+                    time.perf_counter() - started,
+                    f"Prozess beendet (Exit-Code {process.exitcode})",
+                )
+            conn.close()
+            process.join()
+            yield result
+
+        now = time.perf_counter()
+        for conn, (name, process, started) in list(running.items()):
+            if now - started >= timeout:
+                del running[conn]
+                process.terminate()
+                process.join()
+                conn.close()
+                yield ScrapeResult(
+                    name, name, [], now - started, f"Timeout nach {timeout:g}s"
+                )
@@ -0,0 +1,167 @@
+"""
+Throttle - Rate Limiting und Retries für Scraper-Requests
+
+HostRateLimiter verteilt Requests pro Host über einen Token Bucket: bis zu
+`burst` Requests sofort, danach `rate` Requests pro Sekunde. RetryPolicy
+wiederholt Verbindungsfehler und 429/5xx-Antworten mit exponentiellem
+Backoff und hält sich an Retry-After.
+
+BaseScraper nutzt je eine Instanz als Klassenattribut, alle Scraper eines
+Prozesses (und alle Threads von afetch_many) teilen sich also die Limits.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out reservations."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Tokens per second
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how many seconds to wait before using it.
+
+        Tokens may go negative: every caller gets its own slot in the
+        future, so waiting threads are served in order without polling.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def block(self, seconds: float):
+        """Hold back all requests for the given time (e.g. after a 429)."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class HostRateLimiter:
+    """Token bucket per host."""
+
+    def __init__(self, rate: Optional[float] = 4.0, burst: int = 8):
+        """
+        Args:
+            rate: Requests per second and host (None: unlimited)
+            burst: Requests per host allowed without waiting
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """Bucket for the host of url (None if unlimited)."""
+        if not self.rate:
+            return None
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def wait(self, url: str):
+        """Block until a request to the host of url is allowed."""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+
+    def block(self, url: str, seconds: float):
+        """Pause all requests to the host of url."""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            bucket.block(seconds)
+
+
+def retry_after(response: "requests.Response") -> Optional[float]:
+    """Seconds from a Retry-After header (delta or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """Exponential backoff for connection errors and retryable statuses."""
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 60.0,
+        statuses=(429, 500, 502, 503, 504),
+    ):
+        """
+        Args:
+            retries: Attempts after the first one
+            backoff: Delay before the first retry, doubled for every further one
+            max_delay: Longest wait; a longer Retry-After gives up instead
+            statuses: HTTP status codes worth retrying
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+
+    def delay(
+        self, attempt: int, response: Optional["requests.Response"] = None
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retry number attempt + 1.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 0
+            response: Failed response, None for connection errors
+
+        Returns:
+            Delay in seconds, or None if the request should not be retried
+        """
+        if attempt >= self.retries:
+            return None
+        if response is not None and response.status_code not in self.statuses:
+            return None
+
+        delay = min(self.backoff * 2**attempt, self.max_delay)
+        requested = retry_after(response) if response is not None else None
+        if requested is not None:
+            if requested > self.max_delay:
+                return None
+            delay = max(delay, requested)
+        return delay
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Event Benchmark - Laufzeitmessung für EventManager
+===================================================
+
+Erzeugt mit dem Event-Generator (cli/event_generator.py) reproduzierbare
+Event-Archive (JSON + Markdown-Frontmatter) in mehreren Größen und misst die
+Hot Paths des EventManagers. Das Ergebnis ist JSON und kann als Baseline
+gespeichert und später verglichen werden.
+
+Usage:
+    # 1k und 10k Events, Ergebnis als JSON
+    python scripts/benchmark.py --sizes 1000,10000
+
+    # Baseline speichern
+    python scripts/benchmark.py --sizes 1000,10000,100000 -o baseline.json
+
+    # Gegen Baseline prüfen, Exit-Code 1 bei mehr als 20% Verlangsamung
+    python scripts/benchmark.py --sizes 1000,10000 --baseline baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cli.event_generator import generate_corpus  # noqa: E402
+from cli.event_query import build_query  # noqa: E402
+from cli.event_scraper import EventManager, EventScraperCLI  # noqa: E402
+
+VENUES = ["Galeriehaus Hof", "Punk im Hof", "Kulturzentrum", "Freiheitshalle"]
+
+# Messungen unter dieser Differenz (Sekunden) gelten nie als Regression
+NOISE_FLOOR = 0.005
+
+
+def build_corpus(events_dir: Path, count: int, seed: int = 42, jobs: int = 1):
+    """Write a seeded corpus with the event generator, half JSON, half markdown."""
+    for format, size, offset in (
+        ("json", count // 2, 0),
+        ("markdown", count - count // 2, 1),
+    ):
+        for _ in generate_corpus(
+            events_dir, size, format=format, seed=seed + offset, workers=jobs
+        ):
+            pass
+
+
+def timed(fn, repeat: int = 1) -> float:
+    """Run fn repeat times and return the fastest wall-clock seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_core(workdir: Path, events_dir: Path, repeat: int) -> dict:
+    """Single-threaded EventManager operations over the whole corpus."""
+    paths = EventManager(events_dir).list_events()
+    markdown = [path for path in paths if path.suffix == ".md"]
+    events = [EventManager(events_dir).read_event(path) for path in paths]
+    pairs = list(zip(events, events[1:]))
+    save_dir = workdir / "save"
+
+    def load():
+        manager = EventManager(events_dir)
+        for path in paths:
+            manager.load_event(path)
+
+    def parse_cold():
+        manager = EventManager(events_dir)
+        for path in markdown:
+            manager._parse_frontmatter(path)
+
+    warm = EventManager(events_dir)
+
+    def parse_warm():
+        for path in markdown:
+            warm._parse_frontmatter(path)
+
+    parse_warm()
+
+    def compare():
+        for old, new in pairs:
+            warm.compare_events(old, new)
+
+    def merge():
+        for base, updates in pairs:
+            warm.merge_events(base, updates)
+
+    def save():
+        manager = EventManager(save_dir)
+        for path, event in zip(paths, events):
+            manager.save_event(event, save_dir / path.name)
+
+    return {
+        "list_events": timed(lambda: EventManager(events_dir).list_events(), repeat),
+        "load_event": timed(load, repeat),
+        "parse_frontmatter": timed(parse_cold, repeat),
+        "parse_frontmatter_cached": timed(parse_warm, repeat),
+        "compare_events": timed(compare, repeat),
+        "merge_events": timed(merge, repeat),
+        "save_event": timed(save, repeat),
+    }
+
+
+def bench_bulk(events_dir: Path, repeat: int) -> dict:
+    """End-to-end `bulk --set-field` over the corpus (modifies every file)."""
+    values = itertools.count()
+
+    def bulk():
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir)
+        args = ["bulk", "--set-field", "status", f"bench-{next(values)}"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli.run(args)
+
+    return {"bulk_set_field": timed(bulk, repeat)}
+
+
+def bench_index(workdir: Path, events_dir: Path) -> dict:
+    """Compare a plain full load against a cold and a warm index."""
+    index_path = workdir / "events.sqlite"
+
+    def load_plain():
+        list(EventManager(events_dir).iter_events())
+
+    def load_indexed():
+        list(EventManager(events_dir, index_path=index_path).iter_events())
+
+    return {
+        "no_index": timed(load_plain),
+        "index_cold": timed(load_indexed),
+        "index_warm": timed(load_indexed),
+    }
+
+
+def bench_date_range(workdir: Path, events_dir: Path) -> dict:
+    """Two-week range query: full scan vs. date column of a warm index."""
+    query = build_query(date_from="2026-02-01", date_to="2026-02-14")
+    index_path = workdir / "events.sqlite"
+
+    def scan():
+        list(EventManager(events_dir).iter_events(query=query))
+
+    def indexed():
+        list(EventManager(events_dir, index_path=index_path).iter_events(query=query))
+
+    indexed()  # warm up the index
+    return {"full_scan": timed(scan), "index": timed(indexed)}
+
+
+def bench_parallel(events_dir: Path, jobs: int) -> dict:
+    """Compare serial parsing against the process pool."""
+    manager = EventManager(events_dir)
+    return {
+        "serial": timed(lambda: list(manager.load_all())),
+        f"jobs_{jobs}": timed(lambda: list(manager.load_all(workers=jobs))),
+    }
+
+
+def venue_page(events: int, seed: int = 42) -> str:
+    """Venue page with event containers between navigation and teasers."""
+    rng = random.Random(seed)
+    noise = "".join(
+        f'<section class="teaser"><h3>Teaser {i}</h3><ul>'
+        + "<li><a href='#'>Link</a></li>" * 10
+        + "</ul></section>"
+        for i in range(events * 3)
+    )
+    containers = "".join(
+        f'<div class="event"><h2 class="event-title">Event {i}</h2>'
+        f'<span class="event-date">2026-{rng.randint(1, 12):02d}-01</span>'
+        f'<span class="event-location">{rng.choice(VENUES)}</span>'
+        f'<p class="event-description">{"Lorem ipsum " * 20}</p>'
+        f'<a class="event-link" href="https://example.com/e/{i}">Info</a></div>'
+        for i in range(events)
+    )
+    return (
+        "<html><head>" + "<script>var x = 1;</script>" * 50 + "</head><body>"
+        f"<nav>{noise}</nav><main>{containers}</main></body></html>"
+    )
+
+
+def bench_parse_html(count: int, repeat: int) -> dict:
+    """Full BeautifulSoup tree vs. parsing only the event containers."""
+    # Scraper stack (requests, bs4) only for this case
+    from cli.scrapers.example_venue import ExampleVenueScraper
+
+    scraper = ExampleVenueScraper()
+    html = venue_page(max(count // 10, 10))
+
+    def full():
+        scraper.parse_html(html).find_all("div", class_="event")
+
+    def containers():
+        scraper.parse_containers(html)
+
+    return {"full": timed(full, repeat), "containers": timed(containers, repeat)}
+
+
+def run_suite(workdir: Path, count: int, jobs: int, repeat: int = 1) -> dict:
+    """Build a corpus of count events and run every benchmark on it."""
+    events_dir = workdir / f"_events-{count}"
+    build_corpus(events_dir, count, jobs=jobs)
+
+    results = bench_core(workdir, events_dir, repeat)
+    for name, case in (
+        ("index", bench_index(workdir, events_dir)),
+        ("date_range", bench_date_range(workdir, events_dir)),
+        ("parallel", bench_parallel(events_dir, jobs)),
+        ("parse_html", bench_parse_html(count, repeat)),
+    ):
+        results.update({f"{name}.{key}": value for key, value in case.items()})
+    # Last, because it rewrites the corpus
+    results.update(bench_bulk(events_dir, repeat))
+
+    (workdir / "events.sqlite").unlink(missing_ok=True)
+    return {key: round(value, 6) for key, value in results.items()}
+
+
+def compare_results(baseline: dict, results: dict, threshold: float) -> list:
+    """
+    Find benchmarks that got slower than the baseline allows.
+
+    Args:
+        baseline: Earlier output of this script
+        results: Current output of this script
+        threshold: Allowed slowdown as a fraction (0.2 = 20%)
+
+    Returns:
+        List of (name, baseline seconds, current seconds) for regressions.
+        Benchmarks missing on either side are ignored.
+    """
+    regressions = []
+    for size, cases in results["results"].items():
+        old_cases = baseline.get("results", {}).get(size, {})
+        for name, seconds in cases.items():
+            old = old_cases.get(name)
+            if old is None:
+                continue
+            if seconds > old * (1 + threshold) and seconds - old > NOISE_FLOOR:
+                regressions.append((f"{size}.{name}", old, seconds))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EventManager hot paths")
+    parser.add_argument(
+        "--sizes",
+        "--count",
+        "-n",
+        default="1000,10000",
+        help="Korpusgrößen, kommagetrennt (z.B. 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=os.cpu_count(), help="Parser-Prozesse"
+    )
+    parser.add_argument(
+        "--repeat", "-r", type=int, default=1, help="Wiederholungen (Minimum zählt)"
+    )
+    parser.add_argument("--output", "-o", help="JSON-Ergebnis in Datei schreiben")
+    parser.add_argument(
+        "--baseline", "-b", help="Mit gespeichertem Ergebnis vergleichen"
+    )
+    parser.add_argument(
+        "--threshold",
+        "-t",
+        type=float,
+        default=0.2,
+        help="Erlaubte Verlangsamung gegenüber Baseline (0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",")]
+    except ValueError:
+        print(f"Fehler: Ungültige Größen: {args.sizes}", file=sys.stderr)
+        return 1
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "jobs": args.jobs,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    workdir = Path(tempfile.mkdtemp(prefix="krawl-bench-"))
+    try:
+        for size in sizes:
+            print(f"⏱️  {size} Events...", file=sys.stderr)
+            results["results"][str(size)] = run_suite(
+                workdir, size, args.jobs, args.repeat
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_results(baseline, results, args.threshold)
+        for name, old, new in regressions:
+            print(
+                f"⚠️  Regression {name}: {old:.4f}s → {new:.4f}s ({new / old - 1:+.0%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+        print(f"✓ Keine Regression über {args.threshold:.0%}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
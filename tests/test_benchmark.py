@@ -0,0 +1,64 @@
+"""
+Unit Tests für das Benchmark-Script
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_PATH = Path(__file__).parent.parent / "scripts" / "benchmark.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    """Load scripts/benchmark.py as a module."""
+    spec = importlib.util.spec_from_file_location("benchmark", BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBenchmark:
+    """Test the benchmark runner and baseline comparison."""
+
+    def test_run_suite_covers_hot_paths(self, bench, tmp_path):
+        results = bench.run_suite(tmp_path, 20, jobs=1)
+
+        for name in (
+            "list_events",
+            "load_event",
+            "parse_frontmatter",
+            "compare_events",
+            "merge_events",
+            "save_event",
+            "bulk_set_field",
+            "index.index_warm",
+        ):
+            assert results[name] >= 0
+
+    def test_compare_results(self, bench):
+        baseline = {"results": {"1000": {"load_event": 1.0, "list_events": 0.001}}}
+        results = {
+            "results": {
+                "1000": {"load_event": 1.3, "list_events": 0.003, "new_case": 5.0},
+                "10000": {"load_event": 10.0},
+            }
+        }
+
+        assert bench.compare_results(baseline, results, 0.2) == [
+            ("1000.load_event", 1.0, 1.3)
+        ]
+        assert bench.compare_results(baseline, results, 0.5) == []
+
+    def test_corpus_is_reproducible(self, bench, tmp_path):
+        bench.build_corpus(tmp_path / "a", 10)
+        bench.build_corpus(tmp_path / "b", 10)
+
+        files = sorted(p.name for p in (tmp_path / "a").iterdir())
+        assert [name.rsplit(".", 1)[1] for name in files].count("md") == 5
+        assert files == sorted(p.name for p in (tmp_path / "b").iterdir())
+        for name in files:
+            assert (tmp_path / "a" / name).read_bytes() == (
+                tmp_path / "b" / name
+            ).read_bytes()
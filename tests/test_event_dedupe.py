@@ -0,0 +1,87 @@
+"""
+Unit Tests für die Duplikat-Erkennung
+"""
+
+from pathlib import Path
+
+import pytest
+
+from cli.event_dedupe import DuplicateFinder, jaccard, normalize_text, trigrams
+
+
+@pytest.fixture
+def events():
+    """Same concert from three sources plus unrelated events."""
+    return [
+        (
+            Path("scraped.json"),
+            {
+                "title": "Punk Night mit Den Ärzten",
+                "date": "2026-03-14",
+                "venue": "Punk im Hof",
+                "price": "15€",
+                "url": "https://example.com",
+            },
+        ),
+        (
+            Path("telegram.json"),
+            {"title": "PUNK NIGHT mit den Ärzten!", "date": "14.03.2026"},
+        ),
+        (
+            Path("instagram.md"),
+            {
+                "title": "Punk Night – mit den Aerzten",
+                "date": "2026-03-14 20:00",
+                "location": {"name": "Punk im Hof e.V."},
+            },
+        ),
+        (
+            Path("other-day.json"),
+            {"title": "Punk Night mit Den Ärzten", "date": "2026-03-21"},
+        ),
+        (
+            Path("other-title.json"),
+            {
+                "title": "Jazz Frühschoppen",
+                "date": "2026-03-14",
+                "venue": "Punk im Hof",
+            },
+        ),
+        (Path("no-date.json"), {"title": "Punk Night mit Den Ärzten"}),
+    ]
+
+
+class TestHelpers:
+    """Test text normalization and similarity."""
+
+    def test_normalize_text(self):
+        assert normalize_text("Straße – Café Ü!") == "strasse cafe u"
+        assert normalize_text(None) == ""
+
+    def test_jaccard(self):
+        assert jaccard(trigrams("punk"), trigrams("punk")) == 1.0
+        assert jaccard(trigrams("punk"), trigrams("jazz")) == 0.0
+        assert jaccard(frozenset(), trigrams("punk")) == 0.0
+
+
+class TestDuplicateFinder:
+    """Test blocking-based duplicate detection."""
+
+    def test_finds_same_day_duplicates(self, events):
+        candidates = DuplicateFinder().find(events)
+
+        pairs = {frozenset((c["base"].name, c["updates"].name)) for c in candidates}
+        assert frozenset(("scraped.json", "telegram.json")) in pairs
+        assert all("other-day.json" not in pair for pair in pairs)
+        assert all("other-title.json" not in pair for pair in pairs)
+        assert all("no-date.json" not in pair for pair in pairs)
+
+    def test_more_complete_event_is_base(self, events):
+        candidates = DuplicateFinder().find(events)
+
+        for candidate in candidates:
+            if "scraped.json" in (candidate["base"].name, candidate["updates"].name):
+                assert candidate["base"].name == "scraped.json"
+
+    def test_threshold(self, events):
+        assert DuplicateFinder(threshold=1.01).find(events) == []
@@ -0,0 +1,156 @@
+"""
+Unit Tests für den Event-Export
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+from cli.event_export import _ics_fold, export_events, ics_datetime
+from cli.event_import import iter_ics
+from cli.event_scraper import EventManager, EventScraperCLI
+
+EVENTS = [
+    (
+        Path("2026-03-14-vernissage.md"),
+        {
+            "title": "Vernissage; Malerei, Grafik",
+            "date": "2026-03-14 19:30",
+            "end_date": "2026-03-14 22:00",
+            "location": {"name": "Galeriehaus", "city": "Hof", "postal_code": "95028"},
+            "coordinates": {"lat": 50.31, "lng": 11.91},
+            "categories": ["kunst", "ausstellung"],
+        },
+    ),
+    (
+        Path("2026-03-20-flohmarkt.json"),
+        {"title": "Flohmarkt", "date": "2026-03-20", "venue": "Altstadt"},
+    ),
+    (Path("draft.json"), {"title": "Entwurf ohne Datum"}),
+]
+
+
+def _export(format, **kwargs):
+    out = io.StringIO(newline="")
+    counts = export_events(iter(EVENTS), out, format, **kwargs)
+    return counts, out.getvalue()
+
+
+class TestIcs:
+    """Test the iCalendar writer."""
+
+    def test_round_trip_through_importer(self):
+        (exported, skipped), text = _export("ics")
+
+        assert (exported, skipped) == (2, 1)
+        assert text.startswith("BEGIN:VCALENDAR\r\n")
+        assert "DTSTART;VALUE=DATE:20260320\r\n" in text
+
+        events = list(iter_ics(io.StringIO(text)))
+        assert events[0]["title"] == "Vernissage; Malerei, Grafik"
+        assert events[0]["date"] == "2026-03-14 19:30:00"
+        assert events[0]["location"] == "Galeriehaus, 95028 Hof"
+        assert events[1]["location"] == "Altstadt"
+
+    def test_fold_long_lines_on_character_boundaries(self):
+        folded = _ics_fold("DESCRIPTION:" + "ä" * 100)
+        lines = folded.rstrip("\r\n").split("\r\n")
+
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        assert "".join(line[1:] if i else line for i, line in enumerate(lines)) == (
+            "DESCRIPTION:" + "ä" * 100
+        )
+
+    def test_all_day_end_is_exclusive(self):
+        events = [
+            (
+                Path("a.json"),
+                {"title": "Festival", "date": "2026-03-28", "end_date": "2026-03-30"},
+            ),
+            (
+                Path("b.json"),
+                {"title": "Markt", "date": "2026-03-28", "end_date": "2026-03-28"},
+            ),
+            (
+                Path("c.json"),
+                {"title": "Fehler", "date": "2026-03-28", "end_date": "2026-03-01"},
+            ),
+        ]
+        out = io.StringIO(newline="")
+        export_events(iter(events), out, "ics")
+        vevents = out.getvalue().split("BEGIN:VEVENT")[1:]
+
+        assert "DTEND;VALUE=DATE:20260331\r\n" in vevents[0]
+        assert "DTEND;VALUE=DATE:20260329\r\n" in vevents[1]
+        assert "DTEND" not in vevents[2]
+
+    def test_dates(self):
+        assert ics_datetime("2025-12-01 20:00") == ("20251201T200000", False)
+        assert ics_datetime("2025-12-01") == ("20251201", True)
+        assert ics_datetime("demnächst") is None
+
+
+class TestTabularFormats:
+    """Test the CSV, NDJSON and GeoJSON writers."""
+
+    def test_csv_fields(self):
+        counts, text = _export("csv", fields=["title", "location.city", "categories"])
+
+        assert counts == (3, 0)
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0] == ["title", "location.city", "categories"]
+        assert rows[1] == ["Vernissage; Malerei, Grafik", "Hof", "kunst, ausstellung"]
+
+    def test_ndjson(self):
+        _, text = _export("ndjson")
+
+        assert [json.loads(line) for line in text.splitlines()] == [
+            event for _, event in EVENTS
+        ]
+
+    def test_geojson_skips_events_without_coordinates(self):
+        counts, text = _export("geojson", fields=["title"])
+
+        assert counts == (1, 2)
+        collection = json.loads(text)
+        assert collection["features"] == [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [11.91, 50.31]},
+                "properties": {"title": "Vernissage; Malerei, Grafik"},
+            }
+        ]
+
+
+class TestExportCommand:
+    """Test the export subcommand."""
+
+    def test_filtered_export_to_file(self, tmp_path, capsys):
+        manager = EventManager(events_dir=tmp_path / "_events")
+        for path, event in EVENTS:
+            manager.save_event(event, manager.events_dir / path.name)
+        cli = EventScraperCLI()
+        cli.manager = manager
+        output = tmp_path / "feed" / "events.ndjson"
+
+        assert (
+            cli.run(
+                [
+                    "export",
+                    "-f",
+                    "ndjson",
+                    "--from",
+                    "2026-03-15",
+                    "--fields",
+                    "title",
+                    "-o",
+                    str(output),
+                ]
+            )
+            == 0
+        )
+
+        assert output.read_text(encoding="utf-8") == '{"title":"Flohmarkt"}\n'
+        assert "1 Events exportiert" in capsys.readouterr().out
+        assert [p.name for p in output.parent.iterdir()] == ["events.ndjson"]
@@ -0,0 +1,82 @@
+"""
+Unit Tests für den Test-Event-Generator
+"""
+
+from datetime import date
+
+from cli.event_generator import EventGenerator, generate_corpus
+from cli.event_scraper import EventManager
+
+
+def _read_tree(directory):
+    """Map relative file names to their contents."""
+    return {
+        path.relative_to(directory).as_posix(): path.read_text(encoding="utf-8")
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+class TestEventGenerator:
+    """Test seeded event generation."""
+
+    def test_same_seed_same_events(self):
+        first = EventGenerator(seed=7)
+        second = EventGenerator(seed=7)
+
+        assert [first.event() for _ in range(3)] == [second.event() for _ in range(3)]
+        assert EventGenerator(seed=8).event() != EventGenerator(seed=7).event()
+
+    def test_nested_location_and_coordinates(self):
+        event = EventGenerator(seed=1).event()
+
+        assert set(event["location"]) == {"name", "address", "city", "postal_code"}
+        assert 47 < event["coordinates"]["lat"] < 56
+        assert 5 < event["coordinates"]["lng"] < 16
+
+    def test_dates_relative_to_base_date(self):
+        event = EventGenerator(seed=1, base_date=date(2030, 6, 1)).event("exhibition")
+
+        assert "2030-06-01" < event["date"] <= event["end_date"]
+
+
+class TestGenerateCorpus:
+    """Test bulk corpus generation."""
+
+    def test_output_independent_of_workers(self, tmp_path):
+        """Blocks are seeded individually, so worker count does not matter."""
+        serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+        for output_dir, workers in ((serial, 1), (parallel, 2)):
+            for _ in generate_corpus(
+                output_dir, 7, seed=3, workers=workers, chunksize=3
+            ):
+                pass
+
+        assert len(_read_tree(serial)) == 7
+        assert _read_tree(serial) == _read_tree(parallel)
+
+    def test_markdown_corpus_round_trip(self, tmp_path):
+        written = [
+            path
+            for chunk in generate_corpus(tmp_path, 2, format="markdown", seed=1)
+            for path, _ in chunk
+        ]
+        assert [path.name for path in written] == [
+            "test-concert-001.md",
+            "test-concert-002.md",
+        ]
+
+        event = EventManager(tmp_path).load_event(written[0])
+        assert event["layout"] == "event"
+        assert event["published"] is False
+        assert "city" in event["location"]
+        assert "lat" in event["coordinates"]
+
+    def test_sharded_output(self, tmp_path):
+        for _ in generate_corpus(tmp_path, 2, seed=1, sharded=True):
+            pass
+
+        assert all(
+            len(path.relative_to(tmp_path).parts) == 3
+            for path in tmp_path.rglob("*.json")
+        )
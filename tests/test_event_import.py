@@ -0,0 +1,185 @@
+"""
+Unit Tests für den Import von Venue-Exporten
+"""
+
+import io
+import json
+
+import pytest
+
+from cli.event_import import FileImporter, ImportFileError, iter_ics, iter_json
+from cli.event_scraper import EventManager, EventScraperCLI
+
+
+class TestReaders:
+    """Test the streaming format readers."""
+
+    def test_json_array_across_chunks(self):
+        events = [{"title": f"Konzert {i}", "date": "2026-03-01"} for i in range(50)]
+        f = io.StringIO(json.dumps(events, indent=2))
+
+        assert list(iter_json(f, chunk_size=16)) == events
+
+    def test_ndjson(self):
+        f = io.StringIO('{"title": "A"}\n\n{"title": "B"}\n')
+
+        assert [e["title"] for e in iter_json(f)] == ["A", "B"]
+
+    def test_unterminated_array(self):
+        with pytest.raises(ImportFileError):
+            list(iter_json(io.StringIO('[{"title": "A"}, {"title": '), chunk_size=8))
+
+    def test_ics_folding_and_escapes(self):
+        f = io.StringIO(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "SUMMARY:Jazz\\, Blues und\r\n"
+            "  mehr\r\n"
+            "DTSTART;TZID=Europe/Berlin:20260314T200000\r\n"
+            "DESCRIPTION:Zeile 1\\nZeile 2\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n"
+        )
+
+        assert list(iter_ics(f)) == [
+            {
+                "title": "Jazz, Blues und mehr",
+                "date": "2026-03-14 20:00:00",
+                "description": "Zeile 1\nZeile 2",
+            }
+        ]
+
+    def test_ics_all_day_end_is_exclusive(self):
+        f = io.StringIO(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "SUMMARY:Festival\r\n"
+            "DTSTART;VALUE=DATE:20260328\r\n"
+            "DTEND;VALUE=DATE:20260331\r\n"
+            "END:VEVENT\r\n"
+            "BEGIN:VEVENT\r\n"
+            "SUMMARY:Markt\r\n"
+            "DTSTART;VALUE=DATE:20260328\r\n"
+            "DTEND;VALUE=DATE:20260329\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n"
+        )
+
+        assert [e.get("end_date") for e in iter_ics(f)] == [
+            "2026-03-30",
+            "2026-03-28",
+        ]
+
+
+class TestFileImporter:
+    """Test normalization of imported records."""
+
+    def test_csv_with_semicolons_and_bom(self, tmp_path):
+        path = tmp_path / "export.csv"
+        path.write_text(
+            "\ufeffTitel;Datum;Ort;Preis\n"
+            "Vernissage;14.03.2026;Galeriehaus;frei\n"
+            ";15.03.2026;Galeriehaus;5 €\n",
+            encoding="utf-8",
+        )
+        importer = FileImporter(path, venue_name="Galeriehaus Hof")
+        events = importer.scrape()
+
+        assert len(events) == 1
+        assert events[0]["title"] == "Vernissage"
+        assert events[0]["date"] == "2026-03-14"
+        assert events[0]["venue"] == "Galeriehaus Hof"
+        assert events[0]["source"] == "import"
+        assert importer.skipped == 1
+
+    def test_unknown_suffix(self, tmp_path):
+        with pytest.raises(ImportFileError):
+            FileImporter(tmp_path / "export.xlsx")
+
+
+class TestImportCommand:
+    """Test the import subcommand."""
+
+    def test_import_is_idempotent(self, tmp_path, capsys):
+        source = tmp_path / "export.ndjson"
+        source.write_text(
+            '{"title": "Lesung", "date": "2026-05-02", "venue": "Theater Hof"}\n'
+            '{"title": "Lesung", "date": "2026-05-02", "venue": "Theater Hof"}\n'
+            '{"title": "Ohne Datum", "venue": "Theater Hof"}\n',
+            encoding="utf-8",
+        )
+        events_dir = tmp_path / "_events"
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=events_dir)
+
+        assert cli.run(["import", str(source)]) == 0
+        names = sorted(path.name for path in events_dir.iterdir())
+        assert names == ["2026-05-02-lesung-2.json", "2026-05-02-lesung.json"]
+        assert "Übersprungen (ungültig" in capsys.readouterr().out
+
+        assert cli.run(["import", str(source)]) == 0
+        assert "Übersprungen (existiert bereits): 2" in capsys.readouterr().out
+        assert len(list(events_dir.iterdir())) == 2
+
+    def test_import_markdown(self, tmp_path):
+        source = tmp_path / "export.json"
+        source.write_text(
+            json.dumps(
+                [
+                    {
+                        "title": "Vernissage",
+                        "date": "2026-03-14",
+                        "description": "Neue Arbeiten",
+                    }
+                ]
+            ),
+            encoding="utf-8",
+        )
+        output_dir = tmp_path / "out"
+
+        assert (
+            EventScraperCLI().run(
+                [
+                    "import",
+                    str(source),
+                    "--venue",
+                    "Galeriehaus Hof",
+                    "--output-format",
+                    "markdown",
+                    "-o",
+                    str(output_dir),
+                ]
+            )
+            == 0
+        )
+
+        path = output_dir / "2026-03-14-vernissage.md"
+        event = EventManager(output_dir).load_event(path)
+        assert event["layout"] == "event"
+        assert event["published"] is False
+        assert event["venue"] == "Galeriehaus Hof"
+        assert path.read_text(encoding="utf-8").endswith("\nNeue Arbeiten\n")
+
+    def test_imported_events_pass_validate(self, tmp_path, capsys):
+        source = tmp_path / "export.csv"
+        source.write_text(
+            "title,date,url\n"
+            "Lesung,2026-05-02,https://example.com/lesung\n"
+            "Konzert,2026-05-03,\n",
+            encoding="utf-8",
+        )
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path / "_events")
+
+        assert cli.run(["import", str(source), "--venue", "Theater Hof"]) == 0
+        events = dict(cli.manager.iter_events())
+        assert {e["title"]: e.get("source_url") for e in events.values()} == {
+            "Lesung": "https://example.com/lesung",
+            "Konzert": None,
+        }
+        assert {e["source_file"] for e in events.values()} == {"export.csv"}
+        assert str(tmp_path) not in json.dumps(list(events.values()))
+
+        capsys.readouterr()
+        assert cli.run(["validate"]) == 0
+        assert "Fehler" not in capsys.readouterr().out
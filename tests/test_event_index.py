@@ -0,0 +1,129 @@
+"""
+Unit Tests für den persistenten Event-Index
+"""
+
+import os
+from datetime import date, datetime
+
+import pytest
+
+from cli.event_index import EventIndex, normalize_date
+from cli.event_scraper import EventManager, EventScraperCLI
+
+
+@pytest.fixture
+def events_dir(tmp_path):
+    """Events directory with one JSON and one markdown event."""
+    directory = tmp_path / "_events"
+    manager = EventManager(events_dir=directory)
+    manager.save_event(
+        {"title": "JSON Event", "date": "2026-03-01"}, directory / "a.json"
+    )
+    (directory / "b.md").write_text(
+        "---\ntitle: MD Event\ndate: 2026-03-02 20:00\n---\n\nText\n", encoding="utf-8"
+    )
+    return directory
+
+
+@pytest.fixture
+def indexed_manager(events_dir, tmp_path):
+    """EventManager with index enabled."""
+    return EventManager(events_dir=events_dir, index_path=tmp_path / "events.sqlite")
+
+
+class TestNormalizeDate:
+    """Test date normalization for the index."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2026-03-01", "2026-03-01"),
+            ("2026-3-1 20:00", "2026-03-01"),
+            ("01.03.2026", "2026-03-01"),
+            (date(2026, 3, 1), "2026-03-01"),
+            (datetime(2026, 3, 1, 20, 0), "2026-03-01"),
+            ("demnächst", None),
+            (None, None),
+        ],
+    )
+    def test_normalize_date(self, value, expected):
+        assert normalize_date(value) == expected
+
+
+class TestEventIndex:
+    """Test incremental index refresh."""
+
+    def test_cold_then_warm_refresh(self, indexed_manager):
+        """Second refresh must not re-parse anything."""
+        stats = indexed_manager.index.refresh(indexed_manager)
+        assert stats["added"] == 2
+
+        stats = indexed_manager.index.refresh(indexed_manager)
+        assert stats["added"] == 0
+        assert stats["unchanged"] == 2
+
+    def test_refresh_detects_changes_and_removals(self, indexed_manager, events_dir):
+        """Changed files are re-parsed, deleted files dropped."""
+        indexed_manager.index.refresh(indexed_manager)
+
+        indexed_manager.save_event(
+            {"title": "JSON Event v2", "date": "2026-03-01"}, events_dir / "a.json"
+        )
+        (events_dir / "b.md").unlink()
+
+        stats = indexed_manager.index.refresh(indexed_manager)
+        assert stats["updated"] == 1
+        assert stats["removed"] == 1
+
+        events = dict(indexed_manager.iter_events())
+        assert events[events_dir / "a.json"]["title"] == "JSON Event v2"
+
+    def test_touched_file_is_not_reparsed(self, indexed_manager, events_dir):
+        """Identical content with new mtime only updates stat info."""
+        indexed_manager.index.refresh(indexed_manager)
+
+        path = events_dir / "a.json"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        stats = indexed_manager.index.refresh(indexed_manager)
+        assert stats["touched"] == 1
+        assert indexed_manager.index.get(path)["title"] == "JSON Event"
+
+    def test_index_matches_plain_load(self, indexed_manager, events_dir):
+        """Indexed events are identical to freshly parsed ones."""
+        plain = dict(EventManager(events_dir=events_dir).iter_events())
+        indexed = dict(indexed_manager.iter_events())
+        assert indexed == plain
+
+    def test_index_reset_for_other_events_dir(self, indexed_manager, tmp_path):
+        """An index file reused for another tree starts empty."""
+        indexed_manager.index.refresh(indexed_manager)
+        indexed_manager.index.close()
+
+        other = tmp_path / "other"
+        other.mkdir()
+        index = EventIndex(tmp_path / "events.sqlite", other)
+        assert index.entries() == []
+
+    def test_file_that_stops_parsing_is_dropped(
+        self, indexed_manager, events_dir, tmp_path, capsys
+    ):
+        """A changed file without frontmatter must not be served from the index."""
+        indexed_manager.index.refresh(indexed_manager)
+        md = events_dir / "b.md"
+        md.write_text("Nur noch Text, kein Frontmatter\n", encoding="utf-8")
+
+        stats = indexed_manager.index.refresh(indexed_manager)
+        assert stats["removed"] == 1
+        assert [p.name for p, _ in indexed_manager.iter_events()] == ["a.json"]
+
+        cli = EventScraperCLI()
+        cli.manager = indexed_manager
+        index = str(tmp_path / "events.sqlite")
+        assert cli.run(["--index", index, "list", "--fields", "title"]) == 0
+        assert "MD Event" not in capsys.readouterr().out
+
+        assert cli.run(["--index", index, "bulk", "--set-field", "status", "x"]) == 0
+        assert md.read_text(encoding="utf-8") == "Nur noch Text, kein Frontmatter\n"
+        assert indexed_manager.load_event(events_dir / "a.json")["status"] == "x"
@@ -0,0 +1,124 @@
+"""
+Unit Tests für das kompakte Event-Modell
+"""
+
+import json
+import sys
+
+import pytest
+
+from cli import event_model
+from cli.event_model import Event, json_dumps, json_loads
+from cli.event_scraper import EventManager
+
+
+@pytest.fixture
+def data():
+    """Event dict with known and unknown fields in a custom order."""
+    return {
+        "_comment": "# Original message",
+        "title": "Punk Night",
+        "status": "draft",
+        "location": {"name": "Punk im Hof", "city": "Hof"},
+        "needs_review": True,
+        "price": "15€",
+    }
+
+
+class TestEvent:
+    """Test the slotted Event class."""
+
+    def test_round_trip_keeps_key_order(self, data):
+        event = Event.from_dict(data)
+
+        assert event.to_dict() == data
+        assert list(event.to_dict()) == list(data)
+        assert event.title == "Punk Night"
+        assert event.extra == {"_comment": "# Original message", "needs_review": True}
+
+    def test_mapping_protocol(self, data):
+        event = Event.from_dict(data)
+
+        assert event["price"] == "15€"
+        assert event.get("genre", "-") == "-"
+        assert "genre" not in event
+        assert event == data
+
+        event["genre"] = "Punk"
+        event["last_updated"] = "2026-03-01"
+        del event["_comment"]
+        assert list(event)[-2:] == ["genre", "last_updated"]
+        assert "_comment" not in event
+        with pytest.raises(KeyError):
+            event["_comment"]
+
+    def test_same_layout_shares_shape(self, data):
+        first, second = Event.from_dict(data), Event.from_dict(dict(data))
+        assert first._shape is second._shape
+
+    def test_smaller_than_dict(self, data):
+        assert sys.getsizeof(Event.from_dict(data)) < sys.getsizeof(data)
+
+    def test_markdown_round_trip(self):
+        text = "---\ntitle: Konzert\nlayout: event\n---\n\nText mit **Markdown**\n"
+
+        event = Event.from_markdown(text)
+
+        assert event.content == "Text mit **Markdown**\n"
+        assert event.to_markdown() == text
+
+    def test_markdown_without_frontmatter(self):
+        with pytest.raises(ValueError):
+            Event.from_markdown("# Nur Text\n")
+        with pytest.raises(ValueError):
+            Event.from_markdown("---\ntitle: Offen\n")
+
+    def test_split_frontmatter_stops_at_body(self):
+        lines = iter(["---\n", "title: Konzert\n", "---\n", "\n", "Text\n"])
+
+        assert event_model.split_frontmatter(lines) == "title: Konzert\n"
+        assert list(lines) == ["\n", "Text\n"]
+        assert event_model.load_frontmatter("title: Konzert\n") == {"title": "Konzert"}
+
+
+class TestJson:
+    """Test orjson-backed serialization."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_matches_stdlib(self, data, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(event_model, "_orjson", None)
+
+        assert json_dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert json_loads(json_dumps(data).encode("utf-8")) == data
+
+        floats = dict(
+            data,
+            coordinates={"lat": 50.31, "lng": -0.0},
+            values=[0.1 + 0.2, 1e-4, 1.5, 1e15],
+            tiny=1e-05,
+            huge=1e16,
+            special=float("nan"),
+        )
+        events = [floats, dict(data, coordinates=[1.5e-7, 1e300])]
+        for value in (floats, events):
+            expected = json.dumps(value, indent=2, ensure_ascii=False)
+            assert json_dumps(value) == expected
+            assert json_dumps(value, indent=False) == json.dumps(
+                value, ensure_ascii=False, separators=(",", ":")
+            )
+
+    def test_nested_floats_keep_value(self, data):
+        # Deeper floats may use orjson's exponent format, but read back equal
+        nested = dict(data, extra={"values": [1e-05, 1.5e-7, 1e16, 1e300]})
+
+        assert json_loads(json_dumps(nested)) == nested
+
+    def test_save_and_load_model(self, tmp_path, data):
+        manager = EventManager(events_dir=tmp_path)
+        manager.save_event(Event.from_dict(data), tmp_path / "event.json")
+
+        assert manager.load_event(tmp_path / "event.json") == data
+        assert manager.load_model(tmp_path / "event.json") == data
@@ -0,0 +1,151 @@
+"""
+Unit Tests für die Event-Query-Engine
+"""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from cli.event_query import EventQuery, QueryError, build_query, parse_date_arg
+from cli.event_scraper import EventManager, EventScraperCLI
+
+
+@pytest.fixture
+def event():
+    """Event with nested frontmatter fields."""
+    return {
+        "title": "Punk Night",
+        "date": "2026-03-14 20:00",
+        "status": "draft",
+        "genre": "Punk",
+        "categories": ["konzert", "punk"],
+        "location": {"name": "Punk im Hof", "city": "Hof"},
+    }
+
+
+class TestEventQuery:
+    """Test query compilation and evaluation."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ({"status": "draft"}, True),
+            ({"status": "published"}, False),
+            ({"location.city": "Hof"}, True),
+            ({"location.zip": "95028"}, False),
+            ({"categories": "punk"}, True),
+            ({"date": "2026-03-14"}, True),
+            ({"date": {"$gte": "2026-03-01", "$lt": "2026-04-01"}}, True),
+            ({"date": {"$gte": "01.04.2026"}}, False),
+            ({"genre": {"$in": ["Rock", "Punk"]}}, True),
+            ({"genre": {"$nin": ["Rock", "Punk"]}}, False),
+            ({"price": {"$exists": False}}, True),
+            ({"$or": [{"genre": "Jazz"}, {"location.city": "Hof"}]}, True),
+            ({"$and": [{"genre": "Punk"}, {"status": "published"}]}, False),
+            ({"$not": {"status": "published"}}, True),
+        ],
+    )
+    def test_query_matches(self, event, query, expected):
+        assert EventQuery(query)(event) is expected
+
+    def test_range_on_missing_or_incomparable_value(self):
+        """Range operators never match missing or incomparable values."""
+        query = EventQuery({"price": {"$gt": 10}})
+        assert query({}) is False
+        assert query({"price": "15€"}) is False
+
+    def test_date_bounds(self):
+        """Date ranges are extracted for index pre-filtering."""
+        query = EventQuery(
+            {
+                "$and": [
+                    {"date": {"$gte": "2026-03-01"}},
+                    {"date": {"$lt": "2026-04-01"}},
+                ]
+            }
+        )
+        assert query.date_bounds == ("2026-03-01", "2026-04-01")
+        assert EventQuery({"status": "draft"}).date_bounds == (None, None)
+
+    @pytest.mark.parametrize(
+        "text", ['{"date": {"$between": 1}}', '{"$or": []}', "[1, 2]", "{kaputt"]
+    )
+    def test_invalid_queries(self, text):
+        with pytest.raises(QueryError):
+            EventQuery.parse(text)
+
+
+class TestDateRange:
+    """Test --from/--to handling."""
+
+    def test_parse_date_arg(self):
+        today = date.today()
+        assert parse_date_arg("today") == today.isoformat()
+        assert parse_date_arg("+14d") == (today + timedelta(days=14)).isoformat()
+        assert parse_date_arg("31.12.2026") == "2026-12-31"
+        with pytest.raises(QueryError):
+            parse_date_arg("nächste Woche")
+
+    def test_build_query_combines_filter_and_range(self, event):
+        query = build_query('{"status": "draft"}', "2026-03-01", "2026-03-14")
+
+        assert query.date_bounds == ("2026-03-01", "2026-03-14")
+        assert query(event) is True
+        assert query(dict(event, date="2026-03-15")) is False
+        assert build_query() is None
+
+    def test_list_range_uses_index(self, tmp_path, capsys):
+        """Only events inside the range are listed, with and without index."""
+        events_dir = tmp_path / "_events"
+        manager = EventManager(events_dir=events_dir)
+        for day in ("2026-03-01", "2026-03-10", "2026-04-01"):
+            manager.save_event({"title": day, "date": day}, events_dir / f"{day}.json")
+
+        for index_args in ([], ["--index", str(tmp_path / "events.sqlite")]):
+            cli = EventScraperCLI()
+            cli.manager = EventManager(events_dir=events_dir)
+            args = ["list", "--from", "2026-03-01", "--to", "2026-03-31"]
+            result = cli.run(index_args + args + ["--format", "ndjson"])
+
+            assert result == 0
+            lines = capsys.readouterr().out.splitlines()
+            assert [json.loads(line)["date"] for line in lines] == [
+                "2026-03-01",
+                "2026-03-10",
+            ]
+
+
+class TestBulkFilter:
+    """Test bulk --filter only touches matching files."""
+
+    def test_bulk_set_field_with_filter(self, tmp_path, capsys):
+        manager = EventManager(events_dir=tmp_path)
+        for i, city in enumerate(["Hof", "Berlin", "Hof"]):
+            manager.save_event(
+                {"title": f"Event {i}", "location": {"city": city}},
+                tmp_path / f"event-{i}.json",
+            )
+
+        cli = EventScraperCLI()
+        cli.manager = manager
+        result = cli.run(
+            [
+                "bulk",
+                "--set-field",
+                "status",
+                "reviewed",
+                "--filter",
+                json.dumps({"location.city": "Hof"}),
+            ]
+        )
+
+        assert result == 0
+        statuses = {
+            path.name: event.get("status") for path, event in manager.iter_events()
+        }
+        assert statuses == {
+            "event-0.json": "reviewed",
+            "event-1.json": None,
+            "event-2.json": "reviewed",
+        }
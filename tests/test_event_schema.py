@@ -0,0 +1,130 @@
+"""
+Unit Tests für die Schema-Validierung
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from cli.event_schema import EventValidator, SchemaError, validate_files
+from cli.event_scraper import EventManager, EventScraperCLI
+
+
+@pytest.fixture
+def validator():
+    """Validator for the default event schema."""
+    return EventValidator()
+
+
+@pytest.fixture
+def frontmatter():
+    """Valid Jekyll frontmatter event."""
+    return {
+        "layout": "event",
+        "title": "Konzert im Kulturzentrum",
+        "date": "2025-12-01 20:00",
+        "published": True,
+        "categories": ["konzert"],
+        "location": {"name": "Kulturzentrum", "postal_code": "10115"},
+        "coordinates": {"lat": 52.52, "lng": 13.405},
+        "url": "https://example.com",
+        "source_url": "",
+        "import_date": date(2025, 11, 21),
+    }
+
+
+class TestEventValidator:
+    """Test the default event schema."""
+
+    def test_valid_frontmatter(self, validator, frontmatter):
+        assert validator.validate(frontmatter, markdown=True) == []
+
+    def test_markdown_requires_frontmatter_fields(self, validator):
+        event = {"title": "Entwurf"}
+
+        assert validator.validate(event) == []
+        assert validator.validate(event, markdown=True) == [
+            "layout: Pflichtfeld fehlt",
+            "date: Pflichtfeld fehlt",
+            "published: Pflichtfeld fehlt",
+        ]
+
+    @pytest.mark.parametrize(
+        "field,value,message",
+        [
+            ("date", "31.12.2025", "date: '31.12.2025' ist kein gültiges date-time"),
+            ("date", "2025-02-30", "date: '2025-02-30' ist kein gültiges date-time"),
+            ("published", "yes", "published: erwartet boolean, ist str"),
+            ("title", "  ", "title: darf nicht leer sein"),
+            ("url", "example.com", "url: 'example.com' ist kein gültiges uri"),
+            ("categories", ["punk", 3], "categories[1]: erwartet string, ist int"),
+        ],
+    )
+    def test_invalid_values(self, validator, frontmatter, field, value, message):
+        frontmatter[field] = value
+        assert validator.validate(frontmatter, markdown=True) == [message]
+
+    def test_coordinate_ranges(self, validator, frontmatter):
+        frontmatter["coordinates"] = {"lat": 152.5, "lng": True}
+
+        assert validator.validate(frontmatter) == [
+            "coordinates.lat: 152.5 außerhalb von [-90, 90]",
+            "coordinates.lng: erwartet number, ist bool",
+        ]
+
+    def test_unsupported_schema(self):
+        with pytest.raises(SchemaError):
+            EventValidator({"type": "object", "patternProperties": {}})
+        with pytest.raises(SchemaError):
+            EventValidator({"type": "text"})
+
+    def test_parallel_matches_serial(self, tmp_path):
+        manager = EventManager(events_dir=tmp_path)
+        for i in range(6):
+            event = {"title": f"Event {i}"} if i % 2 else {"title": ""}
+            manager.save_event(event, tmp_path / f"event-{i}.json")
+        paths = manager.list_events()
+
+        serial = list(validate_files(tmp_path, paths))
+        parallel = list(validate_files(tmp_path, paths, workers=2, chunksize=2))
+
+        assert parallel == serial
+        assert sum(1 for _, errors in serial if errors) == 3
+
+
+class TestValidateCommand:
+    """Test the validate CLI command."""
+
+    def test_reports_per_file_errors(self, tmp_path, frontmatter, capsys):
+        manager = EventManager(events_dir=tmp_path)
+        manager.save_event(
+            dict(frontmatter, content="Text\n", import_date="2025-11-21"),
+            tmp_path / "good.md",
+        )
+        manager.save_event({"title": "Entwurf", "price": 15}, tmp_path / "draft.json")
+        manager.save_event({"title": "Kaputt"}, tmp_path / "bad.md")
+        (tmp_path / "broken.json").write_text("{kaputt", encoding="utf-8")
+
+        cli = EventScraperCLI()
+        cli.manager = manager
+        result = cli.run(["validate", "--format", "json"])
+
+        assert result == 1
+        report = {
+            entry["file"]: entry["errors"]
+            for entry in json.loads(capsys.readouterr().out)
+        }
+        assert set(report) == {str(tmp_path / "bad.md"), str(tmp_path / "broken.json")}
+        assert "date: Pflichtfeld fehlt" in report[str(tmp_path / "bad.md")]
+        assert report[str(tmp_path / "broken.json")][0].startswith("Nicht lesbar")
+
+    def test_all_valid(self, tmp_path, capsys):
+        manager = EventManager(events_dir=tmp_path)
+        manager.save_event({"title": "Entwurf"}, tmp_path / "draft.json")
+
+        cli = EventScraperCLI()
+        cli.manager = manager
+
+        assert cli.run(["validate"]) == 0
+        assert "1 Events gültig" in capsys.readouterr().out
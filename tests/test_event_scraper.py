@@ -3,6 +3,10 @@ Unit Tests für Event Scraper CLI
 """
 
 import json
+import os
+import stat
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -54,6 +58,83 @@ class TestEventManager:
         loaded = event_manager.load_event(filepath)
         assert loaded == sample_event
 
+    def test_parse_frontmatter_header_only(self, event_manager, tmp_path):
+        """Test frontmatter parsing stops at the closing delimiter line."""
+        filepath = tmp_path / "event.md"
+        filepath.write_text(
+            "---\n"
+            "# --------------------------------\n"
+            "title: Konzert\n"
+            "location:\n"
+            "  city: Hof\n"
+            "---\n\n"
+            "Beschreibung mit --- und: [kaputtem yaml\n",
+            encoding="utf-8",
+        )
+
+        event = event_manager.load_event(filepath)
+        assert event == {"title": "Konzert", "location": {"city": "Hof"}}
+
+    def test_parse_frontmatter_cache(self, event_manager, tmp_path):
+        """Test cached frontmatter is returned as a copy and invalidated on change."""
+        filepath = tmp_path / "event.md"
+        filepath.write_text("---\ntitle: Alt\n---\n", encoding="utf-8")
+
+        first = event_manager.load_event(filepath)
+        first["title"] = "Mutated"
+        assert event_manager.load_event(filepath)["title"] == "Alt"
+
+        filepath.write_text("---\ntitle: Neu und länger\n---\n", encoding="utf-8")
+        assert event_manager.load_event(filepath)["title"] == "Neu und länger"
+
+    def test_save_event_is_atomic(self, event_manager, sample_event, tmp_path):
+        """Test saving leaves no temp files and replaces existing content."""
+        filepath = tmp_path / "event.json"
+        event_manager.save_event({"title": "Alt"}, filepath)
+        event_manager.save_event(sample_event, filepath)
+
+        assert event_manager.load_event(filepath) == sample_event
+        assert [p.name for p in tmp_path.iterdir()] == ["event.json"]
+
+    def test_save_event_keeps_file_mode(self, event_manager, sample_event, tmp_path):
+        """Test replacing an event keeps its permissions."""
+        filepath = tmp_path / "event.json"
+        event_manager.save_event({"title": "Alt"}, filepath)
+        os.chmod(filepath, 0o664)
+
+        event_manager.save_event(sample_event, filepath)
+
+        assert stat.S_IMODE(filepath.stat().st_mode) == 0o664
+
+    def test_save_markdown_keeps_body(self, event_manager, tmp_path):
+        """Test metadata-only saves of markdown events keep the description."""
+        filepath = tmp_path / "event.md"
+        filepath.write_text(
+            "---\ntitle: Konzert\n---\n\nLange Beschreibung.\n", encoding="utf-8"
+        )
+
+        event = event_manager.load_event(filepath)
+        event["status"] = "reviewed"
+        event_manager.save_event(event, filepath)
+
+        assert event_manager.load_event(filepath) == {
+            "title": "Konzert",
+            "status": "reviewed",
+        }
+        assert filepath.read_text(encoding="utf-8").endswith("\nLange Beschreibung.\n")
+
+    def test_save_events_parallel(self, event_manager, sample_event, tmp_path):
+        """Test bounded parallel saving writes every event in order."""
+        items = [
+            (tmp_path / f"event-{i:02d}.json", dict(sample_event, id=i))
+            for i in range(20)
+        ]
+
+        written = list(event_manager.save_events(items, workers=3))
+
+        assert written == [filepath for filepath, _ in items]
+        assert event_manager.load_event(items[7][0])["id"] == 7
+
     def test_list_events(self, event_manager, sample_event, tmp_path):
         """Test listing events."""
         # Create multiple events
@@ -64,6 +145,49 @@ class TestEventManager:
         events = event_manager.list_events()
         assert len(events) == 3
 
+    def test_list_events_sharded(self, event_manager, sample_event, tmp_path):
+        """Test listing finds sharded files and skips shards outside a range."""
+        event_manager.save_event(sample_event, tmp_path / "flat.json")
+        event_manager.save_event(sample_event, tmp_path / "2025" / "12" / "a.json")
+        event_manager.save_event(sample_event, tmp_path / "2026" / "03" / "b.md")
+        event_manager.save_event(sample_event, tmp_path / "2026" / "04" / "c.json")
+
+        names = [p.name for p in event_manager.list_events()]
+        assert sorted(names) == ["a.json", "b.md", "c.json", "flat.json"]
+
+        in_range = event_manager.list_events("2026-03-01", "2026-03-31")
+        assert sorted(p.name for p in in_range) == ["b.md", "flat.json"]
+
+    def test_shard_events(self, event_manager, sample_event, tmp_path):
+        """Test migration moves dated events into YYYY/MM shards."""
+        event_manager.save_event(sample_event, tmp_path / "concert.json")
+        event_manager.save_event({"title": "Ohne Datum"}, tmp_path / "undated.json")
+        assert event_manager.sharded is False
+
+        moved = list(event_manager.shard_events())
+
+        assert moved == [
+            (tmp_path / "concert.json", tmp_path / "2025" / "12" / "concert.json")
+        ]
+        assert (tmp_path / "undated.json").exists()
+        assert event_manager.sharded is True
+        assert event_manager.event_path(sample_event, "new.json") == (
+            tmp_path / "2025" / "12" / "new.json"
+        )
+
+    def test_load_all_parallel(self, event_manager, sample_event, tmp_path):
+        """Test parallel loading yields the same events as serial loading."""
+        for i in range(10):
+            event_manager.save_event(
+                dict(sample_event, id=i), tmp_path / f"event-{i:02d}.json"
+            )
+
+        serial = list(event_manager.load_all())
+        parallel = list(event_manager.load_all(workers=2, chunksize=3))
+
+        assert parallel == serial
+        assert [event["id"] for _, event in parallel] == list(range(10))
+
     def test_compare_identical_events(self, event_manager, sample_event):
         """Test comparing identical events."""
         diff = event_manager.compare_events(sample_event, sample_event)
@@ -86,6 +210,59 @@ class TestEventManager:
         assert diff["modified_fields"]["title"]["old"] == "Test Concert"
         assert diff["modified_fields"]["title"]["new"] == "Test Concert - Updated"
 
+    def test_compare_nested_events(self, event_manager):
+        """Test nested frontmatter fields are diffed with dotted paths."""
+        old = {
+            "title": "Konzert",
+            "location": {"name": "Kulturzentrum", "address": "Kulturstraße 42"},
+            "coordinates": {"lat": 52.52, "lng": 13.405},
+            "categories": ["konzert", "live-musik"],
+        }
+        new = {
+            "title": "Konzert",
+            "location": {"name": "Kulturzentrum", "address": "Kulturstraße 43"},
+            "coordinates": {"lat": 52.52, "lng": 13.405, "zoom": 15},
+            "categories": ["konzert", "indie-rock"],
+        }
+
+        diff = event_manager.compare_events(old, new)
+
+        assert diff["identical"] is False
+        assert diff["added_fields"] == ["coordinates.zoom"]
+        assert diff["modified_fields"]["location.address"] == {
+            "old": "Kulturstraße 42",
+            "new": "Kulturstraße 43",
+        }
+        assert diff["modified_fields"]["categories"]["added"] == ["indie-rock"]
+        assert diff["modified_fields"]["categories"]["removed"] == ["live-musik"]
+        assert "location" not in diff["modified_fields"]
+        assert sorted(diff["unchanged_fields"]) == ["title"]
+
+    def test_compare_manifests(self, event_manager, sample_event, tmp_path):
+        """Test manifest comparison pairs events by id across formats."""
+        old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+        old = EventManager(events_dir=old_dir)
+        new = EventManager(events_dir=new_dir)
+
+        old.save_event(dict(sample_event, id="a"), old_dir / "a.json")
+        old.save_event(dict(sample_event, id="b"), old_dir / "b.json")
+        old.save_event(dict(sample_event, id="c"), old_dir / "c.json")
+        new.save_event(dict(sample_event, id="a"), new_dir / "renamed-a.md")
+        new.save_event(dict(sample_event, id="b", price="99€"), new_dir / "b.json")
+        new.save_event(dict(sample_event, id="d"), new_dir / "d.json")
+
+        result = event_manager.compare_manifests(
+            old.build_manifest(old_dir, old.iter_events()),
+            new.build_manifest(new_dir, new.iter_events()),
+        )
+
+        assert result == {
+            "added": ["d"],
+            "removed": ["c"],
+            "changed": ["b"],
+            "unchanged": 1,
+        }
+
     def test_merge_all_fields(self, event_manager, sample_event, sample_event_updated):
         """Test merging all fields."""
         merged = event_manager.merge_events(sample_event, sample_event_updated)
@@ -110,6 +287,44 @@ class TestEventManager:
         assert merged["title"] == sample_event["title"]
         assert "genre" not in merged
 
+    def test_merge3_applies_non_conflicting_changes(self, event_manager):
+        """Test three-way merge takes one-sided changes from both sides."""
+        base = {"title": "Konzert", "price": "15€", "location": {"city": "Hof"}}
+        ours = dict(base, title="Konzert (redigiert)")
+        theirs = dict(base, price="18€", location={"city": "Hof", "zip": "95028"})
+
+        merged, conflicts = event_manager.merge3_events(base, ours, theirs)
+
+        assert conflicts == {}
+        assert merged["title"] == "Konzert (redigiert)"
+        assert merged["price"] == "18€"
+        assert merged["location"] == {"city": "Hof", "zip": "95028"}
+        assert "last_updated" in merged
+
+    def test_merge3_detects_conflicts(self, event_manager):
+        """Test fields changed on both sides are reported as conflicts."""
+        base = {"title": "Konzert", "location": {"city": "Hof", "address": "A"}}
+        ours = {"title": "Konzert", "location": {"city": "Hof", "address": "B"}}
+        theirs = {"title": "Konzert", "location": {"city": "Hof", "address": "C"}}
+
+        merged, conflicts = event_manager.merge3_events(base, ours, theirs)
+        assert conflicts == {
+            "location.address": {"base": "A", "ours": "B", "theirs": "C"}
+        }
+        assert merged["location"]["address"] == "B"
+
+        merged, _ = event_manager.merge3_events(base, ours, theirs, prefer="theirs")
+        assert merged["location"]["address"] == "C"
+
+    def test_merge3_deletion(self, event_manager):
+        """Test a field removed upstream is removed if we did not touch it."""
+        base = {"title": "Konzert", "genre": "Rock"}
+        merged, conflicts = event_manager.merge3_events(
+            base, dict(base), {"title": "Konzert"}
+        )
+        assert conflicts == {}
+        assert "genre" not in merged
+
     def test_generate_test_event_concert(self, event_manager):
         """Test generating concert test event."""
         event = event_manager.generate_test_event("concert")
@@ -172,6 +387,24 @@ class TestCLI:
         json_files = list(tmp_path.glob("*.json"))
         assert len(json_files) == 3
 
+    def test_cli_list_ndjson(self, tmp_path, sample_event, capsys):
+        """Test NDJSON listing emits one record per event with selected fields."""
+        from cli.event_scraper import EventScraperCLI
+
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path)
+        cli.manager.save_event(sample_event, tmp_path / "a.json")
+        cli.manager.save_event(dict(sample_event, title="Zweites"), tmp_path / "b.json")
+
+        result = cli.run(["list", "--format", "ndjson", "--fields", "title,price"])
+
+        assert result == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"path": str(tmp_path / "a.json"), "title": "Test Concert", "price": "15€"},
+            {"path": str(tmp_path / "b.json"), "title": "Zweites", "price": "15€"},
+        ]
+
     def test_cli_diff_identical(self, tmp_path, sample_event, capsys):
         """Test CLI diff with identical events."""
         from cli.event_scraper import EventScraperCLI
@@ -192,6 +425,145 @@ class TestCLI:
         captured = capsys.readouterr()
         assert "identisch" in captured.out
 
+    def test_cli_diff_dir(self, tmp_path, sample_event, capsys):
+        """Test CLI diff of two event directories."""
+        from cli.event_scraper import EventScraperCLI
+
+        old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+        manager = EventManager(events_dir=old_dir)
+        manager.save_event(dict(sample_event, id="a"), old_dir / "a.json")
+        manager.save_event(dict(sample_event, id="a", price="20€"), new_dir / "a.json")
+
+        cli = EventScraperCLI()
+        result = cli.run(
+            ["diff", "--dir", str(old_dir), str(new_dir), "--format", "json"]
+        )
+
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["changed"]["a"]["modified_fields"] == {
+            "price": {"old": "15€", "new": "20€"}
+        }
+
+    def test_cli_diff_dir_markdown_body(self, tmp_path, sample_event, capsys):
+        """Test a body-only edit of a markdown event counts as a change."""
+        from cli.event_scraper import EventScraperCLI
+
+        old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+        manager = EventManager(events_dir=old_dir)
+        event = dict(sample_event, id="a")
+        manager.save_event(dict(event, content="Alt\n"), old_dir / "a.md")
+        manager.save_event(dict(event, content="Neu\n"), new_dir / "a.md")
+
+        cli = EventScraperCLI()
+        result = cli.run(
+            ["diff", "--dir", str(old_dir), str(new_dir), "--format", "json"]
+        )
+
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["changed"]["a"]["modified_fields"] == {
+            "content": {"old": "Alt\n", "new": "Neu\n"}
+        }
+
+    def test_cli_merge3_dir(self, tmp_path, sample_event, capsys):
+        """Test batch three-way merge pairs events by id across directories."""
+        from cli.event_scraper import EventScraperCLI
+
+        base_dir, ours_dir, theirs_dir = (tmp_path / d for d in ("base", "ours", "new"))
+        manager = EventManager(events_dir=base_dir)
+        for i in range(3):
+            event = dict(sample_event, id=f"e{i}")
+            manager.save_event(event, base_dir / f"e{i}.json")
+            manager.save_event(event, ours_dir / f"e{i}.json")
+            manager.save_event(event, theirs_dir / f"scrape-{i}.json")
+
+        # Our edit + upstream price change, and one upstream-only new event
+        manager.save_event(
+            dict(sample_event, id="e0", title="Redigiert"), ours_dir / "e0.json"
+        )
+        manager.save_event(
+            dict(sample_event, id="e0", price="18€"), theirs_dir / "scrape-0.json"
+        )
+        manager.save_event(dict(sample_event, id="e9"), theirs_dir / "scrape-9.json")
+        untouched_mtime = (ours_dir / "e1.json").stat().st_mtime_ns
+
+        cli = EventScraperCLI()
+        result = cli.run(
+            ["merge3", "--dir", str(base_dir), str(ours_dir), str(theirs_dir)]
+        )
+
+        assert result == 0
+        merged = manager.load_event(ours_dir / "e0.json")
+        assert merged["title"] == "Redigiert"
+        assert merged["price"] == "18€"
+        assert (ours_dir / "scrape-9.json").exists()
+        assert (ours_dir / "e1.json").stat().st_mtime_ns == untouched_mtime
+        assert "Gemerged: 1, Neu: 1, Unverändert: 2" in capsys.readouterr().out
+
+    def test_cli_merge3_dir_markdown(self, tmp_path, sample_event, capsys):
+        """Test merge3 --dir carries markdown bodies from upstream."""
+        from cli.event_scraper import EventScraperCLI
+
+        base_dir, ours_dir, theirs_dir = (tmp_path / d for d in ("base", "ours", "new"))
+        manager = EventManager(events_dir=base_dir)
+        event = dict(sample_event, id="e0", content="Alt\n")
+        for root in (base_dir, ours_dir, theirs_dir):
+            manager.save_event(event, root / "e0.md")
+        # Upstream body edit and a new upstream event with a body
+        manager.save_event(dict(event, content="Neu\n"), theirs_dir / "e0.md")
+        new_event = dict(sample_event, id="e9", content="## Programm\n\nText\n")
+        manager.save_event(new_event, theirs_dir / "e9.md")
+
+        cli = EventScraperCLI()
+        result = cli.run(
+            ["merge3", "--dir", str(base_dir), str(ours_dir), str(theirs_dir)]
+        )
+
+        assert result == 0
+        assert manager.read_content(ours_dir / "e0.md") == "Neu\n"
+        assert manager.load_document(ours_dir / "e9.md") == new_event
+        assert "Gemerged: 1, Neu: 1, Unverändert: 0" in capsys.readouterr().out
+
+    def _merge3_deleted(self, tmp_path, sample_event, theirs_event, *options):
+        """Run merge3 --dir on an event deleted in ours but present in theirs."""
+        from cli.event_scraper import EventScraperCLI
+
+        base_dir, ours_dir, theirs_dir = (tmp_path / d for d in ("base", "ours", "new"))
+        manager = EventManager(events_dir=base_dir)
+        manager.save_event(dict(sample_event, id="x"), base_dir / "x.json")
+        manager.save_event(theirs_event, theirs_dir / "x.json")
+        ours_dir.mkdir(exist_ok=True)
+
+        cli = EventScraperCLI()
+        args = ["merge3", "--dir", str(base_dir), str(ours_dir), str(theirs_dir)]
+        assert cli.run(args + list(options)) == 0
+        return ours_dir / "x.json"
+
+    def test_cli_merge3_dir_keeps_deletion(self, tmp_path, sample_event, capsys):
+        """An event we deleted stays deleted if upstream did not change it."""
+        path = self._merge3_deleted(tmp_path, sample_event, dict(sample_event, id="x"))
+
+        assert not path.exists()
+        assert "Neu: 0, Unverändert: 0, Gelöscht: 1" in capsys.readouterr().out
+
+    def test_cli_merge3_dir_delete_modify_conflict(
+        self, tmp_path, sample_event, capsys
+    ):
+        """An event we deleted but upstream changed is a conflict."""
+        changed = dict(sample_event, id="x", price="18€")
+        path = self._merge3_deleted(tmp_path, sample_event, changed)
+
+        assert not path.exists()
+        output = capsys.readouterr().out
+        assert "lokal gelöscht, upstream geändert" in output
+        assert "Neu: 0, Unverändert: 0, Gelöscht: 1, Mit Konflikten: 1" in output
+
+        path = self._merge3_deleted(
+            tmp_path, sample_event, changed, "--prefer", "theirs"
+        )
+        assert EventManager(events_dir=path.parent).load_event(path) == changed
+
     def test_cli_merge(self, tmp_path, sample_event, sample_event_updated):
         """Test CLI merge command."""
         from cli.event_scraper import EventScraperCLI
@@ -230,6 +602,62 @@ class TestCLI:
         assert merged["price"] == sample_event_updated["price"]
         assert merged["title"] == sample_event["title"]
 
+    def test_cli_bulk_skips_unchanged(self, tmp_path, sample_event, capsys):
+        """Test bulk --set-field does not rewrite events that already match."""
+        from cli.event_scraper import EventScraperCLI
+
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path)
+        cli.manager.save_event(dict(sample_event, status="draft"), tmp_path / "a.json")
+        cli.manager.save_event(
+            dict(sample_event, status="reviewed"), tmp_path / "b.json"
+        )
+        mtime = (tmp_path / "b.json").stat().st_mtime_ns
+
+        result = cli.run(["bulk", "--set-field", "status", "reviewed"])
+
+        assert result == 0
+        assert (tmp_path / "b.json").stat().st_mtime_ns == mtime
+        assert cli.manager.load_event(tmp_path / "a.json")["status"] == "reviewed"
+        captured = capsys.readouterr()
+        assert "Geändert: 1 Events" in captured.out
+
+    def test_cli_import_profile(self, tmp_path, capsys):
+        """Test --import-profile reports per-module import times."""
+        from cli.event_scraper import EventScraperCLI
+
+        cli = EventScraperCLI()
+        argv = ["list", "--format", "json", "--fields", "title"]
+        result = cli.run(["--import-profile"] + argv)
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Import-Zeit" in captured.out
+        assert "kumuliert" in captured.out
+
+        # The CLI lists only the slowest modules; argparse is in the full list
+        assert cli._import_profile(argv, top=None) == 0
+        assert "argparse" in capsys.readouterr().out
+
+
+class TestLazyImports:
+    """Test that cheap commands do not pay for heavy dependencies."""
+
+    def test_heavy_modules_not_imported(self):
+        code = (
+            "import sys, cli.event_scraper, cli.scrapers; "
+            "print(sorted({'requests', 'bs4', 'concurrent.futures.process'} "
+            "& set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,76 @@
+"""
+Unit Tests für Profiling und Phasen-Timings
+"""
+
+import json
+
+from cli import event_timings
+from cli.event_scraper import EventManager, EventScraperCLI
+
+
+class TestPhaseTimer:
+    """Test phase accounting."""
+
+    def test_phases_only_measured_while_active(self):
+        with event_timings.phase("load"):
+            pass
+
+        timer = event_timings.start()
+        try:
+            with event_timings.phase("parse"):
+                pass
+            with event_timings.phase("parse"):
+                pass
+        finally:
+            assert event_timings.stop() is timer
+
+        report = timer.report(command="list")
+        assert report["command"] == "list"
+        assert list(report["phases"]) == ["parse"]
+        assert report["phases"]["parse"]["calls"] == 2
+        assert report["peak_rss_mb"] > 0
+
+
+class TestInstrumentedCLI:
+    """Test --timings and --profile."""
+
+    def _cli(self, tmp_path):
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path / "_events")
+        for i in range(3):
+            cli.manager.save_event(
+                {"title": f"Event {i}", "status": "draft"},
+                cli.manager.events_dir / f"event-{i}.json",
+            )
+        return cli
+
+    def test_timings_report(self, tmp_path, capsys):
+        cli = self._cli(tmp_path)
+        target = tmp_path / "timings.json"
+
+        result = cli.run(
+            ["--timings", str(target), "bulk", "--set-field", "status", "reviewed"]
+        )
+
+        assert result == 0
+        report = json.loads(target.read_text())
+        assert report["command"] == "bulk"
+        assert {"load", "parse", "write"} <= set(report["phases"])
+        assert report["phases"]["write"]["calls"] == 3
+
+    def test_profile_dump(self, tmp_path, capsys):
+        import pstats
+
+        cli = self._cli(tmp_path)
+        target = tmp_path / "profile.pstats"
+
+        assert cli.run(["--profile", str(target), "list"]) == 0
+        assert "cmd_list" in str(pstats.Stats(str(target)).stats)
+
+    def test_optional_value_flag_before_command(self, tmp_path, capsys):
+        """`--timings list` must not read 'list' as the output path."""
+        cli = self._cli(tmp_path)
+
+        assert cli.run(["--timings", "list", "--format", "json"]) == 0
+        captured = capsys.readouterr()
+        assert json.loads(captured.err)["command"] == "list"
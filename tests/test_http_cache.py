@@ -0,0 +1,60 @@
+"""
+Unit Tests für den HTTP-Response-Cache
+"""
+
+import requests
+
+from cli.scrapers.http_cache import HttpCache
+
+
+def _response(body, **headers):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(headers)
+    return response
+
+
+class TestHttpCache:
+    """Test storage, validators and LRU eviction."""
+
+    def test_store_and_conditional_headers(self, tmp_path):
+        cache = HttpCache(tmp_path / "http.sqlite")
+        response = _response(
+            "<p>Programm</p>",
+            ETag='"abc"',
+            **{"Last-Modified": "Sat, 17 Oct 2026 08:00:00 GMT"},
+        )
+
+        assert cache.store("https://venue.example/", response)
+        page = cache.get("https://venue.example/")
+
+        assert page.text == "<p>Programm</p>"
+        assert cache.conditional_headers(page) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 17 Oct 2026 08:00:00 GMT",
+        }
+
+    def test_skips_unvalidated_and_no_store(self, tmp_path):
+        cache = HttpCache(tmp_path / "http.sqlite")
+
+        assert not cache.store("https://a.example/", _response("x"))
+        assert not cache.store(
+            "https://b.example/",
+            _response("x", ETag='"1"', **{"Cache-Control": "no-store"}),
+        )
+        assert cache.stats() == {"pages": 0, "bytes": 0}
+
+    def test_lru_eviction(self, tmp_path):
+        cache = HttpCache(tmp_path / "http.sqlite", max_bytes=250)
+        for name in ("a", "b"):
+            cache.store(f"https://{name}.example/", _response(name * 100, ETag='"1"'))
+
+        # Revalidating a keeps it, so b is the least recently used page
+        cache.revalidated("https://a.example/", _response("", ETag='"2"'))
+        cache.store("https://c.example/", _response("c" * 100, ETag='"1"'))
+
+        assert cache.get("https://b.example/") is None
+        assert cache.get("https://a.example/").etag == '"2"'
+        assert cache.stats() == {"pages": 2, "bytes": 200}
@@ -0,0 +1,226 @@
+"""
+Unit Tests für BaseScraper (HTTP-Schicht)
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cli.scrapers.base import BaseScraper
+from cli.scrapers.example_venue import ExampleVenueScraper
+from cli.scrapers.http_cache import HttpCache
+from cli.scrapers.throttle import HostRateLimiter, RetryPolicy
+
+DELAY = 0.2
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve /page/N after a fixed delay and track concurrent requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.requests.append(self.path)
+        try:
+            if self.path == "/etag":
+                return self._etag()
+            if self.path == "/flaky" and server.requests.count("/flaky") == 1:
+                return self._send(503, "busy", {"Retry-After": "0"})
+            time.sleep(DELAY)
+            status = 404 if self.path == "/missing" else 200
+            self._send(status, f"<html><body>{self.path}</body></html>")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _etag(self):
+        """Page with a validator; answers 304 to a matching If-None-Match."""
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, "<html><body>Grüße</body></html>", {"ETag": '"v1"'})
+
+    def _send(self, status, text, headers=None):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.active = httpd.peak = 0
+    httpd.requests = []
+    httpd.not_modified = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class _Scraper(BaseScraper):
+    rate_limiter = HostRateLimiter(rate=None)
+    retry = RetryPolicy(backoff=0.01)
+
+    def __init__(self, base_url):
+        super().__init__(base_url=base_url, venue_name="Test Venue")
+
+    def scrape(self):
+        return []
+
+
+def _url(server, path):
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+class TestAsyncFetch:
+    """Test afetch_page/afetch_many."""
+
+    def test_fetch_many_runs_concurrently(self, server):
+        scraper = _Scraper(_url(server, ""))
+        urls = [_url(server, f"/page/{i}") for i in range(8)]
+
+        started = time.perf_counter()
+        pages = scraper.fetch_many(urls)
+        elapsed = time.perf_counter() - started
+
+        assert pages == [f"<html><body>/page/{i}</body></html>" for i in range(8)]
+        # Sequential would take 8 * DELAY; with 4 per host it is two rounds
+        assert elapsed < 8 * DELAY * 0.75
+        assert server.peak <= scraper.max_per_host
+
+    def test_per_host_limit(self, server):
+        scraper = _Scraper(_url(server, ""))
+        scraper.max_per_host = 2
+
+        scraper.fetch_many([_url(server, f"/page/{i}") for i in range(6)])
+
+        assert server.peak == 2
+
+    def test_errors_yield_none(self, server, capsys):
+        scraper = _Scraper(_url(server, ""))
+
+        pages = scraper.fetch_many([_url(server, "/missing"), _url(server, "/ok")])
+
+        assert pages[0] is None
+        assert pages[1] is not None
+        assert "Error fetching" in capsys.readouterr().out
+
+
+class TestCachedFetch:
+    """Test fetch_page with a persistent cache."""
+
+    def test_revalidates_with_etag(self, server, tmp_path):
+        scraper = _Scraper(_url(server, ""))
+        scraper.cache = HttpCache(tmp_path / "http.sqlite")
+
+        first = scraper.fetch_page(_url(server, "/etag"))
+        again = _Scraper(_url(server, ""))
+        again.cache = HttpCache(tmp_path / "http.sqlite")
+        second = again.fetch_page(_url(server, "/etag"))
+
+        assert first == second == "<html><body>Grüße</body></html>"
+        assert server.requests == ["/etag", "/etag"]
+        assert server.not_modified == 1
+        assert again.cache.stats()["pages"] == 1
+
+    def test_pages_without_validators_are_not_cached(self, server, tmp_path):
+        scraper = _Scraper(_url(server, ""))
+        scraper.cache = HttpCache(tmp_path / "http.sqlite")
+
+        scraper.fetch_page(_url(server, "/page/1"))
+
+        assert scraper.cache.stats()["pages"] == 0
+
+
+class TestRetries:
+    """Test retries in fetch_page."""
+
+    def test_retries_server_errors(self, server):
+        scraper = _Scraper(_url(server, ""))
+
+        assert scraper.fetch_page(_url(server, "/flaky")) is not None
+        assert server.requests == ["/flaky", "/flaky"]
+
+    def test_gives_up_after_retries(self, server):
+        scraper = _Scraper(_url(server, ""))
+        scraper.retry = RetryPolicy(retries=0)
+
+        assert scraper.fetch_page(_url(server, "/flaky")) is None
+        assert server.requests == ["/flaky"]
+
+
+PAGE = """
+<html><head><script>var tracking = 1;</script></head><body>
+<nav><a href="/">Start</a><div class="teaser">Kein Event</div></nav>
+<main>
+  <div class="event featured">
+    <h2 class="event-title">Punk-Abend</h2>
+    <span class="event-date">14.03.2026</span>
+    <a class="event-link" href="https://example.com/punk">Info</a>
+  </div>
+  <div class="event">
+    <h2 class="event-title">Lesung</h2>
+    <span class="event-date">2026-03-20</span>
+  </div>
+</main>
+</body></html>
+"""
+
+
+class TestParseContainers:
+    """Test targeted parsing of event containers."""
+
+    def test_only_containers_are_built(self):
+        scraper = _Scraper("https://example.com")
+
+        containers = scraper.parse_containers(PAGE, "div.event")
+
+        assert [c.find("h2").get_text() for c in containers] == ["Punk-Abend", "Lesung"]
+        soup = scraper.parse_html(PAGE, "div.event")
+        assert soup.find("nav") is None
+        assert soup.find("script") is None
+
+    def test_selector_forms(self):
+        scraper = _Scraper("https://example.com")
+
+        assert len(scraper.parse_containers(PAGE, ".event")) == 2
+        assert len(scraper.parse_containers(PAGE, "h2")) == 2
+        assert len(scraper.parse_containers(PAGE, "div.teaser")) == 1
+        with pytest.raises(ValueError):
+            scraper.parse_containers(PAGE, "main > div.event")
+        with pytest.raises(ValueError):
+            scraper.parse_containers(PAGE)  # no container_selector declared
+
+    def test_example_venue_scraper(self):
+        scraper = ExampleVenueScraper()
+        scraper.fetch_page = lambda url: PAGE
+
+        events = scraper.scrape()
+
+        assert [(e["title"], e["date"]) for e in events] == [
+            ("Punk-Abend", "2026-03-14"),
+            ("Lesung", "2026-03-20"),
+        ]
+        assert events[0]["url"] == "https://example.com/punk"
@@ -0,0 +1,131 @@
+"""
+Unit Tests für Scraper-Registry und parallelen Scrape-Runner
+"""
+
+import time
+
+from cli.event_scraper import EventManager, EventScraperCLI
+from cli.scrapers.base import BaseScraper
+from cli.scrapers.registry import discover, run_scrapers
+
+
+class FastScraper(BaseScraper):
+    base_url = "https://fast.example"
+    venue_name = "Fast Venue"
+
+    def scrape(self):
+        print("lade Programm")
+        return [
+            self.normalize_event({"title": "Konzert", "date": "2026-04-01"}),
+        ]
+
+
+class SlowScraper(BaseScraper):
+    venue_name = "Slow Venue"
+
+    def scrape(self):
+        time.sleep(30)
+        return []
+
+
+class BrokenScraper(BaseScraper):
+    venue_name = "Broken Venue"
+
+    def scrape(self):
+        raise RuntimeError("Seite geändert")
+
+
+REGISTRY = {"fast": FastScraper, "slow": SlowScraper, "broken": BrokenScraper}
+
+
+class TestDiscover:
+    """Test scraper discovery."""
+
+    def test_finds_venue_scrapers(self):
+        scrapers = discover()
+
+        assert {
+            "example_venue",
+            "galeriehaus_hof_facebook",
+            "punk_im_hof_instagram",
+        } <= set(scrapers)
+        assert "base" not in scrapers
+        assert not scrapers["example_venue"].enabled
+        assert scrapers["punk_im_hof_instagram"].venue_name == "Punk im Hof"
+
+
+class TestRunScrapers:
+    """Test concurrent runs with timeouts."""
+
+    def test_results_errors_and_timeouts(self):
+        started = time.perf_counter()
+        results = {
+            result.name: result
+            for result in run_scrapers(
+                ["slow", "fast", "broken"], jobs=3, timeout=2, registry=REGISTRY
+            )
+        }
+
+        assert time.perf_counter() - started < 10
+        assert results["fast"].error is None
+        assert results["fast"].venue == "Fast Venue"
+        assert results["fast"].events[0]["title"] == "Konzert"
+        assert results["fast"].log == "lade Programm\n"
+        assert "Seite geändert" in results["broken"].error
+        assert results["slow"].error.startswith("Timeout")
+
+
+class TestScrapeCommand:
+    """Test the scrape subcommand."""
+
+    def test_list(self, capsys):
+        assert EventScraperCLI().run(["scrape", "--list"]) == 0
+        assert "punk_im_hof_instagram" in capsys.readouterr().out
+
+    def test_unknown_venue(self, capsys):
+        assert EventScraperCLI().run(["scrape", "--venue", "gibtsnicht"]) == 1
+        assert "Unbekannter Scraper" in capsys.readouterr().err
+
+    def test_url_selects_scraper(self):
+        names = EventScraperCLI._scrapers_for_url(
+            REGISTRY, "https://www.fast.example/programm"
+        )
+
+        assert names == ["fast"]
+
+    def test_save_drafts(self, tmp_path, capsys):
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path)
+        event = FastScraper().scrape()[0]
+
+        cli._save_drafts([event])
+        cli._save_drafts([event])
+
+        assert [p.name for p in tmp_path.iterdir()] == ["2026-04-01-konzert.json"]
+        assert "1 bereits vorhanden" in capsys.readouterr().out
+
+    def test_compare_with_existing_event(self, tmp_path, capsys):
+        cli = EventScraperCLI()
+        cli.manager = EventManager(events_dir=tmp_path)
+        existing = tmp_path / "konzert.json"
+        cli.manager.save_event(
+            {"title": "Konzert!", "date": "2026-04-01 20:00", "price": "10€"}, existing
+        )
+        scraped = FastScraper().scrape() + [
+            {"title": "Lesung", "date": "2026-04-01"},
+        ]
+
+        assert cli._compare_scraped(scraped, existing) is scraped[0]
+        output = capsys.readouterr().out
+        assert "Vergleich mit konzert.json" in output
+        assert "Alt: 10€" in output
+
+        cli.manager.save_event({"title": "Konzert", "date": "2026-05-01"}, existing)
+        assert cli._compare_scraped(scraped, existing) is None
+        assert "Kein passendes Event" in capsys.readouterr().out
+
+    def test_compare_requires_readable_event(self, tmp_path, capsys):
+        args = ["scrape", "--all", "--compare", str(tmp_path / "fehlt.json")]
+
+        assert EventScraperCLI().run(args) == 1
+        assert "Konnte Event-Datei nicht laden" in capsys.readouterr().err
@@ -0,0 +1,75 @@
+"""
+Unit Tests für Rate Limiting und Retry-Policy
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from cli.scrapers.throttle import HostRateLimiter, RetryPolicy, TokenBucket
+
+
+def _response(status, **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    return response
+
+
+class TestTokenBucket:
+    """Test reservations and blocking."""
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+    def test_block(self):
+        bucket = TokenBucket(rate=100, burst=5)
+        bucket.block(2)
+
+        assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+
+class TestHostRateLimiter:
+    """Test per-host buckets."""
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter(rate=1, burst=1)
+
+        assert limiter.bucket("https://a.example/x").reserve() == 0.0
+        assert limiter.bucket("https://B.example/y").reserve() == 0.0
+        assert limiter.bucket("https://a.example/z").reserve() > 0.5
+
+    def test_unlimited(self):
+        assert HostRateLimiter(rate=None).bucket("https://a.example/") is None
+
+
+class TestRetryPolicy:
+    """Test backoff delays."""
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(retries=3, backoff=0.5)
+
+        assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, None]
+
+    def test_only_retryable_statuses(self):
+        policy = RetryPolicy()
+
+        assert policy.delay(0, _response(404)) is None
+        assert policy.delay(0, _response(503)) == 0.5
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_delay=60)
+
+        assert policy.delay(0, _response(429, **{"Retry-After": "7"})) == 7
+        assert policy.delay(0, _response(429, **{"Retry-After": "3600"})) is None
+        date = formatdate(time.time() + 30, usegmt=True)
+        assert policy.delay(0, _response(503, **{"Retry-After": date})) == (
+            pytest.approx(30, abs=2)
+        )